@@ -0,0 +1,9 @@
+/** @type {import('jest').Config} */
+module.exports = {
+  testEnvironment: 'node',
+  roots: ['<rootDir>/src'],
+  transform: {
+    // Transpile only; `tsc` does the type checking
+    '^.+\\.ts$': '<rootDir>/jest.transform.js',
+  },
+}
@@ -0,0 +1,18 @@
+// Transpile-only TypeScript for jest, with the compiler the API already builds
+// with, so tests need no transformer package of their own
+const ts = require('typescript')
+
+module.exports = {
+  process(sourceText, sourcePath) {
+    const { outputText, sourceMapText } = ts.transpileModule(sourceText, {
+      fileName: sourcePath,
+      compilerOptions: {
+        module: ts.ModuleKind.CommonJS,
+        target: ts.ScriptTarget.ES2020,
+        esModuleInterop: true,
+        sourceMap: true,
+      },
+    })
+    return { code: outputText, map: sourceMapText }
+  },
+}
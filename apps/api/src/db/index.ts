@@ -9,6 +9,7 @@ const queryClient = postgres(config.database.url, {
   max: 3, // Limit connections to avoid exhausting Supabase pool
   idle_timeout: 20, // Close idle connections after 20 seconds
   connect_timeout: 10, // Connection timeout in seconds
+  prepare: true, // Prepare each distinct query text once per connection (see ./prepared.ts)
 })
 
 // Create drizzle instance
@@ -0,0 +1,113 @@
+-- Migration: Open balance from invoice payment status
+-- Created: 2025-12-02
+-- Description: account_invoice_summary.open_balance summed each outstanding
+-- invoice's total_amount, so partial payments recorded in
+-- invoice_payment_status never reduced it. An invoice now contributes
+-- coalesce(balance, total_amount), the same fallback the invoice lists use.
+-- The summary is recomputed per affected account from both orders and
+-- invoice_payment_status triggers. Deltas can't be kept exact here: deleting
+-- an order cascades to its payment status row before the orders trigger
+-- runs, so the balance being removed is no longer readable.
+
+-- Outstanding invoices per side of the invoice, so a recompute reads only
+-- the handful still open rather than the account's whole history
+CREATE INDEX IF NOT EXISTS "orders_invoice_seller_outstanding_idx" ON "orders" ("seller_id")
+  WHERE "qbo_doc_type" = 'invoice' AND "status" NOT IN ('paid', 'cancelled');
+
+CREATE INDEX IF NOT EXISTS "orders_invoice_buyer_outstanding_idx" ON "orders" ("buyer_id")
+  WHERE "qbo_doc_type" = 'invoice' AND "status" NOT IN ('paid', 'cancelled');
+
+CREATE OR REPLACE FUNCTION account_invoice_summary_refresh(p_account_id uuid)
+RETURNS void AS $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM "accounts" WHERE "id" = p_account_id) THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO "account_invoice_summary" ("account_id", "outstanding_count", "open_balance", "updated_at")
+  SELECT p_account_id, count(*), coalesce(sum(coalesce(ips."balance", o."total_amount")), 0), now()
+  FROM "orders" o
+  LEFT JOIN "invoice_payment_status" ips ON ips."order_id" = o."id"
+  WHERE o."qbo_doc_type" = 'invoice' AND o."status" NOT IN ('paid', 'cancelled')
+    AND (o."seller_id" = p_account_id OR o."buyer_id" = p_account_id)
+  ON CONFLICT ("account_id") DO UPDATE SET
+    "outstanding_count" = EXCLUDED."outstanding_count",
+    "open_balance" = EXCLUDED."open_balance",
+    "updated_at" = now();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION orders_invoice_summary() RETURNS trigger AS $$
+DECLARE
+  v_accounts uuid[] := '{}';
+  v_account_id uuid;
+BEGIN
+  -- Every account on either side of the old and the new row
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD."qbo_doc_type" = 'invoice' THEN
+    v_accounts := v_accounts || OLD."seller_id" || OLD."buyer_id";
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW."qbo_doc_type" = 'invoice' THEN
+    v_accounts := v_accounts || NEW."seller_id" || NEW."buyer_id";
+  END IF;
+
+  FOR v_account_id IN SELECT DISTINCT unnest(v_accounts) LOOP
+    PERFORM account_invoice_summary_refresh(v_account_id);
+  END LOOP;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION invoice_payment_status_summary() RETURNS trigger AS $$
+DECLARE
+  v_orders uuid[] := '{}';
+  v_account_id uuid;
+BEGIN
+  IF TG_OP = 'UPDATE' AND OLD."order_id" = NEW."order_id" AND OLD."balance" IS NOT DISTINCT FROM NEW."balance" THEN
+    RETURN NULL;
+  END IF;
+
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    v_orders := v_orders || OLD."order_id";
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    v_orders := v_orders || NEW."order_id";
+  END IF;
+
+  -- An order deleted along with its payment status row is no longer found
+  -- here; the orders trigger refreshes its accounts instead
+  FOR v_account_id IN
+    SELECT DISTINCT unnest(ARRAY[o."seller_id", o."buyer_id"])
+    FROM "orders" o
+    WHERE o."id" = ANY(v_orders) AND o."qbo_doc_type" = 'invoice'
+  LOOP
+    PERFORM account_invoice_summary_refresh(v_account_id);
+  END LOOP;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "invoice_payment_status_summary" ON "invoice_payment_status";
+CREATE TRIGGER "invoice_payment_status_summary"
+  AFTER INSERT OR DELETE OR UPDATE OF "balance", "order_id"
+  ON "invoice_payment_status"
+  FOR EACH ROW EXECUTE FUNCTION invoice_payment_status_summary();
+
+-- orders_invoice_summary keeps its trigger; it no longer applies deltas
+DROP FUNCTION IF EXISTS account_invoice_summary_add(uuid, integer, numeric);
+
+-- Recompute every summary from the current orders and balances
+DELETE FROM "account_invoice_summary";
+INSERT INTO "account_invoice_summary" ("account_id", "outstanding_count", "open_balance")
+SELECT "account_id", count(*), sum("open_amount")
+FROM (
+  SELECT o."id", o."seller_id" AS "account_id", coalesce(ips."balance", o."total_amount") AS "open_amount"
+  FROM "orders" o LEFT JOIN "invoice_payment_status" ips ON ips."order_id" = o."id"
+  WHERE o."qbo_doc_type" = 'invoice' AND o."status" NOT IN ('paid', 'cancelled')
+  UNION
+  SELECT o."id", o."buyer_id" AS "account_id", coalesce(ips."balance", o."total_amount") AS "open_amount"
+  FROM "orders" o LEFT JOIN "invoice_payment_status" ips ON ips."order_id" = o."id"
+  WHERE o."qbo_doc_type" = 'invoice' AND o."status" NOT IN ('paid', 'cancelled')
+) AS "outstanding"
+GROUP BY "account_id";
@@ -0,0 +1,71 @@
+-- Migration: Per-account outstanding invoice summary
+-- Created: 2025-11-27
+-- Description: Keeps outstanding invoice count and open balance per account in
+-- account_invoice_summary, so the accounts list can show them without scanning
+-- orders. An invoice is an order with qbo_doc_type = 'invoice'; it is
+-- outstanding until its status is 'paid' or 'cancelled'. It counts for both
+-- its seller and its buyer, matching the orders popup. A row trigger on
+-- orders applies +1/-1 deltas, so every write path (API, QuickBooks sync,
+-- scripts) keeps the summary current.
+
+CREATE TABLE IF NOT EXISTS "account_invoice_summary" (
+  "account_id" uuid PRIMARY KEY REFERENCES "accounts"("id") ON DELETE CASCADE,
+  "outstanding_count" integer NOT NULL DEFAULT 0,
+  "open_balance" numeric(14, 2) NOT NULL DEFAULT 0,
+  "updated_at" timestamp NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION account_invoice_summary_add(p_account_id uuid, p_count integer, p_amount numeric)
+RETURNS void AS $$
+BEGIN
+  INSERT INTO "account_invoice_summary" ("account_id", "outstanding_count", "open_balance", "updated_at")
+  VALUES (p_account_id, p_count, p_amount, now())
+  ON CONFLICT ("account_id") DO UPDATE SET
+    "outstanding_count" = "account_invoice_summary"."outstanding_count" + EXCLUDED."outstanding_count",
+    "open_balance" = "account_invoice_summary"."open_balance" + EXCLUDED."open_balance",
+    "updated_at" = now();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION orders_invoice_summary() RETURNS trigger AS $$
+BEGIN
+  -- Take the old row out of the summary...
+  IF TG_OP IN ('UPDATE', 'DELETE')
+     AND OLD."qbo_doc_type" = 'invoice' AND OLD."status" NOT IN ('paid', 'cancelled') THEN
+    PERFORM account_invoice_summary_add(OLD."seller_id", -1, -OLD."total_amount");
+    IF OLD."buyer_id" <> OLD."seller_id" THEN
+      PERFORM account_invoice_summary_add(OLD."buyer_id", -1, -OLD."total_amount");
+    END IF;
+  END IF;
+
+  -- ...and put the new one in
+  IF TG_OP IN ('INSERT', 'UPDATE')
+     AND NEW."qbo_doc_type" = 'invoice' AND NEW."status" NOT IN ('paid', 'cancelled') THEN
+    PERFORM account_invoice_summary_add(NEW."seller_id", 1, NEW."total_amount");
+    IF NEW."buyer_id" <> NEW."seller_id" THEN
+      PERFORM account_invoice_summary_add(NEW."buyer_id", 1, NEW."total_amount");
+    END IF;
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "orders_invoice_summary" ON "orders";
+CREATE TRIGGER "orders_invoice_summary"
+  AFTER INSERT OR DELETE OR UPDATE OF "status", "qbo_doc_type", "total_amount", "seller_id", "buyer_id"
+  ON "orders"
+  FOR EACH ROW EXECUTE FUNCTION orders_invoice_summary();
+
+-- Backfill from the current orders
+DELETE FROM "account_invoice_summary";
+INSERT INTO "account_invoice_summary" ("account_id", "outstanding_count", "open_balance")
+SELECT "account_id", count(*), sum("total_amount")
+FROM (
+  SELECT "id", "seller_id" AS "account_id", "total_amount" FROM "orders"
+  WHERE "qbo_doc_type" = 'invoice' AND "status" NOT IN ('paid', 'cancelled')
+  UNION
+  SELECT "id", "buyer_id" AS "account_id", "total_amount" FROM "orders"
+  WHERE "qbo_doc_type" = 'invoice' AND "status" NOT IN ('paid', 'cancelled')
+) AS "outstanding"
+GROUP BY "account_id";
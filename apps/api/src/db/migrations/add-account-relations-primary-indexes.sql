@@ -0,0 +1,9 @@
+-- Migration: Primary-first indexes on account contacts and addresses
+-- Created: 2025-11-29
+-- Description: The accounts list loads each account's contacts and addresses
+-- by account_id. With include=primaryContact,primaryAddress it takes only the
+-- primary (else oldest) one per account. These indexes answer both with an
+-- index range scan, and the primary lookup with a single probe.
+
+CREATE INDEX IF NOT EXISTS "contacts_account_primary_idx" ON "contacts" ("account_id", "is_primary" DESC, "created_at");
+CREATE INDEX IF NOT EXISTS "addresses_account_primary_idx" ON "addresses" ("account_id", "is_primary" DESC, "created_at");
@@ -0,0 +1,7 @@
+-- Migration: Composite index for keyset pagination of the accounts list
+-- Created: 2025-11-24
+-- Description: GET /api/accounts?cursor=... pages with WHERE (name, id) > ($name, $id)
+-- ORDER BY name, id. This index turns every page into a single range scan, so
+-- page 200 costs the same as page 1.
+
+CREATE INDEX IF NOT EXISTS "accounts_name_id_idx" ON "accounts" ("name", "id");
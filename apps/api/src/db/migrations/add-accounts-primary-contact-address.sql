@@ -0,0 +1,156 @@
+-- Migration: Denormalized primary contact and address on accounts
+-- Created: 2025-11-30
+-- Description: The accounts grid shows one contact and one address per row:
+-- the primary one, else the oldest. Copy those onto the account row so the
+-- list reads flat columns instead of aggregating contacts and addresses per
+-- account. The grid's search still covers every contact and address, so each
+-- account also carries them as plain text: one line per contact or address,
+-- fields separated by tabs. Triggers on contacts and addresses keep all of it
+-- current for every write path (API, imports, QuickBooks sync, manual SQL).
+
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_contact_id" uuid;
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_contact_name" varchar(255);
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_contact_email" varchar(255);
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_contact_phone" varchar(50);
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_address_id" uuid;
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_address_line1" varchar(255);
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_address_line2" varchar(255);
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_address_city" varchar(100);
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_address_state" varchar(2);
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "primary_address_postal_code" varchar(20);
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "contacts_search_text" text;
+ALTER TABLE "accounts" ADD COLUMN IF NOT EXISTS "addresses_search_text" text;
+
+-- Recompute one account's primary contact (contacts_account_primary_idx makes
+-- this a single index probe). Leaves the columns NULL when it has none.
+CREATE OR REPLACE FUNCTION account_refresh_primary_contact(p_account_id uuid) RETURNS void AS $$
+BEGIN
+  UPDATE "accounts" AS acc
+  SET "primary_contact_id" = c."id",
+      "primary_contact_name" = c."name",
+      "primary_contact_email" = c."email",
+      "primary_contact_phone" = c."phone"
+  FROM (SELECT p_account_id AS "account_id") AS target
+  LEFT JOIN LATERAL (
+    SELECT "id", "name", "email", "phone"
+    FROM "contacts"
+    WHERE "account_id" = target."account_id"
+    ORDER BY "is_primary" DESC, "created_at"
+    LIMIT 1
+  ) AS c ON true
+  WHERE acc."id" = target."account_id"
+    AND (acc."primary_contact_id", acc."primary_contact_name", acc."primary_contact_email", acc."primary_contact_phone")
+      IS DISTINCT FROM (c."id", c."name", c."email", c."phone");
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION account_refresh_primary_address(p_account_id uuid) RETURNS void AS $$
+BEGIN
+  UPDATE "accounts" AS acc
+  SET "primary_address_id" = a."id",
+      "primary_address_line1" = a."line1",
+      "primary_address_line2" = a."line2",
+      "primary_address_city" = a."city",
+      "primary_address_state" = a."state",
+      "primary_address_postal_code" = a."postal_code"
+  FROM (SELECT p_account_id AS "account_id") AS target
+  LEFT JOIN LATERAL (
+    SELECT "id", "line1", "line2", "city", "state", "postal_code"
+    FROM "addresses"
+    WHERE "account_id" = target."account_id"
+    ORDER BY "is_primary" DESC, "created_at"
+    LIMIT 1
+  ) AS a ON true
+  WHERE acc."id" = target."account_id"
+    AND (acc."primary_address_id", acc."primary_address_line1", acc."primary_address_line2",
+         acc."primary_address_city", acc."primary_address_state", acc."primary_address_postal_code")
+      IS DISTINCT FROM (a."id", a."line1", a."line2", a."city", a."state", a."postal_code");
+END;
+$$ LANGUAGE plpgsql;
+
+-- A field of the search text: never NULL, and free of the separators
+CREATE OR REPLACE FUNCTION account_search_field(p_value text) RETURNS text AS $$
+  SELECT translate(coalesce(p_value, ''), E'\t\n\r', '   ')
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Every contact of one account as "name<TAB>email<TAB>phone" lines, primary first
+CREATE OR REPLACE FUNCTION account_refresh_contacts_search(p_account_id uuid) RETURNS void AS $$
+BEGIN
+  UPDATE "accounts" AS acc
+  SET "contacts_search_text" = c."text"
+  FROM (
+    SELECT string_agg(
+      account_search_field("name") || E'\t' || account_search_field("email") || E'\t' || account_search_field("phone"),
+      E'\n' ORDER BY "is_primary" DESC, "created_at"
+    ) AS "text"
+    FROM "contacts"
+    WHERE "account_id" = p_account_id
+  ) AS c
+  WHERE acc."id" = p_account_id
+    AND acc."contacts_search_text" IS DISTINCT FROM c."text";
+END;
+$$ LANGUAGE plpgsql;
+
+-- Every address of one account as "line1<TAB>line2<TAB>city<TAB>state<TAB>postal code" lines
+CREATE OR REPLACE FUNCTION account_refresh_addresses_search(p_account_id uuid) RETURNS void AS $$
+BEGIN
+  UPDATE "accounts" AS acc
+  SET "addresses_search_text" = a."text"
+  FROM (
+    SELECT string_agg(
+      account_search_field("line1") || E'\t' || account_search_field("line2") || E'\t' ||
+      account_search_field("city") || E'\t' || account_search_field("state") || E'\t' ||
+      account_search_field("postal_code"),
+      E'\n' ORDER BY "is_primary" DESC, "created_at"
+    ) AS "text"
+    FROM "addresses"
+    WHERE "account_id" = p_account_id
+  ) AS a
+  WHERE acc."id" = p_account_id
+    AND acc."addresses_search_text" IS DISTINCT FROM a."text";
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION contacts_refresh_account_primary() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM account_refresh_primary_contact(OLD."account_id");
+    PERFORM account_refresh_contacts_search(OLD."account_id");
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND (TG_OP = 'INSERT' OR NEW."account_id" IS DISTINCT FROM OLD."account_id") THEN
+    PERFORM account_refresh_primary_contact(NEW."account_id");
+    PERFORM account_refresh_contacts_search(NEW."account_id");
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION addresses_refresh_account_primary() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM account_refresh_primary_address(OLD."account_id");
+    PERFORM account_refresh_addresses_search(OLD."account_id");
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') AND (TG_OP = 'INSERT' OR NEW."account_id" IS DISTINCT FROM OLD."account_id") THEN
+    PERFORM account_refresh_primary_address(NEW."account_id");
+    PERFORM account_refresh_addresses_search(NEW."account_id");
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS "contacts_account_primary" ON "contacts";
+CREATE TRIGGER "contacts_account_primary"
+  AFTER INSERT OR UPDATE OR DELETE ON "contacts"
+  FOR EACH ROW EXECUTE FUNCTION contacts_refresh_account_primary();
+
+DROP TRIGGER IF EXISTS "addresses_account_primary" ON "addresses";
+CREATE TRIGGER "addresses_account_primary"
+  AFTER INSERT OR UPDATE OR DELETE ON "addresses"
+  FOR EACH ROW EXECUTE FUNCTION addresses_refresh_account_primary();
+
+-- Backfill
+SELECT account_refresh_primary_contact("id") FROM "accounts";
+SELECT account_refresh_primary_address("id") FROM "accounts";
+SELECT account_refresh_contacts_search("id") FROM "accounts";
+SELECT account_refresh_addresses_search("id") FROM "accounts";
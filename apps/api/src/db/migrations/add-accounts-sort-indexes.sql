@@ -0,0 +1,25 @@
+-- Migration: Sort-key indexes for the accounts list
+-- Created: 2025-12-01
+-- Description: GET /api/accounts?cursor=...&sort=<key>&dir=asc|desc pages with
+-- WHERE (key, id) > ($key, $id) ORDER BY key, id (both reversed for desc).
+-- Each index matches its sort expression in accounts.service.ts exactly, so
+-- every page is one range scan in either direction, however many accounts
+-- there are. name uses accounts_name_id_idx from add-accounts-keyset-index.sql.
+
+CREATE INDEX IF NOT EXISTS "accounts_code_id_idx" ON "accounts" ("code", "id");
+
+CREATE INDEX IF NOT EXISTS "accounts_contact_sort_idx" ON "accounts"
+  ((lower(coalesce("primary_contact_name", ''))), "id");
+
+CREATE INDEX IF NOT EXISTS "accounts_email_sort_idx" ON "accounts"
+  ((lower(coalesce("primary_contact_email", ''))), "id");
+
+-- Digits only, so "(555) 010-2000" and "555.010.2000" sort together
+CREATE INDEX IF NOT EXISTS "accounts_phone_sort_idx" ON "accounts"
+  ((regexp_replace(coalesce("primary_contact_phone", ''), '[^0-9]', '', 'g')), "id");
+
+CREATE INDEX IF NOT EXISTS "accounts_location_sort_idx" ON "accounts"
+  ((coalesce("primary_address_city" || ', ' || "primary_address_state", '')), "id");
+
+CREATE INDEX IF NOT EXISTS "accounts_status_sort_idx" ON "accounts"
+  (((case when "active" then 'active' else 'inactive' end)), "id");
@@ -0,0 +1,22 @@
+-- Migration: Trigram and partial indexes for the accounts list column filters
+-- Created: 2025-11-25
+-- Description: GET /api/accounts?cursor=... filters by code, name and address
+-- location with ILIKE '%term%', and by status. B-tree indexes can't serve a
+-- leading wildcard; pg_trgm GIN indexes can.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS "accounts_code_trgm_idx" ON "accounts" USING gin ("code" gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "accounts_name_trgm_idx" ON "accounts" USING gin ("name" gin_trgm_ops);
+
+-- Matches the location filter expression exactly. Every address counts, so
+-- accounts without an is_primary address still match.
+CREATE INDEX IF NOT EXISTS "addresses_location_trgm_idx" ON "addresses"
+  USING gin (("city" || ', ' || "state") gin_trgm_ops);
+
+-- Lookup by account for the EXISTS probe from a filtered page
+CREATE INDEX IF NOT EXISTS "addresses_account_id_idx" ON "addresses" ("account_id");
+
+-- Most lists show active accounts only; keep that slice in (name, id) order
+CREATE INDEX IF NOT EXISTS "accounts_active_name_id_idx" ON "accounts" ("name", "id")
+  WHERE "active" = true;
@@ -0,0 +1,28 @@
+-- Migration: Materialised invoice payment status
+-- Created: 2025-11-28
+-- Description: One row per invoiced order with its QuickBooks total, open
+-- balance and payment status (unpaid, partial, paid, void). The QuickBooks
+-- sync service and webhook handler upsert it as invoices and payments post,
+-- so readers look status up by primary key instead of re-deriving it.
+
+CREATE TABLE IF NOT EXISTS "invoice_payment_status" (
+  "order_id" uuid PRIMARY KEY REFERENCES "orders"("id") ON DELETE CASCADE,
+  "status" varchar(20) NOT NULL DEFAULT 'unpaid',
+  "total_amount" numeric(12, 2) NOT NULL DEFAULT 0,
+  "balance" numeric(12, 2) NOT NULL DEFAULT 0,
+  "paid_at" timestamp,
+  "updated_at" timestamp NOT NULL DEFAULT now()
+);
+
+-- Backfill from order status: QuickBooks partial payments are not known
+-- locally yet, and are picked up on the next invoice or payment webhook.
+INSERT INTO "invoice_payment_status" ("order_id", "status", "total_amount", "balance", "paid_at")
+SELECT
+  "id",
+  CASE "status" WHEN 'paid' THEN 'paid' WHEN 'cancelled' THEN 'void' ELSE 'unpaid' END,
+  "total_amount",
+  CASE WHEN "status" IN ('paid', 'cancelled') THEN 0 ELSE "total_amount" END,
+  CASE WHEN "status" = 'paid' THEN "updated_at" END
+FROM "orders"
+WHERE "qbo_doc_type" = 'invoice'
+ON CONFLICT ("order_id") DO NOTHING;
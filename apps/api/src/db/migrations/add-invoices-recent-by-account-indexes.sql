@@ -0,0 +1,11 @@
+-- Migration: Per-account recent invoice indexes
+-- Created: 2025-11-26
+-- Description: GET /api/invoices/recent reads each account's newest invoices
+-- with a LATERAL subquery per account. These partial indexes let each side of
+-- the invoice (seller or buyer) be read newest-first, stopping after the limit.
+
+CREATE INDEX IF NOT EXISTS "orders_invoice_seller_recent_idx" ON "orders" ("seller_id", "created_at" DESC)
+  WHERE "qbo_doc_type" = 'invoice';
+
+CREATE INDEX IF NOT EXISTS "orders_invoice_buyer_recent_idx" ON "orders" ("buyer_id", "created_at" DESC)
+  WHERE "qbo_doc_type" = 'invoice';
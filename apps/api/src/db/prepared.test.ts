@@ -0,0 +1,22 @@
+import { PreparedStatementCache } from './prepared'
+
+describe('PreparedStatementCache', () => {
+  const statement = () => ({ execute: async () => [] })
+
+  it('builds each shape once', () => {
+    const cache = new PreparedStatementCache()
+    const build = jest.fn(statement)
+    const first = cache.get('a', build)
+    expect(cache.get('a', build)).toBe(first)
+    expect(build).toHaveBeenCalledTimes(1)
+    expect(cache.stats()).toMatchObject({ shapes: 1, hits: 1, misses: 1 })
+  })
+
+  it('drops the oldest shape when full', () => {
+    const cache = new PreparedStatementCache(2)
+    const build = jest.fn(statement)
+    for (const key of ['a', 'b', 'c', 'a']) cache.get(key, build)
+    expect(build).toHaveBeenCalledTimes(4)
+    expect(cache.stats()).toMatchObject({ shapes: 2, hits: 0, misses: 4 })
+  })
+})
@@ -0,0 +1,52 @@
+// Query builds, done once per query shape and reused.
+//
+// Hot queries whose SQL text depends on the request (which filters are set,
+// whether there is a cursor, which fields are projected) are built once per
+// distinct shape with sql.placeholder() values and kept here, so a repeat
+// request skips drizzle's query building. The name drizzle's .prepare() takes
+// is only a label: the postgres-js driver ignores it and, with `prepare: true`
+// (see ./index.ts), prepares each distinct SQL text once per pooled
+// connection, so the same shape also skips Postgres parsing and planning.
+
+interface PreparedStatement {
+  execute(values?: Record<string, unknown>): Promise<any>
+}
+
+export class PreparedStatementCache {
+  private shapes = new Map<string, PreparedStatement>()
+  private hits = 0
+  private misses = 0
+
+  constructor(private maxShapes = 200) {}
+
+  // The built query for `key`, calling `build()` the first time the shape is seen
+  get(key: string, build: () => PreparedStatement): PreparedStatement {
+    const cached = this.shapes.get(key)
+    if (cached) {
+      this.hits++
+      return cached
+    }
+
+    this.misses++
+    if (this.shapes.size >= this.maxShapes) {
+      // Shapes are bounded in practice; drop the oldest rather than grow
+      const oldest = this.shapes.keys().next().value as string
+      this.shapes.delete(oldest)
+    }
+    const statement = build()
+    this.shapes.set(key, statement)
+    return statement
+  }
+
+  stats() {
+    const total = this.hits + this.misses
+    return {
+      shapes: this.shapes.size,
+      hits: this.hits,
+      misses: this.misses,
+      hitRate: total ? this.hits / total : 0,
+    }
+  }
+}
+
+export const preparedStatements = new PreparedStatementCache()
@@ -11,6 +11,21 @@ export const accounts = pgTable('accounts', {
   accountType: varchar('account_type', { length: 20 }).notNull().default('both'), // 'buyer', 'seller', 'both'
   brokerIds: text('broker_ids').array(), // Array of Clerk user IDs for associated brokers
   active: boolean('active').notNull().default(true),
+  // Copy of the primary (else oldest) contact and address, maintained by
+  // triggers on contacts / addresses; never written by the application
+  primaryContactId: uuid('primary_contact_id'),
+  primaryContactName: varchar('primary_contact_name', { length: 255 }),
+  primaryContactEmail: varchar('primary_contact_email', { length: 255 }),
+  primaryContactPhone: varchar('primary_contact_phone', { length: 50 }),
+  primaryAddressId: uuid('primary_address_id'),
+  primaryAddressLine1: varchar('primary_address_line1', { length: 255 }),
+  primaryAddressLine2: varchar('primary_address_line2', { length: 255 }),
+  primaryAddressCity: varchar('primary_address_city', { length: 100 }),
+  primaryAddressState: varchar('primary_address_state', { length: 2 }),
+  primaryAddressPostalCode: varchar('primary_address_postal_code', { length: 20 }),
+  // Every contact / address as tab-separated lines, for the grid's search
+  contactsSearchText: text('contacts_search_text'),
+  addressesSearchText: text('addresses_search_text'),
   createdAt: timestamp('created_at').notNull().defaultNow(),
   updatedAt: timestamp('updated_at').notNull().defaultNow(),
   updatedBy: varchar('updated_by', { length: 255 }), // Customer service person who last edited
@@ -154,3 +154,24 @@ export const orderAttachmentsRelations = relations(orderAttachments, ({ one }) =
     references: [orders.id],
   }),
 }))
+
+// Account Invoice Summary table - outstanding invoice count and open balance per account.
+// Maintained by triggers on orders and invoice_payment_status (add-account-invoice-summary.sql,
+// add-account-invoice-summary-balance.sql); never written by the application.
+export const accountInvoiceSummary = pgTable('account_invoice_summary', {
+  accountId: uuid('account_id').primaryKey().references(() => accounts.id, { onDelete: 'cascade' }),
+  outstandingCount: integer('outstanding_count').notNull().default(0), // invoices not paid or cancelled
+  openBalance: numeric('open_balance', { precision: 14, scale: 2 }).notNull().default('0'), // QuickBooks balance, else invoice total
+  updatedAt: timestamp('updated_at').notNull().defaultNow(),
+})
+
+// Invoice Payment Status table - QuickBooks balance per invoiced order, one row per order.
+// Written by the QuickBooks sync service and webhook handler as invoices and payments post.
+export const invoicePaymentStatus = pgTable('invoice_payment_status', {
+  orderId: uuid('order_id').primaryKey().references(() => orders.id, { onDelete: 'cascade' }),
+  status: varchar('status', { length: 20 }).notNull().default('unpaid'), // unpaid, partial, paid, void
+  totalAmount: numeric('total_amount', { precision: 12, scale: 2 }).notNull().default('0'),
+  balance: numeric('balance', { precision: 12, scale: 2 }).notNull().default('0'),
+  paidAt: timestamp('paid_at'),
+  updatedAt: timestamp('updated_at').notNull().defaultNow(),
+})
@@ -8,6 +8,7 @@ import { config } from './config'
 import { logger } from './utils/logger'
 import { errorHandler } from './middleware/error-handler'
 import { routes } from './routes'
+import { preparedStatements } from './db/prepared'
 
 const app = express()
 
@@ -29,7 +30,7 @@ app.use(clerkMiddleware())
 
 // Health check
 app.get('/health', (req, res) => {
-  res.json({ status: 'ok', timestamp: new Date().toISOString() })
+  res.json({ status: 'ok', timestamp: new Date().toISOString(), preparedStatements: preparedStatements.stats() })
 })
 
 // API routes
@@ -0,0 +1,59 @@
+import { Request, Response } from 'express'
+
+const mockPageAccounts = jest.fn()
+const mockSearchAccounts = jest.fn()
+
+jest.mock('./accounts.service', () => ({
+  AccountsService: jest.fn().mockImplementation(() => ({
+    pageAccounts: mockPageAccounts,
+    searchAccounts: mockSearchAccounts,
+  })),
+}))
+
+import { AccountsController } from './accounts.controller'
+
+describe('AccountsController.searchAccounts', () => {
+  const controller = new AccountsController()
+
+  const search = async (query: Record<string, string>) => {
+    const res = { json: jest.fn() } as unknown as Response
+    const next = jest.fn()
+    await controller.searchAccounts({ query } as unknown as Request, res, next)
+    expect(next).not.toHaveBeenCalled()
+  }
+
+  beforeEach(() => {
+    mockPageAccounts.mockReset().mockResolvedValue({ data: [], nextCursor: null })
+    mockSearchAccounts.mockReset().mockResolvedValue([])
+  })
+
+  it.each([
+    ['0', 1],
+    ['-1', 1],
+    ['abc', 50],
+    ['10000', 500],
+  ])('pages with limit=%s as %d rows', async (limit, expected) => {
+    await search({ cursor: '', limit })
+    expect(mockPageAccounts.mock.calls[0][1]).toBe(expected)
+  })
+
+  it.each([
+    ['0', '-3', 0, 0],
+    [undefined, undefined, undefined, 0],
+  ])('searches with limit=%s offset=%s as %p, %d', async (limit, offset, expectedLimit, expectedOffset) => {
+    await search({ limit, offset } as Record<string, string>)
+    expect(mockSearchAccounts.mock.calls[0].slice(1, 3)).toEqual([expectedLimit, expectedOffset])
+  })
+
+  it('does not cap limit=10000 without a cursor, as the account pickers ask', async () => {
+    await search({ limit: '10000', include: '' })
+    expect(mockSearchAccounts.mock.calls[0][1]).toBe(10000)
+  })
+
+  it.each(['-1', 'abc', '2.5'])('rejects limit=%s without a cursor', async limit => {
+    const next = jest.fn()
+    await controller.searchAccounts({ query: { limit } } as unknown as Request, { json: jest.fn() } as unknown as Response, next)
+    expect(next).toHaveBeenCalledWith(expect.objectContaining({ statusCode: 400 }))
+    expect(mockSearchAccounts).not.toHaveBeenCalled()
+  })
+})
@@ -1,8 +1,12 @@
 import { Request, Response, NextFunction } from 'express'
 import { AccountsService } from './accounts.service'
+import { listLimit, pageLimit, pageOffset } from './accounts.cursor'
 import { createAccountSchema, createAddressSchema, createContactSchema } from '../../shared-copy'
 import { AuthRequest } from '../../middleware/auth'
 
+const parseList = (value: unknown): string[] =>
+  String(value).split(',').map(item => item.trim()).filter(Boolean)
+
 export class AccountsController {
   private accountsService: AccountsService
 
@@ -31,11 +35,39 @@ export class AccountsController {
 
   searchAccounts = async (req: Request, res: Response, next: NextFunction) => {
     try {
-      const { search, limit, offset } = req.query
+      const { search, limit, offset, cursor, code, name, location, status, fields, include, sort, dir } = req.query
+
+      // ?fields=code,name&include=primaryContact,primaryAddress; `include=` means none
+      const projection = {
+        fields: fields !== undefined ? parseList(fields) : undefined,
+        include: include !== undefined ? parseList(include) : undefined,
+      }
+
+      // Any `cursor` param (empty for the first page) selects keyset paging,
+      // which returns { data, nextCursor } instead of a bare array and
+      // supports ?sort=code|name|contact|email|phone|location|status&dir=asc|desc
+      if (cursor !== undefined) {
+        const page = await this.accountsService.pageAccounts(
+          search as string,
+          pageLimit(limit),
+          (cursor as string) || undefined,
+          {
+            code: code as string,
+            name: name as string,
+            location: location as string,
+            status: status === 'active' || status === 'inactive' ? status : undefined,
+          },
+          projection,
+          { sort: sort as string, dir: dir as string }
+        )
+        return res.json(page)
+      }
+
       const accounts = await this.accountsService.searchAccounts(
         search as string,
-        limit ? parseInt(limit as string) : undefined,
-        offset ? parseInt(offset as string) : undefined
+        listLimit(limit),
+        pageOffset(offset),
+        projection
       )
       res.json(accounts)
     } catch (error) {
@@ -0,0 +1,67 @@
+import { encodeCursor, decodeCursor, listLimit, pageLimit, pageOffset } from './accounts.cursor'
+
+const ID = '6f1c2a9e-4b7d-4e2a-9c3f-1a2b3c4d5e6f'
+
+describe('accounts keyset cursor', () => {
+  it('round-trips the sort key and id', () => {
+    const cursor = encodeCursor('name', 'asc', "O'Brien & Sons, Inc.", ID)
+    expect(cursor).toMatch(/^[A-Za-z0-9_-]+$/)
+    expect(decodeCursor(cursor, 'name', 'asc')).toEqual(["O'Brien & Sons, Inc.", ID])
+  })
+
+  it('keeps an empty sort key', () => {
+    expect(decodeCursor(encodeCursor('email', 'desc', '', ID), 'email', 'desc')).toEqual(['', ID])
+  })
+
+  it('only continues the order it came from', () => {
+    const cursor = encodeCursor('name', 'asc', 'Acme', ID)
+    expect(() => decodeCursor(cursor, 'code', 'asc')).toThrow('Invalid cursor')
+    expect(() => decodeCursor(cursor, 'name', 'desc')).toThrow('Invalid cursor')
+  })
+
+  it.each([
+    ['not base64 json', 'not-a-cursor'],
+    ['a non-uuid id', encodeCursor('name', 'asc', 'Acme', '1; drop table accounts')],
+    ['a non-string key', Buffer.from(JSON.stringify(['name', 'asc', 42, ID])).toString('base64url')],
+    ['too few parts', Buffer.from(JSON.stringify(['name', 'asc'])).toString('base64url')],
+  ])('rejects %s with a 400', (_, cursor) => {
+    expect(() => decodeCursor(cursor, 'name', 'asc')).toThrow(expect.objectContaining({ statusCode: 400 }))
+  })
+})
+
+describe('page size', () => {
+  it.each([
+    ['0', 1],
+    ['-1', 1],
+    ['abc', 50],
+    [undefined, 50],
+    ['', 50],
+    ['25', 25],
+    ['10000', 500],
+    [0, 1],
+  ])('reads limit %p as %d', (limit, expected) => {
+    expect(pageLimit(limit)).toBe(expected)
+  })
+
+  it.each([
+    ['-5', 0],
+    ['abc', 0],
+    [undefined, 0],
+    ['40', 40],
+  ])('reads offset %p as %d', (offset, expected) => {
+    expect(pageOffset(offset)).toBe(expected)
+  })
+
+  it.each([
+    [undefined, undefined],
+    ['', undefined],
+    ['0', 0],
+    ['10000', 10000],
+  ])('reads list limit %p as %p', (limit, expected) => {
+    expect(listLimit(limit)).toBe(expected)
+  })
+
+  it.each(['-1', 'abc', '2.5'])('rejects list limit %p', limit => {
+    expect(() => listLimit(limit)).toThrow('Invalid limit')
+  })
+})
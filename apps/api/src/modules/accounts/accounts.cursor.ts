@@ -0,0 +1,46 @@
+import { AppError } from '../../middleware/error-handler'
+
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+
+// Keyset cursors for the accounts list. Opaque to clients: base64url of
+// [sort, dir, last row's sort key, id]
+export function encodeCursor(sort: string, dir: string, key: string, id: string): string {
+  return Buffer.from(JSON.stringify([sort, dir, key, id])).toString('base64url')
+}
+
+// The [sort key, id] to continue after; a cursor only continues the order it came from
+export function decodeCursor(cursor: string, sort: string, dir: string): [string, string] {
+  try {
+    const [cursorSort, cursorDir, key, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+    if (cursorSort === sort && cursorDir === dir && typeof key === 'string' && typeof id === 'string' && UUID_PATTERN.test(id)) {
+      return [key, id]
+    }
+  } catch {
+    // fall through
+  }
+  throw new AppError('Invalid cursor', 400)
+}
+
+// Rows per page from ?limit: 1 to 500, 50 when missing or not a number
+export function pageLimit(value: unknown, fallback = 50): number {
+  const n = typeof value === 'number' ? Math.trunc(value) : parseInt(String(value), 10)
+  if (Number.isNaN(n)) return fallback
+  return Math.max(1, Math.min(n, 500))
+}
+
+// Rows from ?limit on the offset path, which is not capped: every row when
+// missing, otherwise a whole number of at least 0
+export function listLimit(value: unknown): number | undefined {
+  if (value === undefined || value === '') return undefined
+  const n = Number(value)
+  if (!Number.isInteger(n) || n < 0) {
+    throw new AppError('Invalid limit', 400)
+  }
+  return n
+}
+
+// Rows to skip from ?offset; anything unusable starts at the top
+export function pageOffset(value: unknown): number {
+  const n = typeof value === 'number' ? Math.trunc(value) : parseInt(String(value), 10)
+  return Number.isNaN(n) ? 0 : Math.max(0, n)
+}
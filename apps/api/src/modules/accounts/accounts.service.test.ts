@@ -0,0 +1,55 @@
+jest.mock('../../db', () => ({ db: {} }))
+
+import { sql } from 'drizzle-orm'
+import { PgDialect } from 'drizzle-orm/pg-core'
+import { preparedStatements } from '../../db/prepared'
+import { AccountsService } from './accounts.service'
+
+describe('AccountsService list statements', () => {
+  const service = new AccountsService()
+  let get: jest.SpyInstance
+
+  beforeEach(() => {
+    get = jest.spyOn(preparedStatements, 'get').mockReturnValue({ execute: async () => [] })
+  })
+
+  afterEach(() => get.mockRestore())
+
+  const keyFor = async (fields: string[], include?: string[]) => {
+    get.mockClear()
+    await service.searchAccounts('acme', 50, 0, { fields, include })
+    return get.mock.calls[0][0]
+  }
+
+  it('shares one statement across field order and repeats', async () => {
+    const key = await keyFor(['code', 'active'], ['contacts', 'addresses'])
+    expect(await keyFor(['active', 'code', 'code'], ['addresses', 'contacts'])).toBe(key)
+    expect(await keyFor(['id', 'active', 'name', 'code'], ['addresses', 'contacts', 'contacts'])).toBe(key)
+    expect(await keyFor(['code'], ['contacts', 'addresses'])).not.toBe(key)
+  })
+
+  it('rejects unknown fields before looking up a statement', async () => {
+    await expect(service.searchAccounts(undefined, 50, 0, { fields: ['code', 'toString'] }))
+      .rejects.toMatchObject({ statusCode: 400 })
+    await expect(service.searchAccounts(undefined, 50, 0, { include: ['orders'] }))
+      .rejects.toMatchObject({ statusCode: 400 })
+    expect(get).not.toHaveBeenCalled()
+  })
+
+  it('keys page statements on the status filter', async () => {
+    const keyForStatus = async (status?: 'active' | 'inactive') => {
+      get.mockClear()
+      await service.pageAccounts(undefined, 50, undefined, { status })
+      return get.mock.calls[0][0]
+    }
+    const keys = new Set([await keyForStatus('active'), await keyForStatus('inactive'), await keyForStatus()])
+    expect(keys.size).toBe(3)
+  })
+
+  it('writes the status as a literal so the partial active index can match', () => {
+    const render = (status: 'active' | 'inactive') =>
+      new PgDialect().sqlToQuery(sql.join((service as any).listConditions({}, status)))
+    expect(render('active')).toEqual({ sql: '"accounts"."active" = true', params: [] })
+    expect(render('inactive')).toEqual({ sql: '"accounts"."active" = false', params: [] })
+  })
+})
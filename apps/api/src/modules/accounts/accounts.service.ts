@@ -1,8 +1,124 @@
 import { AppError } from '../../middleware/error-handler'
 import { logger } from '../../utils/logger'
 import { db } from '../../db'
-import { accounts, addresses, contacts } from '../../db/schema'
-import { eq, or, ilike, sql, inArray } from 'drizzle-orm'
+import { preparedStatements } from '../../db/prepared'
+import { encodeCursor, decodeCursor, pageLimit, pageOffset } from './accounts.cursor'
+import { accounts, addresses, contacts, accountInvoiceSummary } from '../../db/schema'
+import { eq, or, and, ilike, asc, desc, sql, getTableColumns, type SQL } from 'drizzle-orm'
+
+export interface AccountFilters {
+  code?: string
+  name?: string
+  location?: string // matched against any of the account's addresses as "City, ST"
+  status?: 'active' | 'inactive'
+}
+
+// Columns returned by the accounts list endpoints
+const accountListFields = {
+  id: accounts.id,
+  code: accounts.code,
+  name: accounts.name,
+  qboCustomerId: accounts.qboCustomerId,
+  active: accounts.active,
+  createdAt: accounts.createdAt,
+  updatedAt: accounts.updatedAt,
+  // From account_invoice_summary, kept current by triggers on orders and invoice_payment_status
+  outstandingInvoices: sql<number>`coalesce(${accountInvoiceSummary.outstandingCount}, 0)`,
+  openBalance: sql<number>`coalesce(${accountInvoiceSummary.openBalance}, 0)::float8`,
+  // Primary (else oldest) contact and address, denormalized onto the account
+  // row by triggers on contacts / addresses
+  primaryContactName: accounts.primaryContactName,
+  primaryContactEmail: accounts.primaryContactEmail,
+  primaryContactPhone: accounts.primaryContactPhone,
+  primaryAddressLine1: accounts.primaryAddressLine1,
+  primaryAddressLine2: accounts.primaryAddressLine2,
+  primaryAddressCity: accounts.primaryAddressCity,
+  primaryAddressState: accounts.primaryAddressState,
+  primaryAddressPostalCode: accounts.primaryAddressPostalCode,
+  // Every contact ("name\temail\tphone") and address ("line1\tline2\tcity\tstate\tpostal
+  // code"), one per line, so the grid can search them without loading either
+  contactsSearchText: accounts.contactsSearchText,
+  addressesSearchText: accounts.addressesSearchText,
+}
+
+export const ACCOUNT_INCLUDES = ['addresses', 'contacts', 'primaryContact', 'primaryAddress'] as const
+export type AccountInclude = typeof ACCOUNT_INCLUDES[number]
+
+// Sparse projection for the list endpoints. `fields` limits the account
+// columns (id and name always come back); `include` picks related data,
+// defaulting to every address and contact.
+export interface AccountProjection {
+  fields?: string[]
+  include?: string[]
+}
+
+const DEFAULT_INCLUDE: AccountInclude[] = ['addresses', 'contacts']
+
+// Sort keys for keyset paging. Each is a non-null text expression, so the
+// (key, id) row comparison is total, and each matches an index from
+// add-accounts-sort-indexes.sql exactly; empty values sort first.
+const accountSortKeys: Record<string, SQL> = {
+  name: sql`${accounts.name}`,
+  code: sql`${accounts.code}`,
+  contact: sql`lower(coalesce(${accounts.primaryContactName}, ''))`,
+  email: sql`lower(coalesce(${accounts.primaryContactEmail}, ''))`,
+  phone: sql`regexp_replace(coalesce(${accounts.primaryContactPhone}, ''), '[^0-9]', '', 'g')`,
+  location: sql`coalesce(${accounts.primaryAddressCity} || ', ' || ${accounts.primaryAddressState}, '')`,
+  status: sql`(case when ${accounts.active} then 'active' else 'inactive' end)`,
+}
+
+// ?sort=<key>&dir=asc|desc for the keyset list; defaults to name ascending
+export interface AccountOrder {
+  sort?: string
+  dir?: string
+}
+
+// Primary (else oldest) contact and address as JSON objects, built from the
+// denormalized columns on the account row (no per-row lookup)
+const primaryContactField = sql<{ id: string, name: string, email: string, phone: string | null } | null>`(
+  case when ${accounts.primaryContactId} is null then null else json_build_object(
+    'id', ${accounts.primaryContactId}, 'name', ${accounts.primaryContactName},
+    'email', ${accounts.primaryContactEmail}, 'phone', ${accounts.primaryContactPhone}
+  ) end
+)`
+
+const primaryAddressField = sql<{ id: string, line1: string, city: string, state: string } | null>`(
+  case when ${accounts.primaryAddressId} is null then null else json_build_object(
+    'id', ${accounts.primaryAddressId}, 'line1', ${accounts.primaryAddressLine1},
+    'line2', ${accounts.primaryAddressLine2}, 'city', ${accounts.primaryAddressCity},
+    'state', ${accounts.primaryAddressState}, 'postalCode', ${accounts.primaryAddressPostalCode}
+  ) end
+)`
+
+// The columns are timestamp without time zone holding UTC, which is how drizzle
+// reads them for the account row itself. Inside JSON they are tagged as UTC
+// explicitly, so the string carries its offset whatever the session time zone.
+const jsonTimestamp = (column: string) =>
+  sql.raw(`to_json(${column} at time zone 'UTC')`)
+
+// Every address / contact of the row's account as a JSON array, aggregated
+// in Postgres so the page, its addresses and its contacts are one query with
+// no IN list and no regrouping in JS
+const addressesField = sql<(typeof addresses.$inferSelect)[]>`(
+  select coalesce(json_agg(json_build_object(
+    'id', a.id, 'accountId', a.account_id, 'type', a.type, 'line1', a.line1, 'line2', a.line2,
+    'city', a.city, 'state', a.state, 'postalCode', a.postal_code, 'country', a.country,
+    'isPrimary', a.is_primary, 'createdAt', ${jsonTimestamp('a.created_at')},
+    'updatedAt', ${jsonTimestamp('a.updated_at')}, 'updatedBy', a.updated_by
+  ) order by a.created_at), '[]'::json)
+  from ${addresses} a
+  where a.account_id = ${accounts.id}
+)`
+
+const contactsField = sql<(typeof contacts.$inferSelect)[]>`(
+  select coalesce(json_agg(json_build_object(
+    'id', c.id, 'accountId', c.account_id, 'name', c.name, 'email', c.email, 'phone', c.phone,
+    'isPrimary', c.is_primary, 'createdAt', ${jsonTimestamp('c.created_at')},
+    'updatedAt', ${jsonTimestamp('c.updated_at')}, 'updatedBy', c.updated_by
+  ) order by c.created_at), '[]'::json)
+  from ${contacts} c
+  where c.account_id = ${accounts.id}
+)`
 
 export class AccountsService {
   // Generate account code from name
@@ -41,87 +157,200 @@ export class AccountsService {
 
   // Get account by ID with addresses and contacts
   async getAccount(id: string) {
-    const [account] = await db.select().from(accounts).where(eq(accounts.id, id)).limit(1)
+    // One prepared statement returns the account with its addresses and contacts nested
+    const statement = preparedStatements.get('account_detail', () =>
+      db
+        .select({ ...getTableColumns(accounts), addresses: addressesField, contacts: contactsField })
+        .from(accounts)
+        .where(eq(accounts.id, sql.placeholder('id')))
+        .limit(1)
+        .prepare('accounts_detail')
+    )
+    const [account] = await statement.execute({ id })
 
     if (!account) {
       throw new AppError('Account not found', 404)
     }
 
-    // Get addresses and contacts
-    const accountAddresses = await db.select().from(addresses).where(eq(addresses.accountId, id))
-    const accountContacts = await db.select().from(contacts).where(eq(contacts.accountId, id))
+    return account
+  }
 
-    return {
-      ...account,
-      addresses: accountAddresses,
-      contacts: accountContacts,
-    }
+  // Search accounts - optimized with single query. Without a limit every
+  // matching account is returned (LIMIT NULL), as pickers load the full list
+  async searchAccounts(search?: string, limit?: number, offset = 0, projection: AccountProjection = {}) {
+    const values = this.listValues(search)
+    const statement = this.listStatement('search', values, projection, undefined, (selection, conditions, name) =>
+      db
+        .select(selection)
+        .from(accounts)
+        .leftJoin(accountInvoiceSummary, eq(accountInvoiceSummary.accountId, accounts.id))
+        .where(and(...conditions))
+        .orderBy(accounts.name)
+        .limit(sql.placeholder('limit'))
+        .offset(sql.placeholder('offset'))
+        .prepare(name)
+    )
+    return statement.execute({ ...values, limit: limit ?? null, offset: pageOffset(offset) })
   }
 
-  // Search accounts - optimized with single query
-  async searchAccounts(search?: string, limit = 50, offset = 0) {
-    let query = db
-      .select({
-        id: accounts.id,
-        code: accounts.code,
-        name: accounts.name,
-        qboCustomerId: accounts.qboCustomerId,
-        active: accounts.active,
-        createdAt: accounts.createdAt,
-        updatedAt: accounts.updatedAt,
-      })
-      .from(accounts)
-      .orderBy(accounts.name)
-
-    if (search) {
-      const searchPattern = `%${search}%`
-      query = query.where(
-        or(
-          ilike(accounts.name, searchPattern),
-          ilike(accounts.code, searchPattern)
-        )
-      ) as any
-    }
+  // Keyset page of accounts ordered by (sort key, id), name by default.
+  // Unlike limit/offset, every page is one index range scan on the sort key's
+  // index (forwards or backwards), and rows inserted mid-scroll can't shift
+  // later pages.
+  async pageAccounts(
+    search?: string,
+    limit = 50,
+    cursor?: string,
+    filters: AccountFilters = {},
+    projection: AccountProjection = {},
+    order: AccountOrder = {}
+  ) {
+    const { sort, dir } = this.validateOrder(order)
+    const values = this.listValues(search, filters, cursor ? decodeCursor(cursor, sort, dir) : undefined)
+    const sortKey = accountSortKeys[sort]
+    const direction = dir === 'desc' ? desc : asc
+    const statement = this.listStatement(`page_${sort}_${dir}`, values, projection, filters.status, (selection, conditions, name) => {
+      if ('cursorKey' in values) {
+        const after = sql`(${sortKey}, ${accounts.id})`
+        const cursorRow = sql`(${sql.placeholder('cursorKey')}, ${sql.placeholder('cursorId')}::uuid)`
+        conditions.push(dir === 'desc' ? sql`${after} < ${cursorRow}` : sql`${after} > ${cursorRow}`)
+      }
+      return db
+        .select({ ...selection, sortKey })
+        .from(accounts)
+        .leftJoin(accountInvoiceSummary, eq(accountInvoiceSummary.accountId, accounts.id))
+        .where(and(...conditions))
+        .orderBy(direction(sortKey), direction(accounts.id))
+        .limit(sql.placeholder('limit'))
+        .prepare(name)
+    })
+
+    // One extra row tells us whether another page exists; a page always
+    // holds at least one row, so `last` is set whenever hasMore is
+    const size = pageLimit(limit)
+    const rows: any[] = await statement.execute({ ...values, limit: size + 1 })
 
-    const results = await query.limit(limit).offset(offset)
+    const hasMore = rows.length > size
+    const page = hasMore ? rows.slice(0, size) : rows
+    const last = page[page.length - 1]
 
-    if (results.length === 0) {
-      return []
+    return {
+      data: page.map(({ sortKey, ...row }) => row),
+      nextCursor: hasMore ? encodeCursor(sort, dir, last.sortKey, last.id) : null,
     }
+  }
 
-    // Get all IDs for this batch
-    const accountIds = results.map(a => a.id)
+  // Placeholder values for a list query. Which keys are present decides the
+  // WHERE clause, so together with the status and the projection they
+  // identify its shape.
+  private listValues(search?: string, filters: AccountFilters = {}, cursor?: [string, string]) {
+    const values: Record<string, unknown> = {}
+    if (search) values.search = `%${search}%`
+    if (filters.code) values.code = `%${filters.code}%`
+    if (filters.name) values.name = `%${filters.name}%`
+    if (filters.location) values.location = `%${filters.location}%`
+    if (cursor) {
+      const [key, id] = cursor
+      values.cursorKey = key
+      values.cursorId = id
+    }
+    return values
+  }
 
-    // Fetch ALL addresses and contacts in 2 queries instead of N queries
-    const [allAddresses, allContacts] = await Promise.all([
-      db.select().from(addresses).where(inArray(addresses.accountId, accountIds)),
-      db.select().from(contacts).where(inArray(contacts.accountId, accountIds))
-    ])
+  // Conditions for the keys in `values`, which are placeholders, and for the
+  // status. Each filter is served by an index from add-accounts-trigram-indexes.sql.
+  private listConditions(values: Record<string, unknown>, status?: AccountFilters['status']) {
+    const conditions = []
+    if ('search' in values) {
+      conditions.push(or(
+        ilike(accounts.name, sql.placeholder('search')),
+        ilike(accounts.code, sql.placeholder('search'))
+      ))
+    }
+    if ('code' in values) {
+      conditions.push(ilike(accounts.code, sql.placeholder('code')))
+    }
+    if ('name' in values) {
+      conditions.push(ilike(accounts.name, sql.placeholder('name')))
+    }
+    if ('location' in values) {
+      conditions.push(sql`exists (
+        select 1 from ${addresses}
+        where ${addresses.accountId} = ${accounts.id}
+          and (${addresses.city} || ', ' || ${addresses.state}) ilike ${sql.placeholder('location')}
+      )`)
+    }
+    if (status) {
+      // A literal, not a parameter: under the cached generic plan Postgres can
+      // only use the partial accounts_active_name_id_idx (WHERE active = true)
+      // when the predicate itself says active = true
+      conditions.push(status === 'active' ? sql`${accounts.active} = true` : sql`${accounts.active} = false`)
+    }
+    return conditions
+  }
 
-    // Group by account ID
-    const addressesByAccount = new Map<string, typeof allAddresses>()
-    const contactsByAccount = new Map<string, typeof allContacts>()
+  // The prepared statement for this query shape, built on first use
+  private listStatement(
+    kind: string,
+    values: Record<string, unknown>,
+    projection: AccountProjection,
+    status: AccountFilters['status'] | undefined,
+    build: (selection: Record<string, any>, conditions: SQL[], name: string) => { execute(values?: Record<string, unknown>): Promise<any> }
+  ) {
+    const { fields, include } = this.validateProjection(projection)
+    const key = JSON.stringify([kind, Object.keys(values).sort(), status ?? null, fields ?? null, include])
+    return preparedStatements.get(key, () =>
+      build(this.listSelection(fields, include), this.listConditions(values, status) as SQL[], `accounts_${kind}`)
+    )
+  }
 
-    allAddresses.forEach(addr => {
-      if (!addressesByAccount.has(addr.accountId)) {
-        addressesByAccount.set(addr.accountId, [])
-      }
-      addressesByAccount.get(addr.accountId)!.push(addr)
-    })
+  private validateProjection({ fields, include = DEFAULT_INCLUDE }: AccountProjection) {
+    // Own keys only: `in` would also accept inherited names such as `constructor`
+    const unknownField = fields?.find(field => !Object.prototype.hasOwnProperty.call(accountListFields, field))
+    if (unknownField) {
+      throw new AppError(`Unknown field: ${unknownField}`, 400)
+    }
+    const unknownInclude = include.find(name => !(ACCOUNT_INCLUDES as readonly string[]).includes(name))
+    if (unknownInclude) {
+      throw new AppError(`Unknown include: ${unknownInclude}`, 400)
+    }
+    // Canonical order, so `code,name`, `name,code` and `code,code` are one
+    // statement shape; id and name always come back anyway
+    return {
+      fields: fields && [...new Set(fields)].filter(field => field !== 'id' && field !== 'name').sort(),
+      include: [...new Set(include)].sort() as AccountInclude[],
+    }
+  }
 
-    allContacts.forEach(contact => {
-      if (!contactsByAccount.has(contact.accountId)) {
-        contactsByAccount.set(contact.accountId, [])
-      }
-      contactsByAccount.get(contact.accountId)!.push(contact)
-    })
+  private listSelection(fields: string[] | undefined, include: AccountInclude[]) {
+    const columns = fields ? ['id', 'name', ...fields] : Object.keys(accountListFields)
+    const selection: Record<string, any> = Object.fromEntries(
+      columns.map(column => [column, accountListFields[column as keyof typeof accountListFields]])
+    )
+    if (include.includes('addresses')) {
+      selection.addresses = addressesField
+    }
+    if (include.includes('contacts')) {
+      selection.contacts = contactsField
+    }
+    if (include.includes('primaryContact')) {
+      selection.primaryContact = primaryContactField
+    }
+    if (include.includes('primaryAddress')) {
+      selection.primaryAddress = primaryAddressField
+    }
+    return selection
+  }
 
-    // Combine results
-    return results.map(account => ({
-      ...account,
-      addresses: addressesByAccount.get(account.id) || [],
-      contacts: contactsByAccount.get(account.id) || [],
-    }))
+  private validateOrder({ sort = 'name', dir = 'asc' }: AccountOrder) {
+    // Own keys only: `in` would also accept inherited names such as `toString`
+    if (!Object.prototype.hasOwnProperty.call(accountSortKeys, sort)) {
+      throw new AppError(`Unknown sort: ${sort}`, 400)
+    }
+    if (dir !== 'asc' && dir !== 'desc') {
+      throw new AppError(`Invalid sort direction: ${dir}`, 400)
+    }
+    return { sort, dir }
   }
 
   // Update account
@@ -0,0 +1,32 @@
+import { parseAccountIds, groupByAccount } from './invoices.recent'
+
+const A = '6f1c2a9e-4b7d-4e2a-9c3f-1a2b3c4d5e6f'
+const B = '0a9b8c7d-6e5f-4a3b-8c1d-0e9f8a7b6c5d'
+
+describe('recent invoices by account', () => {
+  it('lowercases, trims and dedupes ids, dropping non-uuids', () => {
+    expect(parseAccountIds(` ${A.toUpperCase()},${A}, ${B} ,nope,,`)).toEqual([A, B])
+  })
+
+  it('groups ranked rows per account in rank order', () => {
+    const invoices = new Map([['i1', { id: 'i1' }], ['i2', { id: 'i2' }], ['i3', { id: 'i3' }]])
+    const ranked = [
+      { account_id: A, id: 'i2' },
+      { account_id: A, id: 'i1' },
+      { account_id: B, id: 'i3' },
+    ]
+    expect(groupByAccount([A, B], ranked, invoices)).toEqual({
+      [A]: [{ id: 'i2' }, { id: 'i1' }],
+      [B]: [{ id: 'i3' }],
+    })
+  })
+
+  it('gives accounts without invoices an empty list', () => {
+    expect(groupByAccount([A, B], [{ account_id: A, id: 'i1' }], new Map([['i1', 1]]))).toEqual({ [A]: [1], [B]: [] })
+  })
+
+  it('answers an uppercase request with the lowercase ids postgres returns', () => {
+    const ids = parseAccountIds(A.toUpperCase())
+    expect(groupByAccount(ids, [{ account_id: A, id: 'i1' }], new Map([['i1', 1]]))).toEqual({ [A]: [1] })
+  })
+})
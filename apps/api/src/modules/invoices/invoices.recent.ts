@@ -0,0 +1,21 @@
+const UUID_PATTERN = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i
+
+// ?accountIds=a,b,c as distinct lowercase uuids. Postgres returns uuids in
+// lowercase, so the ids must be too before they key the response.
+export function parseAccountIds(accountIds: string): string[] {
+  return [...new Set(accountIds.split(',').map(id => id.trim().toLowerCase()).filter(id => UUID_PATTERN.test(id)))]
+}
+
+// { [accountId]: invoices in rank order }, with [] for accounts that have none
+export function groupByAccount<T>(
+  ids: string[],
+  ranked: { account_id: string, id: string }[],
+  invoicesById: Map<string, T>
+): Record<string, T[]> {
+  const byAccount: Record<string, T[]> = Object.fromEntries(ids.map(id => [id, []]))
+  ranked.forEach(row => {
+    const invoice = invoicesById.get(row.id)
+    if (invoice) byAccount[row.account_id]?.push(invoice)
+  })
+  return byAccount
+}
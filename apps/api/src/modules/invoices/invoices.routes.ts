@@ -1,10 +1,98 @@
 import { Router } from 'express'
 import { db } from '../../db'
-import { orders, orderLines, accounts, products } from '../../db/schema'
+import { orders, orderLines, accounts, products, invoicePaymentStatus } from '../../db/schema'
 import { eq, desc, or, ilike, and, sql, inArray } from 'drizzle-orm'
+import { parseAccountIds, groupByAccount } from './invoices.recent'
 
 const router = Router()
 
+// Load parties, lines and products for a set of invoice rows and shape them
+// the way the invoice lists and order popups expect
+async function formatInvoices(results: (typeof orders.$inferSelect)[]) {
+  if (results.length === 0) {
+    return []
+  }
+
+  // Get all related data
+  const orderIds = results.map(o => o.id)
+  const sellerIds = [...new Set(results.map(o => o.sellerId).filter(Boolean))]
+  const buyerIds = [...new Set(results.map(o => o.buyerId).filter(Boolean))]
+  const accountIds = [...new Set([...sellerIds, ...buyerIds])]
+
+  const [allAccounts, allLines, allPaymentStatuses] = await Promise.all([
+    accountIds.length > 0
+      ? db.select().from(accounts).where(inArray(accounts.id, accountIds))
+      : Promise.resolve([]),
+    orderIds.length > 0
+      ? db.select().from(orderLines).where(inArray(orderLines.orderId, orderIds))
+      : Promise.resolve([]),
+    db.select().from(invoicePaymentStatus).where(inArray(invoicePaymentStatus.orderId, orderIds)),
+  ])
+
+  // Get products
+  const productIds = [...new Set(allLines.map(l => l.productId))]
+  const allProducts = productIds.length > 0
+    ? await db.select().from(products).where(inArray(products.id, productIds))
+    : []
+
+  // Build lookup maps
+  const accountsMap = new Map(allAccounts.map(a => [a.id, a]))
+  const productsMap = new Map(allProducts.map(p => [p.id, p]))
+  const paymentStatusMap = new Map(allPaymentStatuses.map(s => [s.orderId, s]))
+  const linesByOrderMap = new Map<string, any[]>()
+
+  allLines.forEach(line => {
+    if (!linesByOrderMap.has(line.orderId)) {
+      linesByOrderMap.set(line.orderId, [])
+    }
+    const product = productsMap.get(line.productId)
+    linesByOrderMap.get(line.orderId)!.push({
+      id: line.id,
+      productId: line.productId,
+      productCode: product?.name || 'N/A',
+      productDescription: [product?.variety, product?.grade].filter(Boolean).join(' - ') || line.sizeGrade || '',
+      sizeGrade: line.sizeGrade,
+      quantity: parseFloat(line.quantity),
+      unitSize: parseFloat(line.unitSize),
+      uom: line.uom,
+      totalWeight: parseFloat(line.totalWeight),
+      unitPrice: parseFloat(line.unitPrice),
+      total: parseFloat(line.lineTotal),
+      commissionPct: line.commissionPct ? parseFloat(line.commissionPct) : 0,
+      commissionAmt: line.commissionAmt ? parseFloat(line.commissionAmt) : 0,
+    })
+  })
+
+  // Format response
+  return results.map(invoice => {
+    const seller = accountsMap.get(invoice.sellerId)
+    const buyer = accountsMap.get(invoice.buyerId)
+    const payment = paymentStatusMap.get(invoice.id)
+
+    return {
+      id: invoice.id,
+      orderNo: invoice.orderNo,
+      qboDocNumber: invoice.qboDocNumber,
+      qboDocId: invoice.qboDocId,
+      orderDate: invoice.createdAt,
+      status: invoice.status,
+      sellerAccountId: invoice.sellerId,
+      sellerAccountName: seller?.name || 'Unknown',
+      sellerAccountCode: seller?.code || 'N/A',
+      buyerAccountId: invoice.buyerId,
+      buyerAccountName: buyer?.name || 'Unknown',
+      buyerAccountCode: buyer?.code || 'N/A',
+      totalAmount: parseFloat(invoice.totalAmount),
+      // Precomputed from QuickBooks; invoices not yet seen by sync fall back to order status
+      paymentStatus: payment?.status ?? (invoice.status === 'paid' ? 'paid' : invoice.status === 'cancelled' ? 'void' : 'unpaid'),
+      balance: payment ? parseFloat(payment.balance) : invoice.status === 'paid' ? 0 : parseFloat(invoice.totalAmount),
+      agentId: invoice.createdBy,
+      agentName: invoice.createdBy || 'Unknown',
+      lines: linesByOrderMap.get(invoice.id) || [],
+    }
+  })
+}
+
 // GET /api/invoices - List all invoices
 router.get('/', async (req, res, next) => {
   try {
@@ -42,93 +130,64 @@ router.get('/', async (req, res, next) => {
       .limit(parseInt(limit as string))
       .offset(parseInt(offset as string))
 
-    if (results.length === 0) {
-      return res.json([])
-    }
-
-    // Get all related data
-    const orderIds = results.map(o => o.id)
-    const sellerIds = [...new Set(results.map(o => o.sellerId).filter(Boolean))]
-    const buyerIds = [...new Set(results.map(o => o.buyerId).filter(Boolean))]
-    const accountIds = [...new Set([...sellerIds, ...buyerIds])]
-
-    const [allAccounts, allLines] = await Promise.all([
-      accountIds.length > 0
-        ? db.select().from(accounts).where(inArray(accounts.id, accountIds))
-        : Promise.resolve([]),
-      orderIds.length > 0
-        ? db.select().from(orderLines).where(inArray(orderLines.orderId, orderIds))
-        : Promise.resolve([])
-    ])
+    let invoices = await formatInvoices(results)
 
-    // If filtering by productId, filter results to only orders containing that product
-    let filteredResults = results
+    // If filtering by productId, keep only invoices containing that product
     if (productId) {
-      const orderIdsWithProduct = [...new Set(allLines
-        .filter(line => line.productId === productId)
-        .map(line => line.orderId))]
-      filteredResults = results.filter(order => orderIdsWithProduct.includes(order.id))
+      invoices = invoices.filter(invoice => invoice.lines.some(line => line.productId === productId))
     }
 
-    // Get products
-    const productIds = [...new Set(allLines.map(l => l.productId))]
-    const allProducts = productIds.length > 0
-      ? await db.select().from(products).where(inArray(products.id, productIds))
-      : []
+    res.json(invoices)
+  } catch (error) {
+    next(error)
+  }
+})
 
-    // Build lookup maps
-    const accountsMap = new Map(allAccounts.map(a => [a.id, a]))
-    const productsMap = new Map(allProducts.map(p => [p.id, p]))
-    const linesByOrderMap = new Map<string, any[]>()
-
-    allLines.forEach(line => {
-      if (!linesByOrderMap.has(line.orderId)) {
-        linesByOrderMap.set(line.orderId, [])
-      }
-      const product = productsMap.get(line.productId)
-      linesByOrderMap.get(line.orderId)!.push({
-        id: line.id,
-        productId: line.productId,
-        productCode: product?.name || 'N/A',
-        productDescription: [product?.variety, product?.grade].filter(Boolean).join(' - ') || line.sizeGrade || '',
-        sizeGrade: line.sizeGrade,
-        quantity: parseFloat(line.quantity),
-        unitSize: parseFloat(line.unitSize),
-        uom: line.uom,
-        totalWeight: parseFloat(line.totalWeight),
-        unitPrice: parseFloat(line.unitPrice),
-        total: parseFloat(line.lineTotal),
-        commissionPct: line.commissionPct ? parseFloat(line.commissionPct) : 0,
-        commissionAmt: line.commissionAmt ? parseFloat(line.commissionAmt) : 0,
-      })
-    })
+// GET /api/invoices/recent?accountIds=a,b,c&limit=5 - Latest invoices per account
+// One query for the whole batch instead of a request per account. Each account
+// reads at most `limit` rows per side from the (seller_id|buyer_id, created_at
+// desc) invoice indexes, however many invoices it has.
+router.get('/recent', async (req, res, next) => {
+  try {
+    const { accountIds = '', limit = '5' } = req.query
+    const ids = parseAccountIds(accountIds as string)
+    const perAccount = Math.min(Math.max(parseInt(limit as string) || 5, 1), 50)
 
-    // Format response
-    const invoices = filteredResults.map(invoice => {
-      const seller = accountsMap.get(invoice.sellerId)
-      const buyer = accountsMap.get(invoice.buyerId)
-
-      return {
-        id: invoice.id,
-        orderNo: invoice.orderNo,
-        qboDocNumber: invoice.qboDocNumber,
-        qboDocId: invoice.qboDocId,
-        orderDate: invoice.createdAt,
-        status: invoice.status,
-        sellerAccountId: invoice.sellerId,
-        sellerAccountName: seller?.name || 'Unknown',
-        sellerAccountCode: seller?.code || 'N/A',
-        buyerAccountId: invoice.buyerId,
-        buyerAccountName: buyer?.name || 'Unknown',
-        buyerAccountCode: buyer?.code || 'N/A',
-        totalAmount: parseFloat(invoice.totalAmount),
-        agentId: invoice.createdBy,
-        agentName: invoice.createdBy || 'Unknown',
-        lines: linesByOrderMap.get(invoice.id) || [],
-      }
-    })
+    if (ids.length === 0) {
+      return res.json({})
+    }
+    if (ids.length > 500) {
+      return res.status(400).json({ error: 'Too many account IDs (max 500)' })
+    }
 
-    res.json(invoices)
+    const idList = sql.join(ids.map(id => sql`${id}::uuid`), sql`, `)
+    const ranked = await db.execute(sql`
+      select a.account_id, recent.id
+      from unnest(array[${idList}]) as a(account_id)
+      cross join lateral (
+        select id, created_at from (
+          (select id, created_at from ${orders}
+           where qbo_doc_type = 'invoice' and seller_id = a.account_id
+           order by created_at desc limit ${perAccount})
+          union
+          (select id, created_at from ${orders}
+           where qbo_doc_type = 'invoice' and buyer_id = a.account_id
+           order by created_at desc limit ${perAccount})
+        ) party
+        order by created_at desc
+        limit ${perAccount}
+      ) recent
+      order by a.account_id, recent.created_at desc
+    `) as unknown as { account_id: string, id: string }[]
+
+    const orderIds = [...new Set(ranked.map(row => row.id))]
+    const rows = orderIds.length > 0
+      ? await db.select().from(orders).where(inArray(orders.id, orderIds))
+      : []
+    const invoicesById = new Map((await formatInvoices(rows)).map(invoice => [invoice.id, invoice]))
+
+    // { [accountId]: invoices, newest first }; accounts without invoices get []
+    res.json(groupByAccount(ids, ranked, invoicesById))
   } catch (error) {
     next(error)
   }
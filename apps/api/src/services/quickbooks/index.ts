@@ -1,5 +1,6 @@
 export * from './client'
 export * from './config'
+export * from './payment-status'
 export * from './sync'
 export * from './types'
 export * from './webhook'
@@ -0,0 +1,28 @@
+jest.mock('../../db', () => ({ db: {} }))
+
+import { invoiceAmounts, paymentStatusFor } from './payment-status'
+
+describe('paymentStatusFor', () => {
+  it.each([
+    [100, 100, 'unpaid'],
+    [100, 40, 'partial'],
+    [100, 0, 'paid'],
+    [0, 0, 'paid'],
+    [100, -5, 'paid'],
+  ])('total %d with balance %d is %s', (total, balance, expected) => {
+    expect(paymentStatusFor(total, balance)).toBe(expected)
+  })
+})
+
+describe('invoiceAmounts', () => {
+  it('counts a missing balance as the whole total still open', () => {
+    const amounts = invoiceAmounts({ TotalAmt: 100 })
+    expect(amounts).toEqual({ totalAmount: 100, balance: 100 })
+    expect(paymentStatusFor(amounts.totalAmount, amounts.balance)).toBe('unpaid')
+  })
+
+  it('reads a zero-total invoice with a settled balance as paid', () => {
+    const amounts = invoiceAmounts({ TotalAmt: 0, Balance: 0 })
+    expect(paymentStatusFor(amounts.totalAmount, amounts.balance)).toBe('paid')
+  })
+})
@@ -0,0 +1,76 @@
+import { db } from '../../db'
+import { invoicePaymentStatus } from '../../db/schema'
+import { sql } from 'drizzle-orm'
+import { QBOInvoice } from './types'
+
+export type PaymentStatus = 'unpaid' | 'partial' | 'paid' | 'void'
+
+/**
+ * Derive payment status from a QuickBooks invoice's total and open balance.
+ * A settled balance means paid whatever the total, as the payment webhook
+ * has always treated it, so a zero-total invoice is paid rather than open.
+ */
+export function paymentStatusFor(totalAmount: number, balance: number): PaymentStatus {
+  if (balance <= 0) {
+    return 'paid'
+  }
+  if (balance > 0 && balance < totalAmount) {
+    return 'partial'
+  }
+  return 'unpaid'
+}
+
+/**
+ * Total and open balance of a QuickBooks invoice. A response without a
+ * Balance is taken as nothing paid yet (the whole total open), never as settled.
+ */
+export function invoiceAmounts(invoice: Pick<QBOInvoice, 'TotalAmt' | 'Balance'>): { totalAmount: number, balance: number } {
+  const totalAmount = parseFloat(String(invoice.TotalAmt || '0'))
+  return { totalAmount, balance: parseFloat(String(invoice.Balance ?? totalAmount)) }
+}
+
+/**
+ * Record the latest QuickBooks total and balance for an invoiced order.
+ * Upserts the order's single row; paid_at is kept from the first time it was paid.
+ */
+export async function recordInvoiceBalance(orderId: string, totalAmount: number, balance: number): Promise<PaymentStatus> {
+  const status = paymentStatusFor(totalAmount, balance)
+
+  await db
+    .insert(invoicePaymentStatus)
+    .values({
+      orderId,
+      status,
+      totalAmount: totalAmount.toString(),
+      balance: balance.toString(),
+      paidAt: status === 'paid' ? new Date() : null,
+      updatedAt: new Date(),
+    })
+    .onConflictDoUpdate({
+      target: invoicePaymentStatus.orderId,
+      set: {
+        status,
+        totalAmount: totalAmount.toString(),
+        balance: balance.toString(),
+        paidAt: status === 'paid'
+          ? sql`coalesce(${invoicePaymentStatus.paidAt}, now())`
+          : null,
+        updatedAt: new Date(),
+      },
+    })
+
+  return status
+}
+
+/**
+ * Mark an invoiced order as voided; nothing is owed on it any more
+ */
+export async function recordInvoiceVoided(orderId: string): Promise<void> {
+  await db
+    .insert(invoicePaymentStatus)
+    .values({ orderId, status: 'void', balance: '0', updatedAt: new Date() })
+    .onConflictDoUpdate({
+      target: invoicePaymentStatus.orderId,
+      set: { status: 'void', balance: '0', updatedAt: new Date() },
+    })
+}
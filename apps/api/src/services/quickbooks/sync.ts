@@ -4,6 +4,7 @@ import { accounts, products, orders, syncMaps, addresses } from '../../db/schema
 import { eq } from 'drizzle-orm'
 import { logger } from '../../utils/logger'
 import { QBOCustomer, QBOItem, QBOInvoice, QBOEstimate, QBOTokens } from './types'
+import { invoiceAmounts, recordInvoiceBalance, recordInvoiceVoided } from './payment-status'
 
 export class QuickBooksSync {
   private qboClient: QuickBooksClient
@@ -249,6 +250,9 @@ export class QuickBooksSync {
         })
         .where(eq(orders.id, orderId))
 
+      const { totalAmount, balance } = invoiceAmounts(qboInvoice)
+      await recordInvoiceBalance(orderId, totalAmount, balance)
+
       return { docId: qboInvoice.Id!, docNumber: qboInvoice.DocNumber! }
     } else {
       const estimateData: QBOEstimate = {
@@ -314,9 +318,11 @@ export class QuickBooksSync {
     }
 
     const qboInvoice = await this.qboClient.getInvoice(order.qboDocId)
+    const { totalAmount, balance } = invoiceAmounts(qboInvoice)
+    const paymentStatus = await recordInvoiceBalance(orderId, totalAmount, balance)
 
     // Check if paid
-    if (qboInvoice.Balance === 0 && parseFloat(qboInvoice.TotalAmt as any) > 0) {
+    if (paymentStatus === 'paid') {
       await db.update(orders).set({ status: 'paid' }).where(eq(orders.id, orderId))
       logger.info(`Order ${orderId} marked as paid`)
     }
@@ -352,6 +358,7 @@ export class QuickBooksSync {
           updatedAt: new Date()
         })
         .where(eq(orders.id, orderId))
+      await recordInvoiceVoided(orderId)
 
       logger.info(`Voided invoice ${order.qboDocId} for order ${orderId}`)
 
@@ -7,6 +7,7 @@ import { logger } from '../../utils/logger'
 import { QuickBooksClient } from './client'
 import { TokenManager } from './token-manager'
 import { OrderActivityService } from '../../modules/order-activities/order-activities.service'
+import { invoiceAmounts, recordInvoiceBalance, recordInvoiceVoided } from './payment-status'
 
 // QuickBooks webhook verification token
 const WEBHOOK_VERIFIER_TOKEN = process.env.QBO_WEBHOOK_VERIFIER_TOKEN || 'your-webhook-token'
@@ -112,6 +113,7 @@ async function handleInvoiceChange(qboInvoiceId: string, operation: string, real
           updatedAt: new Date(),
         })
         .where(eq(orders.id, order.id))
+      await recordInvoiceVoided(order.id)
 
       // Record activity
       await OrderActivityService.recordActivity({
@@ -150,16 +152,9 @@ async function handleInvoiceChange(qboInvoiceId: string, operation: string, real
       return
     }
 
-    // Determine payment status
-    const balance = parseFloat(String(invoiceData.Balance || '0'))
-    const totalAmount = parseFloat(String(invoiceData.TotalAmt || '0'))
-
-    let paymentStatus = 'unpaid'
-    if (balance === 0 && totalAmount > 0) {
-      paymentStatus = 'paid'
-    } else if (balance > 0 && balance < totalAmount) {
-      paymentStatus = 'partial'
-    }
+    // Record the balance and derive payment status
+    const { totalAmount, balance } = invoiceAmounts(invoiceData)
+    const paymentStatus = await recordInvoiceBalance(order.id, totalAmount, balance)
 
     // Update the order with latest data from QuickBooks
     await db
@@ -326,10 +321,11 @@ async function handlePaymentChange(qboPaymentId: string, operation: string, real
           if (order) {
             // Fetch the invoice to check balance
             const invoiceData = await qboClient.getInvoice(qboInvoiceId)
-            const balance = parseFloat(String(invoiceData.Balance || '0'))
+            const { totalAmount, balance } = invoiceAmounts(invoiceData)
 
             // Update payment status
-            const status = balance === 0 ? 'paid' : 'posted_to_qb'
+            const paymentStatus = await recordInvoiceBalance(order.id, totalAmount, balance)
+            const status = paymentStatus === 'paid' ? 'paid' : 'posted_to_qb'
 
             await db
               .update(orders)
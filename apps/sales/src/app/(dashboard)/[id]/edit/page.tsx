@@ -10,6 +10,7 @@ import { useToast } from '@/components/ui/toast'
 import { ArrowLeft, Save } from 'lucide-react'
 import Link from 'next/link'
 import type { Agent } from '@kadouri/shared'
+import { getApiUrl } from '@/lib/api'
 
 export default function EditAgentPage() {
   const params = useParams()
@@ -37,7 +38,7 @@ export default function EditAgentPage() {
       setIsLoading(true)
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL}/api/agents/${params.id}`,
+        `${getApiUrl()}/api/agents/${params.id}`,
         {
           headers: {
             Authorization: `Bearer ${token}`
@@ -94,7 +95,7 @@ export default function EditAgentPage() {
     try {
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL}/api/agents/${params.id}`,
+        `${getApiUrl()}/api/agents/${params.id}`,
         {
           method: 'PUT',
           headers: {
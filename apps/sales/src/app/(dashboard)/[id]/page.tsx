@@ -9,6 +9,7 @@ import { Button } from '@/components/ui/button'
 import { useToast } from '@/components/ui/toast'
 import { ArrowLeft, Edit2, Trash2, Mail, Phone, Calendar } from 'lucide-react'
 import type { Agent } from '@kadouri/shared'
+import { getApiUrl } from '@/lib/api'
 
 export default function AgentDetailPage() {
   const params = useParams()
@@ -29,7 +30,7 @@ export default function AgentDetailPage() {
       setIsLoading(true)
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL}/api/agents/${params.id}`,
+        `${getApiUrl()}/api/agents/${params.id}`,
         {
           headers: {
             Authorization: `Bearer ${token}`
@@ -57,7 +58,7 @@ export default function AgentDetailPage() {
     try {
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL}/api/agents/${params.id}`,
+        `${getApiUrl()}/api/agents/${params.id}`,
         {
           method: 'DELETE',
           headers: {
@@ -9,6 +9,7 @@ import { Input } from '@/components/ui/input'
 import { useToast } from '@/components/ui/toast'
 import { ArrowLeft, Save } from 'lucide-react'
 import Link from 'next/link'
+import { getApiUrl } from '@/lib/api'
 
 export default function NewAgentPage() {
   const router = useRouter()
@@ -56,7 +57,7 @@ export default function NewAgentPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/agents`, {
+      const response = await fetch(`${getApiUrl()}/api/agents`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
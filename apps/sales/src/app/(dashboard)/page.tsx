@@ -9,6 +9,7 @@ import { Input } from '@/components/ui/input'
 import { useToast } from '@/components/ui/toast'
 import { Plus, Search, User, ArrowUpDown, ArrowUp, ArrowDown, Edit2, Trash2, Eye, EyeOff, Filter, FilterX, Mail, Phone } from 'lucide-react'
 import type { Agent } from '@kadouri/shared'
+import { getApiUrl } from '@/lib/api'
 
 interface ColumnVisibility {
   name: boolean
@@ -58,7 +59,7 @@ export default function AgentsPage() {
     try {
       setIsLoading(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/agents`, {
+      const response = await fetch(`${getApiUrl()}/api/agents`, {
         headers: {
           Authorization: `Bearer ${token}`
         }
@@ -81,7 +82,7 @@ export default function AgentsPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/agents/${id}`, {
+      const response = await fetch(`${getApiUrl()}/api/agents/${id}`, {
         method: 'DELETE',
         headers: {
           Authorization: `Bearer ${token}`
@@ -11,6 +11,7 @@ import { useToast } from '@/components/ui/toast'
 import { ArrowLeft, Save } from 'lucide-react'
 import Link from 'next/link'
 import type { Agent } from '@kadouri/shared'
+import { getApiUrl } from '@/lib/api'
 
 export default function EditAgentPage() {
   const params = useParams()
@@ -46,7 +47,7 @@ export default function EditAgentPage() {
       setIsLoading(true)
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL}/api/agents/${params.id}`,
+        `${getApiUrl()}/api/agents/${params.id}`,
         {
           headers: {
             Authorization: `Bearer ${token}`
@@ -111,7 +112,7 @@ export default function EditAgentPage() {
     try {
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL}/api/agents/${params.id}`,
+        `${getApiUrl()}/api/agents/${params.id}`,
         {
           method: 'PUT',
           headers: {
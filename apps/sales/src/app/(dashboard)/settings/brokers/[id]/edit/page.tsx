@@ -11,6 +11,7 @@ import { useToast } from '@/components/ui/toast'
 import { ArrowLeft, Save } from 'lucide-react'
 import Link from 'next/link'
 import type { Broker } from '@kadouri/shared'
+import { getApiUrl } from '@/lib/api'
 
 export default function EditBrokerPage() {
   const params = useParams()
@@ -46,7 +47,7 @@ export default function EditBrokerPage() {
       setIsLoading(true)
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL}/api/brokers/${params.id}`,
+        `${getApiUrl()}/api/brokers/${params.id}`,
         {
           headers: {
             Authorization: `Bearer ${token}`
@@ -111,7 +112,7 @@ export default function EditBrokerPage() {
     try {
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL}/api/brokers/${params.id}`,
+        `${getApiUrl()}/api/brokers/${params.id}`,
         {
           method: 'PUT',
           headers: {
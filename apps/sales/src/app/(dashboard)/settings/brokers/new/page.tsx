@@ -9,6 +9,7 @@ import { Input } from '@/components/ui/input'
 import { useToast } from '@/components/ui/toast'
 import { ArrowLeft, Save } from 'lucide-react'
 import Link from 'next/link'
+import { getApiUrl } from '@/lib/api'
 
 export default function NewBrokerPage() {
   const router = useRouter()
@@ -56,7 +57,7 @@ export default function NewBrokerPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/settings/brokers`, {
+      const response = await fetch(`${getApiUrl()}/api/settings/brokers`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
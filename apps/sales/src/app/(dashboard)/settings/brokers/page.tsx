@@ -9,6 +9,7 @@ import { Input } from '@/components/ui/input'
 import { useToast } from '@/components/ui/toast'
 import { Plus, Search, Briefcase, ArrowUpDown, ArrowUp, ArrowDown, Edit2, Trash2, Eye, EyeOff, Filter, FilterX, Mail, Phone, Building2, CheckCircle2, XCircle } from 'lucide-react'
 import type { Broker } from '@kadouri/shared'
+import { getApiUrl } from '@/lib/api'
 
 interface ColumnVisibility {
   name: boolean
@@ -64,7 +65,7 @@ export default function BrokersPage() {
     try {
       setIsLoading(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/brokers`, {
+      const response = await fetch(`${getApiUrl()}/api/brokers`, {
         headers: {
           Authorization: `Bearer ${token}`
         }
@@ -87,7 +88,7 @@ export default function BrokersPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/brokers/${id}`, {
+      const response = await fetch(`${getApiUrl()}/api/brokers/${id}`, {
         method: 'DELETE',
         headers: {
           Authorization: `Bearer ${token}`
@@ -17,6 +17,7 @@ import {
   User,
   Download,
 } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface Order {
   id: string
@@ -99,7 +100,7 @@ export default function OrdersPage() {
   }
 
   const generateSinglePDF = async (orderData: any, type: 'seller' | 'buyer') => {
-    const apiUrl = `${process.env.NEXT_PUBLIC_API_URL}/api/pdf/order/${type}`
+    const apiUrl = `${getApiUrl()}/api/pdf/order/${type}`
 
     const response = await fetch(apiUrl, {
       method: 'POST',
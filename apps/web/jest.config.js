@@ -0,0 +1,14 @@
+const nextJest = require('next/jest')
+
+// Compiles TS/TSX with the SWC build that ships with next; `next build` does
+// the type checking
+const createJestConfig = nextJest({ dir: './' })
+
+/** @type {import('jest').Config} */
+module.exports = createJestConfig({
+  testEnvironment: 'node',
+  roots: ['<rootDir>/src'],
+  moduleNameMapper: {
+    '^@/(.*)$': '<rootDir>/src/$1',
+  },
+})
@@ -31,6 +31,7 @@ import {
   DollarSign,
   Package,
 } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 export default function AccountDetailPage() {
   const params = useParams()
@@ -85,7 +86,7 @@ export default function AccountDetailPage() {
         const token = await getToken()
         // Fetch sales agent name
         if (account.salesAgentId) {
-          fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/users/${account.salesAgentId}/name`, {
+          fetch(`${getApiUrl()}/api/users/${account.salesAgentId}/name`, {
             credentials: 'include',
             headers: {
               ...(token && { Authorization: `Bearer ${token}` }),
@@ -97,7 +98,7 @@ export default function AccountDetailPage() {
         }
         // Fetch updatedBy user name
         if (account.updatedBy) {
-          fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/users/${account.updatedBy}/name`, {
+          fetch(`${getApiUrl()}/api/users/${account.updatedBy}/name`, {
             credentials: 'include',
             headers: {
               ...(token && { Authorization: `Bearer ${token}` }),
@@ -118,7 +119,7 @@ export default function AccountDetailPage() {
     try {
       const token = await getToken()
       // Fetch account details
-      const accountResponse = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${accountId}`, {
+      const accountResponse = await fetch(`${getApiUrl()}/api/accounts/${accountId}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -133,7 +134,7 @@ export default function AccountDetailPage() {
       setAccount(accountData)
 
       // Fetch transactions for this account
-      const transactionsResponse = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/invoices?accountId=${accountId}`, {
+      const transactionsResponse = await fetch(`${getApiUrl()}/api/invoices?accountId=${accountId}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -157,7 +158,7 @@ export default function AccountDetailPage() {
     setFormSubmitting(true)
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${accountId}/addresses`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${accountId}/addresses`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -204,7 +205,7 @@ export default function AccountDetailPage() {
     setFormSubmitting(true)
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${accountId}/contacts`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${accountId}/contacts`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -247,7 +248,7 @@ export default function AccountDetailPage() {
     setFormSubmitting(true)
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${accountId}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${accountId}`, {
         method: 'PATCH',
         headers: {
           'Content-Type': 'application/json',
@@ -280,7 +281,7 @@ export default function AccountDetailPage() {
     }
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${accountId}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${accountId}`, {
         method: 'PATCH',
         headers: {
           'Content-Type': 'application/json',
@@ -309,7 +310,7 @@ export default function AccountDetailPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${accountId}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${accountId}`, {
         method: 'PATCH',
         headers: {
           'Content-Type': 'application/json',
@@ -338,7 +339,7 @@ export default function AccountDetailPage() {
     setFormSubmitting(true)
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/addresses/${editingAddress.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/addresses/${editingAddress.id}`, {
         method: 'PATCH',
         headers: {
           'Content-Type': 'application/json',
@@ -369,7 +370,7 @@ export default function AccountDetailPage() {
     if (!confirm('Are you sure you want to delete this address?')) return
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/addresses/${addressId}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/addresses/${addressId}`, {
         method: 'DELETE',
         credentials: 'include',
         headers: {
@@ -394,7 +395,7 @@ export default function AccountDetailPage() {
     setFormSubmitting(true)
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/contacts/${editingContact.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/contacts/${editingContact.id}`, {
         method: 'PATCH',
         headers: {
           'Content-Type': 'application/json',
@@ -425,7 +426,7 @@ export default function AccountDetailPage() {
     if (!confirm('Are you sure you want to delete this contact?')) return
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/contacts/${contactId}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/contacts/${contactId}`, {
         method: 'DELETE',
         credentials: 'include',
         headers: {
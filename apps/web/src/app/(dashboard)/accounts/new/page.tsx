@@ -7,6 +7,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { Plus, Trash2, ArrowLeft, Save, User, MapPin } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface Contact {
   id: string
@@ -181,7 +182,7 @@ export default function NewAccountPage() {
       }
 
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -8,6 +8,7 @@ import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { Plus, Search, ChevronRight, ChevronDown, Mail, Phone, MapPin, User, Building2, FileText, Trash2, MoreVertical, Filter, ArrowUpDown, ArrowUp, ArrowDown, X } from 'lucide-react'
 import { CreateAccountModal } from '@/components/accounts/create-account-modal'
+import { getApiUrl } from '@/lib/api'
 
 interface Account {
   id: string
@@ -78,7 +79,7 @@ export default function AccountsPage() {
     setIsLoading(true)
     setError('')
     try {
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts`, {
         credentials: 'include',
       })
 
@@ -101,7 +102,7 @@ export default function AccountsPage() {
 
     setLoadingOrders(accountId)
     try {
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/invoices?accountId=${accountId}&limit=5`, {
+      const response = await fetch(`${getApiUrl()}/api/invoices?accountId=${accountId}&limit=5`, {
         credentials: 'include',
       })
 
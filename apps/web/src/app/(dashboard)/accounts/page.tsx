@@ -11,6 +11,11 @@ import { Plus, Search, ChevronRight, ChevronDown, Mail, Phone, MapPin, User, Bui
 import { CreateAccountModal } from '@/components/accounts/create-account-modal'
 import { DateRangePicker } from '@/components/ui/date-picker'
 import { useToast } from '@/components/ui/toast'
+import { getApiUrl } from '@/lib/api'
+import { PageRequestGuard } from '@/lib/page-request-guard'
+import { TrigramIndex } from '@/lib/trigram-index'
+import { loadRecentOrders, peekRecentOrders, subscribeRecentOrders, type RecentOrders } from '@/lib/recent-orders'
+import { useWindowedRows } from '@/hooks/useWindowedRows'
 
 interface Account {
   id: string
@@ -19,9 +24,27 @@ interface Account {
   qboCustomerId?: string
   active: boolean
   createdAt: string
-  addresses?: Address[]
-  contacts?: Contact[]
   salesAgentId?: string
+  outstandingInvoices?: number // unpaid invoices, maintained server-side
+  openBalance?: number
+  // Primary (else oldest) contact and address, maintained server-side
+  primaryContactName?: string | null
+  primaryContactEmail?: string | null
+  primaryContactPhone?: string | null
+  primaryAddressLine1?: string | null
+  primaryAddressLine2?: string | null
+  primaryAddressCity?: string | null
+  primaryAddressState?: string | null
+  primaryAddressPostalCode?: string | null
+  // Every contact and address as tab-separated lines, for search only
+  contactsSearchText?: string | null
+  addressesSearchText?: string | null
+}
+
+// Every contact and address of an account, loaded when its row is first expanded
+interface AccountDetails {
+  contacts: Contact[]
+  addresses: Address[]
 }
 
 interface Address {
@@ -43,6 +66,106 @@ interface Contact {
   isPrimary: boolean
 }
 
+// Lowercased copy of everything the search box and column filters look at,
+// built once per loaded account from its flat columns. The grid loads no
+// nested contacts or addresses; every one of them arrives as a line of
+// contactsSearchText / addressesSearchText instead. Multi-value fields are
+// joined with '\n', which no search term contains, so `includes` never
+// matches across values.
+interface AccountSearchRecord {
+  code: string
+  name: string
+  agent: string
+  contactNames: string
+  emails: string
+  phones: string
+  phoneDigits: string
+  addressText: string // line1, line2, city and state of every address
+  states: string
+  postalCodes: string
+  all: string // every field a general search term may match
+}
+
+const searchRecords = new WeakMap<Account, AccountSearchRecord>()
+
+const joinLower = (values: (string | null | undefined)[]) =>
+  values.filter(Boolean).join('\n').toLowerCase()
+
+const digitsOnly = (value: string) => value.replace(/\D/g, '')
+
+// Tab-separated lines from the API -> one array of fields per contact / address
+const searchLines = (text: string | null | undefined) =>
+  text ? text.split('\n').map(line => line.split('\t')) : []
+
+// Grid columns the API can sort (column -> ?sort= key). These stay in a
+// stable order across every page; other columns sort the loaded rows only.
+const SERVER_SORTS: Record<string, string> = {
+  code: 'code',
+  name: 'name',
+  contact: 'contact',
+  email: 'email',
+  phone: 'phone',
+  address: 'location',
+  status: 'status',
+}
+
+const primaryCityState = (account: Account) =>
+  account.primaryAddressCity ? `${account.primaryAddressCity}, ${account.primaryAddressState}` : ''
+
+function getSearchRecord(account: Account): AccountSearchRecord {
+  let record = searchRecords.get(account)
+  if (record) return record
+
+  const contacts = searchLines(account.contactsSearchText) // [name, email, phone]
+  const addresses = searchLines(account.addressesSearchText) // [line1, line2, city, state, postal code]
+  const phones = contacts.map(c => c[2])
+  record = {
+    code: account.code.toLowerCase(),
+    name: account.name.toLowerCase(),
+    agent: (account.salesAgentId || '').toLowerCase(),
+    contactNames: joinLower(contacts.map(c => c[0])),
+    emails: joinLower(contacts.map(c => c[1])),
+    phones: joinLower(phones),
+    phoneDigits: phones.filter(Boolean).map(phone => digitsOnly(phone)).join('\n'),
+    addressText: joinLower(addresses.flatMap(a => a.slice(0, 4))),
+    states: joinLower(addresses.map(a => a[3])),
+    postalCodes: joinLower(addresses.map(a => a[4])),
+    all: '',
+  }
+  record.all = [
+    record.name, record.code, record.agent, record.contactNames, record.emails,
+    record.phones, record.addressText, record.postalCodes,
+  ].join('\n')
+  searchRecords.set(account, record)
+  return record
+}
+
+// Phone queries with digits match regardless of punctuation: "5551234" finds "(555) 123-4"
+const matchesPhone = (record: AccountSearchRecord, query: string) => {
+  const digits = digitsOnly(query)
+  return digits ? record.phoneDigits.includes(digits) : record.phones.includes(query)
+}
+
+interface AccountSearchIndex {
+  accounts: Account[] // document id i is accounts[i]
+  index: TrigramIndex
+}
+
+// Index new accounts into `previous` when the list only grew at the end
+// (infinite scroll); any other change starts a fresh index.
+function syncSearchIndex(previous: AccountSearchIndex | null, accounts: Account[]): AccountSearchIndex {
+  const count = previous ? previous.index.size : 0
+  const appended = previous !== null && count <= accounts.length &&
+    (count === 0 || (accounts[0] === previous.accounts[0] && accounts[count - 1] === previous.accounts[count - 1]))
+  const next = appended ? previous : { accounts, index: new TrigramIndex() }
+
+  for (let i = next.index.size; i < accounts.length; i++) {
+    next.index.add(getSearchRecord(accounts[i]).all)
+  }
+  next.accounts = accounts
+  return next
+}
+
 interface ColumnVisibility {
   code: boolean
   name: boolean
@@ -55,6 +178,481 @@ interface ColumnVisibility {
   status: boolean
 }
 
+interface AccountRowProps {
+  account: Account
+  columnVisibility: ColumnVisibility
+  expanded: boolean
+  details?: AccountDetails // undefined until loaded
+  ordersOpen: boolean
+  ordersLoading: boolean
+  recentOrders?: RecentOrders // only passed while the popup is open
+  onOpen: (accountId: string) => void
+  onExpandedChange: (accountId: string | null) => void
+  onToggleOrders: (accountId: string, open: boolean, e: React.MouseEvent) => void
+  onEmail: (email: string, e: React.MouseEvent) => void
+  onDetailsResize: (height: number) => void
+}
+
+// One account row plus its expanded details. Memoized, and the page passes
+// only stable callbacks, so opening a popup, expanding a row or typing in a
+// filter re-renders just the rows whose props changed.
+const AccountRow = React.memo(function AccountRow({
+  account,
+  columnVisibility,
+  expanded,
+  details,
+  ordersOpen,
+  ordersLoading,
+  recentOrders,
+  onOpen,
+  onExpandedChange,
+  onToggleOrders,
+  onEmail,
+  onDetailsResize,
+}: AccountRowProps) {
+  const cityState = primaryCityState(account)
+
+  // Report the expanded detail row's height, so the table window leaves room for it
+  const detailsRef = useRef<HTMLTableRowElement>(null)
+  useEffect(() => {
+    const row = detailsRef.current
+    if (!expanded || !row) return
+    const observer = new ResizeObserver(() => onDetailsResize(row.offsetHeight))
+    observer.observe(row)
+    return () => observer.disconnect()
+  }, [expanded, details, onDetailsResize])
+
+  return (
+    <>
+      <tr
+        onClick={() => onOpen(account.id)}
+        className="border-b border-gray-200 dark:border-gray-700 hover:bg-blue-50/50 dark:hover:bg-blue-900/20 transition-colors cursor-pointer"
+      >
+        <td className="px-4 py-3" onClick={(e) => e.stopPropagation()}>
+          <button
+            onClick={() => onExpandedChange(expanded ? null : account.id)}
+            className="text-gray-400 hover:text-gray-600 dark:hover:text-gray-300"
+          >
+            {expanded ? (
+              <ChevronDown className="h-4 w-4" />
+            ) : (
+              <ChevronRight className="h-4 w-4" />
+            )}
+          </button>
+        </td>
+        {columnVisibility.code && (
+          <td className="px-4 py-3 whitespace-nowrap border-r border-gray-200 dark:border-gray-700">
+            <Link
+              href={`/accounts/${account.id}`}
+              className="text-sm font-medium text-blue-600 dark:text-blue-400 hover:text-blue-800 dark:hover:text-blue-300 hover:underline font-mono"
+            >
+              {account.code}
+            </Link>
+          </td>
+        )}
+        {columnVisibility.name && (
+          <td className="px-4 py-3 border-r border-gray-200 dark:border-gray-700 max-w-[200px]">
+            <Link
+              href={`/accounts/${account.id}`}
+              className="text-sm font-medium text-gray-900 dark:text-gray-100 hover:text-blue-600 dark:hover:text-blue-400 block truncate"
+              title={account.name}
+            >
+              {account.name}
+            </Link>
+          </td>
+        )}
+        {columnVisibility.orders && (
+          <td className="hidden lg:table-cell px-4 py-3 whitespace-nowrap text-center border-r border-gray-200 dark:border-gray-700 relative">
+            <div className="inline-block relative">
+              <div className="relative">
+                <button
+                  onClick={(e) => onToggleOrders(account.id, !ordersOpen, e)}
+                  className={`inline-flex items-center justify-center h-7 w-7 rounded-full transition-colors ${
+                    ordersOpen
+                      ? 'bg-purple-100 text-purple-700'
+                      : 'hover:bg-purple-50 text-purple-600 hover:text-purple-700'
+                  }`}
+                >
+                  <FileText className="h-3.5 w-3.5" />
+                </button>
+                {(account.outstandingInvoices ?? 0) > 0 && (
+                  <span
+                    title={`${account.outstandingInvoices} outstanding, $${(account.openBalance ?? 0).toFixed(2)} open`}
+                    className="absolute -top-1 -right-1 flex h-4 min-w-[1rem] px-0.5 items-center justify-center rounded-full bg-red-500 text-[10px] font-bold text-white"
+                  >
+                    {account.outstandingInvoices}
+                  </span>
+                )}
+              </div>
+
+              {ordersOpen && (
+                <div
+                  className="absolute left-[calc(50%+150px)] transform -translate-x-1/2 top-full mt-2 w-[1125px] bg-white dark:bg-gray-900 rounded-lg shadow-2xl border border-gray-200 dark:border-gray-700 z-50 p-5"
+                  onClick={(e) => e.stopPropagation()}
+                >
+                  <div className="flex items-center justify-between mb-4">
+                    <h4 className="text-base font-semibold text-gray-900 dark:text-gray-100">Recent Orders</h4>
+                    <Link
+                      href={`/accounts/${account.id}`}
+                      className="text-xs text-blue-600 hover:text-blue-800"
+                    >
+                      View All
+                    </Link>
+                  </div>
+                  {ordersLoading ? (
+                    <div className="text-center py-4 text-sm text-gray-500 dark:text-gray-400">
+                      Loading orders...
+                    </div>
+                  ) : recentOrders && recentOrders.orders.length > 0 ? (
+                    <div className="space-y-3 max-h-96 overflow-y-auto pr-2">
+                      {recentOrders.orders.map((order: any) => (
+                        <div key={order.id} className="bg-white dark:bg-gray-950 rounded-lg border border-gray-200 dark:border-gray-700 p-5 shadow-sm">
+                          {/* Header Row: Invoice, Status, Date */}
+                          <div className="flex items-center justify-between mb-4">
+                            <div className="flex items-center gap-3">
+                              <span className="text-sm text-gray-700 dark:text-gray-300">Invoice:</span>
+                              <Link
+                                href={`/orders/${order.id}`}
+                                className="text-base font-semibold text-blue-600 hover:text-blue-800 hover:underline"
+                              >
+                                {order.orderNo}
+                              </Link>
+                              <span className={`inline-flex items-center rounded px-2 py-0.5 text-xs font-medium ${
+                                order.paymentStatus === 'paid'
+                                  ? 'bg-green-100 text-green-800'
+                                  : order.paymentStatus === 'void'
+                                    ? 'bg-gray-100 text-gray-700'
+                                    : 'bg-yellow-100 text-yellow-800'
+                              }`}>
+                                {order.paymentStatus === 'paid'
+                                  ? 'Paid'
+                                  : order.paymentStatus === 'partial'
+                                    ? `Partial ($${order.balance.toFixed(2)} due)`
+                                    : order.paymentStatus === 'void' ? 'Void' : 'Unpaid'}
+                              </span>
+                            </div>
+                            <div className="text-sm text-gray-600 dark:text-gray-400">
+                              {new Date(order.orderDate).toLocaleDateString('en-US', { year: '2-digit', month: '2-digit', day: '2-digit' })}
+                            </div>
+                          </div>
+
+                          {/* Buyer/Seller Row */}
+                          <div className="flex items-center justify-between mb-5">
+                            <div className="text-sm">
+                              <span className="text-gray-700 dark:text-gray-300 font-semibold">Buyer:</span>{' '}
+                              <Link
+                                href={`/accounts/${order.buyerAccountId}`}
+                                className="text-gray-900 dark:text-gray-100 hover:text-blue-600 hover:underline"
+                              >
+                                {order.buyerAccountName}
+                              </Link>
+                            </div>
+                            <div className="text-sm text-right">
+                              <span className="text-gray-700 dark:text-gray-300 font-semibold">Seller:</span>{' '}
+                              <Link
+                                href={`/accounts/${order.sellerAccountId}`}
+                                className="text-gray-900 dark:text-gray-100 hover:text-blue-600 hover:underline"
+                              >
+                                {order.sellerAccountName}
+                              </Link>
+                            </div>
+                          </div>
+
+                          {/* Items Table */}
+                          {order.lines && order.lines.length > 0 && (
+                            <div className="mb-5">
+                              <div className="border border-gray-200 dark:border-gray-700 rounded overflow-x-auto max-w-full">
+                                <table className="w-full text-sm table-fixed">
+                                  <colgroup>
+                                    <col style={{width: '40%'}} />
+                                    <col style={{width: '15%'}} />
+                                    <col style={{width: '10%'}} />
+                                    <col style={{width: '10%'}} />
+                                    <col style={{width: '10%'}} />
+                                    <col style={{width: '15%'}} />
+                                  </colgroup>
+                                  <thead className="border-b border-gray-200 dark:border-gray-700 bg-gray-50 dark:bg-gray-800">
+                                    <tr>
+                                      <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Memo</th>
+                                      <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Quantity</th>
+                                      <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Price/lb</th>
+                                      <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Total</th>
+                                      <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Comm %</th>
+                                      <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Comm Amt</th>
+                                    </tr>
+                                  </thead>
+                                  <tbody className="bg-white dark:bg-gray-900">
+                                    {order.lines.map((line: any, index: number) => {
+                                      // Calculate quantity display: e.g., "200 cases × 30 lbs = 6,000 lbs"
+                                      const quantity = parseFloat(line.quantity) || 0
+                                      const unitSize = parseFloat(line.unitSize) || 0
+                                      const totalWeight = parseFloat(line.totalWeight) || (quantity * unitSize)
+                                      const uom = line.uom || 'CASE'
+                                      const unitPrice = parseFloat(line.unitPrice) || 0
+                                      const lineTotal = parseFloat(line.total) || 0
+
+                                      let quantityDisplay = ''
+                                      if (uom === 'CASE' && unitSize > 0) {
+                                        quantityDisplay = `${quantity.toLocaleString()} cases × ${unitSize} lbs = ${totalWeight.toLocaleString()} lbs`
+                                      } else if (uom === 'BAG' && unitSize > 0) {
+                                        quantityDisplay = `${quantity.toLocaleString()} bags × ${unitSize} lbs = ${totalWeight.toLocaleString()} lbs`
+                                      } else {
+                                        quantityDisplay = `${quantity.toLocaleString()} ${uom.toLowerCase()}`
+                                      }
+
+                                      return (
+                                        <tr key={line.id || index} className={index !== order.lines.length - 1 ? 'border-b border-gray-100 dark:border-gray-800' : ''}>
+                                          <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top">
+                                            <div className="break-words whitespace-normal">
+                                              {line.sizeGrade || line.productDescription || line.productCode || 'N/A'}
+                                            </div>
+                                          </td>
+                                          <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top">
+                                            <div className="break-words whitespace-normal">{quantityDisplay}</div>
+                                          </td>
+                                          <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top whitespace-nowrap">
+                                            ${unitPrice.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
+                                          </td>
+                                          <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top whitespace-nowrap">
+                                            ${lineTotal.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
+                                          </td>
+                                          <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top whitespace-nowrap">
+                                            {line.commissionPct > 0 ? `${line.commissionPct}%` : '—'}
+                                          </td>
+                                          <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top whitespace-nowrap">
+                                            ${(parseFloat(line.commissionAmt) || 0).toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
+                                          </td>
+                                        </tr>
+                                      )
+                                    })}
+                                    {/* Table Total Row */}
+                                    <tr className="border-t-2 border-gray-300 dark:border-gray-600 bg-gray-50 dark:bg-gray-800">
+                                      <td colSpan={3} className="px-2 py-2 text-right text-sm font-semibold text-gray-900 dark:text-gray-100">
+                                        Total:
+                                      </td>
+                                      <td className="px-2 py-2 pr-6 text-gray-900 dark:text-gray-100 whitespace-nowrap font-semibold text-sm">
+                                        ${order.lines.reduce((sum: number, line: any) => {
+                                          return sum + (parseFloat(line.total) || 0)
+                                        }, 0).toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
+                                      </td>
+                                      <td className="px-2 py-2 pl-6 text-right text-sm font-semibold text-gray-900 dark:text-gray-100">
+                                        Total Comm:
+                                      </td>
+                                      <td className="px-2 py-2 text-gray-900 dark:text-gray-100 whitespace-nowrap font-semibold text-sm">
+                                        ${order.lines.reduce((sum: number, line: any) => {
+                                          return sum + (parseFloat(line.commissionAmt) || 0)
+                                        }, 0).toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
+                                      </td>
+                                    </tr>
+                                  </tbody>
+                                </table>
+                              </div>
+                            </div>
+                          )}
+
+                        </div>
+                      ))}
+                    </div>
+                  ) : (
+                    <div className="text-center py-4 text-sm text-gray-500 dark:text-gray-400">
+                      No orders found
+                    </div>
+                  )}
+                </div>
+              )}
+            </div>
+          </td>
+        )}
+        {columnVisibility.contact && (
+          <td className="hidden md:table-cell px-3 py-2 whitespace-nowrap border-r border-gray-200 dark:border-gray-700">
+            {account.primaryContactName ? (
+              <div className="text-sm font-medium text-gray-900 dark:text-gray-100">
+                {account.primaryContactName}
+              </div>
+            ) : (
+              <span className="text-sm text-gray-400 dark:text-gray-500">No contact</span>
+            )}
+          </td>
+        )}
+        {columnVisibility.phone && (
+          <td className="hidden xl:table-cell px-3 py-2 whitespace-nowrap border-r border-gray-200 dark:border-gray-700">
+            {account.primaryContactPhone ? (
+              <a
+                href={`tel:${account.primaryContactPhone}`}
+                className="text-sm text-gray-900 dark:text-gray-100 hover:text-blue-600 dark:hover:text-blue-400 hover:underline"
+              >
+                {account.primaryContactPhone}
+              </a>
+            ) : (
+              <span className="text-sm text-gray-400 dark:text-gray-500">—</span>
+            )}
+          </td>
+        )}
+        {columnVisibility.email && (
+          <td className="hidden xl:table-cell px-3 py-2 border-r border-gray-200 dark:border-gray-700 max-w-[220px]" onClick={(e) => e.stopPropagation()}>
+            {account.primaryContactEmail ? (
+              <div className="flex items-center gap-2 min-w-0">
+                <button
+                  onClick={(e) => onEmail(account.primaryContactEmail!, e)}
+                  className="p-1.5 text-gray-400 hover:text-blue-600 hover:bg-blue-50 rounded transition-colors flex-shrink-0"
+                  title="Send email"
+                >
+                  <Mail className="h-4 w-4" />
+                </button>
+                <a
+                  href={`mailto:${account.primaryContactEmail}`}
+                  className="text-sm text-gray-900 dark:text-gray-100 hover:text-blue-600 dark:hover:text-blue-400 hover:underline truncate block"
+                  title={account.primaryContactEmail}
+                >
+                  {account.primaryContactEmail}
+                </a>
+              </div>
+            ) : (
+              <span className="text-sm text-gray-400 dark:text-gray-500">—</span>
+            )}
+          </td>
+        )}
+        {columnVisibility.address && (
+          <td className="hidden 2xl:table-cell px-3 py-2 whitespace-nowrap text-sm text-gray-500 dark:text-gray-400 border-r border-gray-200 dark:border-gray-700">
+            {cityState ? (
+              <div className="flex items-center gap-1">
+                <MapPin className="h-3 w-3" />
+                {cityState}
+              </div>
+            ) : (
+              <span className="text-gray-400">No address</span>
+            )}
+          </td>
+        )}
+        {columnVisibility.agent && (
+          <td className="hidden lg:table-cell px-3 py-2 whitespace-nowrap border-r border-gray-200 dark:border-gray-700">
+            <span className="text-sm text-gray-900 dark:text-gray-100">
+              {account.salesAgentId || '—'}
+            </span>
+          </td>
+        )}
+        <td className="hidden xl:table-cell px-3 py-2 whitespace-nowrap text-xs text-gray-600 dark:text-gray-400 border-r border-gray-200 dark:border-gray-700">
+          {new Date(account.createdAt).toLocaleDateString('en-US', { year: '2-digit', month: '2-digit', day: '2-digit' })}
+        </td>
+        {columnVisibility.status && (
+          <td className="hidden sm:table-cell px-3 py-2 whitespace-nowrap text-center">
+            {account.active ? (
+              <CheckCircle className="h-5 w-5 text-green-600 mx-auto" />
+            ) : (
+              <XCircle className="h-5 w-5 text-red-600 mx-auto" />
+            )}
+          </td>
+        )}
+      </tr>
+      {expanded && !details && (
+        <tr ref={detailsRef} className="bg-gray-50 dark:bg-gray-800">
+          <td colSpan={10} className="px-6 py-4 text-sm text-gray-500 dark:text-gray-400">
+            Loading contacts and addresses...
+          </td>
+        </tr>
+      )}
+      {expanded && details && (
+        <tr ref={detailsRef} className="bg-gray-50 dark:bg-gray-800">
+          <td colSpan={10} className="px-6 py-4">
+            <div className="grid grid-cols-2 gap-6">
+              {/* Contacts */}
+              <div>
+                <h4 className="text-sm font-semibold text-gray-900 dark:text-gray-100 mb-3 flex items-center gap-2">
+                  <User className="h-4 w-4" />
+                  Contacts ({details.contacts.length})
+                </h4>
+                {details.contacts.length > 0 ? (
+                  <div className="space-y-2">
+                    {details.contacts.map((contact) => (
+                      <div
+                        key={contact.id}
+                        className="bg-white dark:bg-gray-950 rounded-lg p-3 border border-gray-200 dark:border-gray-700"
+                      >
+                        <div className="flex items-start justify-between mb-1">
+                          <span className="text-sm font-medium text-gray-900 dark:text-gray-100">
+                            {contact.name}
+                          </span>
+                          {contact.isPrimary && (
+                            <span className="inline-flex items-center rounded-full bg-blue-100 px-2 py-0.5 text-xs font-medium text-blue-800">
+                              Primary
+                            </span>
+                          )}
+                        </div>
+                        <div className="space-y-1">
+                          <div className="flex items-center gap-2 text-xs text-gray-600 dark:text-gray-400">
+                            <Mail className="h-3 w-3" />
+                            <a
+                              href={`mailto:${contact.email}`}
+                              className="hover:text-blue-600 dark:hover:text-blue-400"
+                            >
+                              {contact.email}
+                            </a>
+                          </div>
+                          {contact.phone && (
+                            <div className="flex items-center gap-2 text-xs text-gray-600 dark:text-gray-400">
+                              <Phone className="h-3 w-3" />
+                              <a
+                                href={`tel:${contact.phone}`}
+                                className="hover:text-blue-600 dark:hover:text-blue-400"
+                              >
+                                {contact.phone}
+                              </a>
+                            </div>
+                          )}
+                        </div>
+                      </div>
+                    ))}
+                  </div>
+                ) : (
+                  <p className="text-sm text-gray-500 dark:text-gray-400">No contacts</p>
+                )}
+              </div>
+
+              {/* Addresses */}
+              <div>
+                <h4 className="text-sm font-semibold text-gray-900 dark:text-gray-100 mb-3 flex items-center gap-2">
+                  <MapPin className="h-4 w-4" />
+                  Addresses ({details.addresses.length})
+                </h4>
+                {details.addresses.length > 0 ? (
+                  <div className="space-y-2">
+                    {details.addresses.map((address) => (
+                      <div
+                        key={address.id}
+                        className="bg-white dark:bg-gray-950 rounded-lg p-3 border border-gray-200 dark:border-gray-700"
+                      >
+                        <div className="flex items-start justify-between mb-1">
+                          <span className="text-sm font-medium text-gray-900 dark:text-gray-100 capitalize">
+                            {address.type}
+                          </span>
+                          {address.isPrimary && (
+                            <span className="inline-flex items-center rounded-full bg-blue-100 px-2 py-0.5 text-xs font-medium text-blue-800">
+                              Primary
+                            </span>
+                          )}
+                        </div>
+                        <div className="text-xs text-gray-600 dark:text-gray-400 space-y-0.5">
+                          <p>{address.line1}</p>
+                          {address.line2 && <p>{address.line2}</p>}
+                          <p>
+                            {address.city}, {address.state} {address.postalCode}
+                          </p>
+                        </div>
+                      </div>
+                    ))}
+                  </div>
+                ) : (
+                  <p className="text-sm text-gray-500 dark:text-gray-400">No addresses</p>
+                )}
+              </div>
+            </div>
+          </td>
+        </tr>
+      )}
+    </>
+  )
+})
+
 export default function AccountsPage() {
   const router = useRouter()
   const { getToken } = useAuth()
@@ -62,15 +660,17 @@ export default function AccountsPage() {
   const [searchQuery, setSearchQuery] = useState('')
   const [showCreateModal, setShowCreateModal] = useState(false)
   const [expandedAccountId, setExpandedAccountId] = useState<string | null>(null)
+  const [expandedDetailsHeight, setExpandedDetailsHeight] = useState(0) // measured px of its detail row
+  const [accountDetails, setAccountDetails] = useState<Record<string, AccountDetails>>({})
   const [accounts, setAccounts] = useState<Account[]>([])
   const [isLoading, setIsLoading] = useState(true)
+  const [isLoadingMore, setIsLoadingMore] = useState(false)
   const [error, setError] = useState('')
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const observerTarget = useRef<HTMLDivElement>(null)
   const [openOrdersAccountId, setOpenOrdersAccountId] = useState<string | null>(null)
-  const [accountOrders, setAccountOrders] = useState<{ [key: string]: any[] }>({})
-  const [outstandingInvoices, setOutstandingInvoices] = useState<{ [key: string]: number }>({})
+  const [, setRecentOrdersVersion] = useState(0) // bumped when the shared popup cache fills
   const [loadingOrders, setLoadingOrders] = useState<string | null>(null)
-  const [showEmailModal, setShowEmailModal] = useState(false)
-  const [emailRecipient, setEmailRecipient] = useState<{email: string, name: string} | null>(null)
   const [showActiveOnly, setShowActiveOnly] = useState(true)
 
   // Date range filter state
@@ -116,16 +716,58 @@ export default function AccountsPage() {
   const [showGroupingPanel, setShowGroupingPanel] = useState(false)
   const groupingPanelRef = useRef<HTMLDivElement>(null)
 
-  useEffect(() => {
-    fetchAccounts()
-  }, [])
+  // Code, name, location and status filters run in the API so they cover
+  // every account, not just the pages loaded so far
+  const serverFilters = useMemo(() => ({
+    code: columnFilters.code.trim(),
+    name: columnFilters.name.trim(),
+    location: columnFilters.address.trim(),
+    status: columnFilters.status || (showActiveOnly ? 'active' : ''),
+  }), [columnFilters.code, columnFilters.name, columnFilters.address, columnFilters.status, showActiveOnly])
 
-  const fetchAccounts = async () => {
-    setIsLoading(true)
+  const serverSort = useMemo(() => (
+    sortColumn && SERVER_SORTS[sortColumn] ? { sort: SERVER_SORTS[sortColumn], dir: sortDirection } : null
+  ), [sortColumn, sortDirection])
+
+  const hasLoadedAccounts = useRef(false)
+  const searchIndex = useRef<AccountSearchIndex | null>(null)
+  const requests = useRef(new PageRequestGuard())
+  const lastServerFilters = useRef(serverFilters)
+
+  useEffect(() => {
+    // Debounce typing; the first load and sort changes go out immediately
+    const typing = hasLoadedAccounts.current && lastServerFilters.current !== serverFilters
+    lastServerFilters.current = serverFilters
+    const timer = setTimeout(() => fetchAccounts(), typing ? 300 : 0)
+    return () => clearTimeout(timer)
+  }, [serverFilters, serverSort])
+
+  const fetchAccounts = async (cursor: string | null = null, append = false) => {
+    const query = JSON.stringify([serverFilters, serverSort])
+    const request = append ? requests.current.beginAppend(query) : requests.current.beginReset(query)
+    if (request === null) return // a new list is loading, or this cursor belongs to an old one
+    if (append) {
+      setIsLoadingMore(true)
+    } else if (!hasLoadedAccounts.current) {
+      // Later refetches keep the table mounted so the filter inputs keep focus
+      setIsLoading(true)
+    }
     setError('')
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts`, {
+      // include= (none): the grid shows only the flat primary contact and address
+      // columns and searches the flat search text; every contact and address is
+      // fetched when a row is expanded
+      const params = new URLSearchParams({ limit: '50', cursor: cursor ?? '', include: '' })
+      Object.entries(serverFilters).forEach(([key, value]) => {
+        if (value) params.set(key, value)
+      })
+      if (serverSort) {
+        params.set('sort', serverSort.sort)
+        params.set('dir', serverSort.dir)
+      }
+      // Keyset paging: each page continues after the last (sort key, id) served
+      const response = await fetch(`${getApiUrl()}/api/accounts?${params}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -136,55 +778,87 @@ export default function AccountsPage() {
         throw new Error('Failed to fetch accounts')
       }
 
-      const data = await response.json()
-      setAccounts(data)
+      const { data, nextCursor } = await response.json()
+      if (!requests.current.isCurrent(request)) return // filters changed meanwhile
+
+      setAccounts(prev => append ? [...prev, ...data] : data)
+      setNextCursor(nextCursor)
+      hasLoadedAccounts.current = true
     } catch (err) {
       console.error('Fetch accounts error:', err)
-      setError('Failed to load accounts')
+      if (requests.current.isCurrent(request)) {
+        setError('Failed to load accounts')
+      }
     } finally {
-      setIsLoading(false)
+      if (requests.current.isCurrent(request)) {
+        setIsLoading(false)
+        setIsLoadingMore(false)
+      }
+      requests.current.end(request)
     }
   }
 
-  const fetchAccountOrders = async (accountId: string) => {
-    if (accountOrders[accountId]) return // Already fetched
+  // Popup data lives in a cache shared across dashboard pages; re-render when it fills
+  useEffect(() => subscribeRecentOrders(() => setRecentOrdersVersion(v => v + 1)), [])
+
+  const fetchAccountOrders = React.useCallback(async (accountId: string) => {
+    // Cached data (even stale) shows at once while it revalidates in the background
+    const cached = peekRecentOrders(accountId)
+    if (!cached) setLoadingOrders(accountId)
+    try {
+      await loadRecentOrders([accountId], getToken)
+    } finally {
+      if (!cached) setLoadingOrders(null)
+    }
+  }, [getToken])
+
+  // Row callbacks are stable (no dependency on which row is open) so the
+  // memoized rows skip re-rendering; the row says whether it opens or closes
+  const handleToggleOrders = React.useCallback((accountId: string, open: boolean, e: React.MouseEvent) => {
+    e.stopPropagation()
+    setOpenOrdersAccountId(open ? accountId : null)
+    if (open) fetchAccountOrders(accountId)
+  }, [fetchAccountOrders])
+
+  const detailsRequested = useRef(new Set<string>())
 
-    setLoadingOrders(accountId)
+  const fetchAccountDetails = React.useCallback(async (accountId: string) => {
+    if (detailsRequested.current.has(accountId)) return
+    detailsRequested.current.add(accountId)
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/invoices?accountId=${accountId}&limit=5`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${accountId}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
         },
       })
-
-      if (response.ok) {
-        const data = await response.json()
-        setAccountOrders(prev => ({ ...prev, [accountId]: data }))
-
-        // Count outstanding invoices (not paid)
-        const outstanding = data.filter((order: any) =>
-          order.status !== 'paid' && order.status !== 'cancelled'
-        ).length
-        setOutstandingInvoices(prev => ({ ...prev, [accountId]: outstanding }))
+      if (!response.ok) {
+        throw new Error('Failed to fetch account')
       }
+      const { contacts, addresses } = await response.json()
+      setAccountDetails(prev => ({ ...prev, [accountId]: { contacts, addresses } }))
     } catch (err) {
-      console.error('Fetch orders error:', err)
-    } finally {
-      setLoadingOrders(null)
+      // Let the next expand try again
+      detailsRequested.current.delete(accountId)
+      console.error('Fetch account details error:', err)
+      showToast('Failed to load contacts and addresses', 'error')
     }
-  }
+  }, [getToken, showToast])
 
-  const handleToggleOrders = (accountId: string, e: React.MouseEvent) => {
-    e.stopPropagation()
-    if (openOrdersAccountId === accountId) {
-      setOpenOrdersAccountId(null)
-    } else {
-      setOpenOrdersAccountId(accountId)
-      fetchAccountOrders(accountId)
-    }
-  }
+  const handleExpandedChange = React.useCallback((accountId: string | null) => {
+    setExpandedAccountId(accountId)
+    setExpandedDetailsHeight(0)
+    if (accountId) fetchAccountDetails(accountId)
+  }, [fetchAccountDetails])
+
+  const handleDetailsResize = React.useCallback((height: number) => {
+    setExpandedDetailsHeight(height)
+  }, [])
+
+  const handleOpenAccount = React.useCallback((accountId: string) => {
+    router.push(`/accounts/${accountId}`)
+  }, [router])
 
   // Close popups when clicking outside
   useEffect(() => {
@@ -210,18 +884,40 @@ export default function AccountsPage() {
     }
   }, [openOrdersAccountId, openColumnMenu, showColumnVisibilityPanel])
 
-  const handleOpenEmailModal = (email: string, name: string, e: React.MouseEvent) => {
-    e.preventDefault()
+  // Opens the user's mail client, as the icon always did
+  const handleEmail = React.useCallback((email: string, e: React.MouseEvent) => {
     e.stopPropagation()
-    setEmailRecipient({ email, name })
-    setShowEmailModal(true)
-  }
+    window.location.href = `mailto:${email}`
+  }, [])
 
   const handleAccountCreated = (newAccount: Account) => {
     setAccounts([newAccount, ...accounts])
     setShowCreateModal(false)
   }
 
+  // Infinite scroll: load the next page when the sentinel below the table shows
+  useEffect(() => {
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries[0].isIntersecting && nextCursor && !isLoading && !isLoadingMore) {
+          fetchAccounts(nextCursor, true)
+        }
+      },
+      { threshold: 0.1 }
+    )
+
+    const currentTarget = observerTarget.current
+    if (currentTarget) {
+      observer.observe(currentTarget)
+    }
+
+    return () => {
+      if (currentTarget) {
+        observer.unobserve(currentTarget)
+      }
+    }
+  }, [nextCursor, isLoading, isLoadingMore])
+
   // Sort handler
   const handleSort = (column: string) => {
     if (sortColumn === column) {
@@ -422,17 +1118,13 @@ export default function AccountsPage() {
       case 'name':
         return account.name || 'Unknown'
       case 'contact':
-        const contact = account.contacts?.find(c => c.isPrimary) || account.contacts?.[0]
-        return contact?.name || 'No Contact'
+        return account.primaryContactName || 'No Contact'
       case 'phone':
-        const phone = account.contacts?.find(c => c.isPrimary)?.phone || account.contacts?.[0]?.phone
-        return phone || 'No Phone'
+        return account.primaryContactPhone || 'No Phone'
       case 'email':
-        const email = account.contacts?.find(c => c.isPrimary)?.email || account.contacts?.[0]?.email
-        return email || 'No Email'
+        return account.primaryContactEmail || 'No Email'
       case 'address':
-        const address = account.addresses?.find(a => a.isPrimary) || account.addresses?.[0]
-        return address ? `${address.city}, ${address.state}` : 'No Address'
+        return primaryCityState(account) || 'No Address'
       case 'agent':
         return account.salesAgentId || 'No Agent'
       case 'status':
@@ -492,58 +1184,20 @@ export default function AccountsPage() {
       })
     }
 
-    // Apply column filters
-    if (columnFilters.code) {
-      result = result.filter(account =>
-        account.code.toLowerCase().includes(columnFilters.code.toLowerCase())
-      )
-    }
-    if (columnFilters.name) {
-      result = result.filter(account =>
-        account.name.toLowerCase().includes(columnFilters.name.toLowerCase())
-      )
-    }
-    if (columnFilters.contact) {
-      result = result.filter(account =>
-        account.contacts?.some(c =>
-          c.name.toLowerCase().includes(columnFilters.contact.toLowerCase())
-        )
-      )
-    }
-    if (columnFilters.phone) {
-      result = result.filter(account =>
-        account.contacts?.some(c =>
-          c.phone?.toLowerCase().includes(columnFilters.phone.toLowerCase())
-        )
-      )
-    }
-    if (columnFilters.email) {
-      result = result.filter(account =>
-        account.contacts?.some(c =>
-          c.email.toLowerCase().includes(columnFilters.email.toLowerCase())
-        )
-      )
-    }
-    if (columnFilters.address) {
-      result = result.filter(account =>
-        account.addresses?.some(a =>
-          `${a.city}, ${a.state}`.toLowerCase().includes(columnFilters.address.toLowerCase())
-        )
-      )
-    }
-    if (columnFilters.agent) {
-      result = result.filter(account =>
-        account.salesAgentId?.toLowerCase().includes(columnFilters.agent.toLowerCase())
-      )
-    }
-    if (columnFilters.status) {
-      if (columnFilters.status === 'active') {
-        result = result.filter(account => account.active)
-      } else if (columnFilters.status === 'inactive') {
-        result = result.filter(account => !account.active)
-      }
+    // Apply column filters (code, name, address and status are applied by the API)
+    const contactFilter = columnFilters.contact.toLowerCase()
+    const phoneFilter = columnFilters.phone.toLowerCase()
+    const emailFilter = columnFilters.email.toLowerCase()
+    const agentFilter = columnFilters.agent.toLowerCase()
+    if (contactFilter || phoneFilter || emailFilter || agentFilter) {
+      result = result.filter(account => {
+        const record = getSearchRecord(account)
+        return (!contactFilter || record.contactNames.includes(contactFilter)) &&
+          (!phoneFilter || matchesPhone(record, phoneFilter)) &&
+          (!emailFilter || record.emails.includes(emailFilter)) &&
+          (!agentFilter || record.agent.includes(agentFilter))
+      })
     }
-
     // Apply global search query (existing nested query logic)
     if (searchQuery) {
       const query = searchQuery.toLowerCase().trim()
@@ -573,49 +1227,58 @@ export default function AccountsPage() {
         generalTerms.push(query)
       }
 
+      // General terms go through the trigram index; a term under 3 characters
+      // can't, and falls back to scanning the search records
+      let termMatches: Set<Account> | null = null
+      if (generalTerms.length > 0) {
+        searchIndex.current = syncSearchIndex(searchIndex.current, accounts)
+        const { index } = searchIndex.current
+        const hits = generalTerms.map(term => index.search(term))
+        if (hits.every(ids => ids !== null)) {
+          termMatches = new Set(hits.flatMap(ids => ids!.map(id => accounts[id])))
+        }
+      }
+
       result = result.filter(account => {
+        if (termMatches && !termMatches.has(account)) return false
+        const record = getSearchRecord(account)
+
         // Field-specific matches
         for (const [field, value] of Object.entries(fieldMatches)) {
           let fieldMatch = false
 
           switch (field) {
             case 'agent':
-              fieldMatch = account.salesAgentId?.toLowerCase().includes(value) || false
+              fieldMatch = record.agent.includes(value)
               break
             case 'name':
-              fieldMatch = account.name.toLowerCase().includes(value)
+              fieldMatch = record.name.includes(value)
               break
             case 'code':
-              fieldMatch = account.code.toLowerCase().includes(value)
+              fieldMatch = record.code.includes(value)
               break
             case 'email':
-              fieldMatch = account.contacts?.some(c => c.email.toLowerCase().includes(value)) || false
+              fieldMatch = record.emails.includes(value)
               break
             case 'contact':
-              fieldMatch = account.contacts?.some(c =>
-                c.name.toLowerCase().includes(value) ||
-                c.email.toLowerCase().includes(value) ||
-                (c.phone && c.phone.toLowerCase().includes(value))
-              ) || false
+              fieldMatch =
+                record.contactNames.includes(value) ||
+                record.emails.includes(value) ||
+                record.phones.includes(value)
               break
             case 'phone':
-              fieldMatch = account.contacts?.some(c => c.phone?.toLowerCase().includes(value)) || false
+              fieldMatch = matchesPhone(record, value)
               break
             case 'address':
             case 'city':
-              fieldMatch = account.addresses?.some(a =>
-                a.city.toLowerCase().includes(value) ||
-                a.state.toLowerCase().includes(value) ||
-                a.line1.toLowerCase().includes(value) ||
-                (a.line2 && a.line2.toLowerCase().includes(value))
-              ) || false
+              fieldMatch = record.addressText.includes(value)
               break
             case 'state':
-              fieldMatch = account.addresses?.some(a => a.state.toLowerCase().includes(value)) || false
+              fieldMatch = record.states.includes(value)
               break
             case 'zip':
             case 'postal':
-              fieldMatch = account.addresses?.some(a => a.postalCode.toLowerCase().includes(value)) || false
+              fieldMatch = record.postalCodes.includes(value)
               break
           }
 
@@ -625,85 +1288,25 @@ export default function AccountsPage() {
         }
 
         // General search terms
-        if (generalTerms.length > 0) {
-          for (const term of generalTerms) {
-            const matchesAccountInfo =
-              account.name.toLowerCase().includes(term) ||
-              account.code.toLowerCase().includes(term) ||
-              (account.salesAgentId && account.salesAgentId.toLowerCase().includes(term))
-
-            const matchesContact = account.contacts?.some(contact =>
-              contact.name.toLowerCase().includes(term) ||
-              contact.email.toLowerCase().includes(term) ||
-              (contact.phone && contact.phone.toLowerCase().includes(term))
-            )
-
-            const matchesAddress = account.addresses?.some(address =>
-              address.line1.toLowerCase().includes(term) ||
-              (address.line2 && address.line2.toLowerCase().includes(term)) ||
-              address.city.toLowerCase().includes(term) ||
-              address.state.toLowerCase().includes(term) ||
-              address.postalCode.toLowerCase().includes(term)
-            )
-
-            if (matchesAccountInfo || matchesContact || matchesAddress) {
-              return true
-            }
-          }
-          return false
+        if (generalTerms.length > 0 && !termMatches) {
+          return generalTerms.some(term => record.all.includes(term))
         }
 
         return true
       })
     }
 
-    // Apply sorting
-    if (sortColumn) {
+    // Apply sorting; server-sorted columns already arrive in order
+    if (sortColumn && !SERVER_SORTS[sortColumn]) {
       result.sort((a, b) => {
         let aValue: any = ''
         let bValue: any = ''
 
         switch (sortColumn) {
-          case 'code':
-            aValue = a.code || ''
-            bValue = b.code || ''
-            break
-          case 'name':
-            aValue = a.name || ''
-            bValue = b.name || ''
-            break
-          case 'contact':
-            const aPrimaryContact = a.contacts?.find(c => c.isPrimary) || a.contacts?.[0]
-            const bPrimaryContact = b.contacts?.find(c => c.isPrimary) || b.contacts?.[0]
-            aValue = aPrimaryContact?.name || ''
-            bValue = bPrimaryContact?.name || ''
-            break
-          case 'phone':
-            const aPhone = a.contacts?.find(c => c.isPrimary)?.phone || a.contacts?.[0]?.phone || ''
-            const bPhone = b.contacts?.find(c => c.isPrimary)?.phone || b.contacts?.[0]?.phone || ''
-            aValue = aPhone
-            bValue = bPhone
-            break
-          case 'email':
-            const aEmail = a.contacts?.find(c => c.isPrimary)?.email || a.contacts?.[0]?.email || ''
-            const bEmail = b.contacts?.find(c => c.isPrimary)?.email || b.contacts?.[0]?.email || ''
-            aValue = aEmail
-            bValue = bEmail
-            break
-          case 'address':
-            const aPrimaryAddress = a.addresses?.find(addr => addr.isPrimary) || a.addresses?.[0]
-            const bPrimaryAddress = b.addresses?.find(addr => addr.isPrimary) || b.addresses?.[0]
-            aValue = aPrimaryAddress ? `${aPrimaryAddress.city}, ${aPrimaryAddress.state}` : ''
-            bValue = bPrimaryAddress ? `${bPrimaryAddress.city}, ${bPrimaryAddress.state}` : ''
-            break
           case 'agent':
             aValue = a.salesAgentId || ''
             bValue = b.salesAgentId || ''
             break
-          case 'status':
-            aValue = a.active ? 'active' : 'inactive'
-            bValue = b.active ? 'active' : 'inactive'
-            break
         }
 
         const comparison = aValue.toString().localeCompare(bValue.toString())
@@ -760,6 +1363,32 @@ export default function AccountsPage() {
     return createNestedGroups(processedAccounts, groupByColumn)
   }, [processedAccounts, groupByColumn])
 
+  // Only mount the rows near the viewport. Rows share one height except the
+  // expanded one, whose detail row is measured; groups render in full.
+  const expandedIndex = useMemo(
+    () => (expandedAccountId === null ? -1 : processedAccounts.findIndex(account => account.id === expandedAccountId)),
+    [processedAccounts, expandedAccountId]
+  )
+  const rowExtraHeights = useMemo(
+    () => (expandedIndex >= 0 && expandedDetailsHeight > 0 ? new Map([[expandedIndex, expandedDetailsHeight]]) : undefined),
+    [expandedIndex, expandedDetailsHeight]
+  )
+  const visibleRows = useWindowedRows(processedAccounts.length, {
+    enabled: !groupedAccounts,
+    extraHeights: rowExtraHeights,
+  })
+
+  // Prefetch the orders popup for every row on screen, one batch per scroll stop
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      const visible = groupedAccounts
+        ? processedAccounts.slice(0, 100)
+        : processedAccounts.slice(visibleRows.start, visibleRows.end)
+      loadRecentOrders(visible.map(account => account.id), getToken)
+    }, 150)
+    return () => clearTimeout(timer)
+  }, [processedAccounts, groupedAccounts, visibleRows.start, visibleRows.end])
+
   // Calculate aggregations
   const aggregations = useMemo(() => {
     const totalAccounts = processedAccounts.length
@@ -994,434 +1623,23 @@ export default function AccountsPage() {
   }
 
   // Render account row
-  const renderAccountRow = (account: Account) => {
-    const primaryContact = account.contacts?.find((c) => c.isPrimary) || account.contacts?.[0]
-    const primaryAddress = account.addresses?.find((a) => a.isPrimary) || account.addresses?.[0]
-
-    return (
-      <React.Fragment key={account.id}>
-        <tr
-          onClick={() => router.push(`/accounts/${account.id}`)}
-          className="border-b border-gray-200 dark:border-gray-700 hover:bg-blue-50/50 dark:hover:bg-blue-900/20 transition-colors cursor-pointer"
-        >
-          <td className="px-4 py-3" onClick={(e) => e.stopPropagation()}>
-            <button
-              onClick={() =>
-                setExpandedAccountId(
-                  expandedAccountId === account.id ? null : account.id
-                )
-              }
-              className="text-gray-400 hover:text-gray-600 dark:hover:text-gray-300"
-            >
-              {expandedAccountId === account.id ? (
-                <ChevronDown className="h-4 w-4" />
-              ) : (
-                <ChevronRight className="h-4 w-4" />
-              )}
-            </button>
-          </td>
-          {columnVisibility.code && (
-            <td className="px-4 py-3 whitespace-nowrap border-r border-gray-200 dark:border-gray-700">
-              <Link
-                href={`/accounts/${account.id}`}
-                className="text-sm font-medium text-blue-600 dark:text-blue-400 hover:text-blue-800 dark:hover:text-blue-300 hover:underline font-mono"
-              >
-                {account.code}
-              </Link>
-            </td>
-          )}
-          {columnVisibility.name && (
-            <td className="px-4 py-3 border-r border-gray-200 dark:border-gray-700 max-w-[200px]">
-              <Link
-                href={`/accounts/${account.id}`}
-                className="text-sm font-medium text-gray-900 dark:text-gray-100 hover:text-blue-600 dark:hover:text-blue-400 block truncate"
-                title={account.name}
-              >
-                {account.name}
-              </Link>
-            </td>
-          )}
-          {columnVisibility.orders && (
-            <td className="hidden lg:table-cell px-4 py-3 whitespace-nowrap text-center border-r border-gray-200 dark:border-gray-700 relative">
-              <div className="inline-block relative">
-                <div className="relative">
-                  <button
-                    onClick={(e) => handleToggleOrders(account.id, e)}
-                    className={`inline-flex items-center justify-center h-7 w-7 rounded-full transition-colors ${
-                      openOrdersAccountId === account.id
-                        ? 'bg-purple-100 text-purple-700'
-                        : 'hover:bg-purple-50 text-purple-600 hover:text-purple-700'
-                    }`}
-                  >
-                    <FileText className="h-3.5 w-3.5" />
-                  </button>
-                  {outstandingInvoices[account.id] > 0 && (
-                    <span className="absolute -top-1 -right-1 flex h-4 w-4 items-center justify-center rounded-full bg-red-500 text-[10px] font-bold text-white">
-                      {outstandingInvoices[account.id]}
-                    </span>
-                  )}
-                </div>
-
-                {openOrdersAccountId === account.id && (
-                  <div
-                    className="absolute left-[calc(50%+150px)] transform -translate-x-1/2 top-full mt-2 w-[1125px] bg-white dark:bg-gray-900 rounded-lg shadow-2xl border border-gray-200 dark:border-gray-700 z-50 p-5"
-                    onClick={(e) => e.stopPropagation()}
-                  >
-                    <div className="flex items-center justify-between mb-4">
-                      <h4 className="text-base font-semibold text-gray-900 dark:text-gray-100">Recent Orders</h4>
-                      <Link
-                        href={`/accounts/${account.id}`}
-                        className="text-xs text-blue-600 hover:text-blue-800"
-                      >
-                        View All
-                      </Link>
-                    </div>
-                    {loadingOrders === account.id ? (
-                      <div className="text-center py-4 text-sm text-gray-500 dark:text-gray-400">
-                        Loading orders...
-                      </div>
-                    ) : accountOrders[account.id]?.length > 0 ? (
-                      <div className="space-y-3 max-h-96 overflow-y-auto pr-2">
-                        {accountOrders[account.id].map((order: any) => (
-                          <div key={order.id} className="bg-white dark:bg-gray-950 rounded-lg border border-gray-200 dark:border-gray-700 p-5 shadow-sm">
-                            {/* Header Row: Invoice, Status, Date */}
-                            <div className="flex items-center justify-between mb-4">
-                              <div className="flex items-center gap-3">
-                                <span className="text-sm text-gray-700 dark:text-gray-300">Invoice:</span>
-                                <Link
-                                  href={`/orders/${order.id}`}
-                                  className="text-base font-semibold text-blue-600 hover:text-blue-800 hover:underline"
-                                >
-                                  {order.orderNo}
-                                </Link>
-                                <span className={`inline-flex items-center rounded px-2 py-0.5 text-xs font-medium ${
-                                  order.status === 'paid'
-                                    ? 'bg-green-100 text-green-800'
-                                    : 'bg-yellow-100 text-yellow-800'
-                                }`}>
-                                  {order.status === 'paid' ? 'Paid' : order.status?.replace(/_/g, ' ').toUpperCase() || 'DRAFT'}
-                                </span>
-                              </div>
-                              <div className="text-sm text-gray-600 dark:text-gray-400">
-                                {new Date(order.orderDate).toLocaleDateString('en-US', { year: '2-digit', month: '2-digit', day: '2-digit' })}
-                              </div>
-                            </div>
-
-                            {/* Buyer/Seller Row */}
-                            <div className="flex items-center justify-between mb-5">
-                              <div className="text-sm">
-                                <span className="text-gray-700 dark:text-gray-300 font-semibold">Buyer:</span>{' '}
-                                <Link
-                                  href={`/accounts/${order.buyerAccountId}`}
-                                  className="text-gray-900 dark:text-gray-100 hover:text-blue-600 hover:underline"
-                                >
-                                  {order.buyerAccountName}
-                                </Link>
-                              </div>
-                              <div className="text-sm text-right">
-                                <span className="text-gray-700 dark:text-gray-300 font-semibold">Seller:</span>{' '}
-                                <Link
-                                  href={`/accounts/${order.sellerAccountId}`}
-                                  className="text-gray-900 dark:text-gray-100 hover:text-blue-600 hover:underline"
-                                >
-                                  {order.sellerAccountName}
-                                </Link>
-                              </div>
-                            </div>
-
-                            {/* Items Table */}
-                            {order.lines && order.lines.length > 0 && (
-                              <div className="mb-5">
-                                <div className="border border-gray-200 dark:border-gray-700 rounded overflow-x-auto max-w-full">
-                                  <table className="w-full text-sm table-fixed">
-                                    <colgroup>
-                                      <col style={{width: '40%'}} />
-                                      <col style={{width: '15%'}} />
-                                      <col style={{width: '10%'}} />
-                                      <col style={{width: '10%'}} />
-                                      <col style={{width: '10%'}} />
-                                      <col style={{width: '15%'}} />
-                                    </colgroup>
-                                    <thead className="border-b border-gray-200 dark:border-gray-700 bg-gray-50 dark:bg-gray-800">
-                                      <tr>
-                                        <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Memo</th>
-                                        <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Quantity</th>
-                                        <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Price/lb</th>
-                                        <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Total</th>
-                                        <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Comm %</th>
-                                        <th className="px-2 py-2 text-left text-xs font-medium text-gray-700 dark:text-gray-300">Comm Amt</th>
-                                      </tr>
-                                    </thead>
-                                    <tbody className="bg-white dark:bg-gray-900">
-                                      {order.lines.map((line: any, index: number) => {
-                                        // Calculate quantity display: e.g., "200 cases × 30 lbs = 6,000 lbs"
-                                        const quantity = parseFloat(line.quantity) || 0
-                                        const unitSize = parseFloat(line.unitSize) || 0
-                                        const totalWeight = parseFloat(line.totalWeight) || (quantity * unitSize)
-                                        const uom = line.uom || 'CASE'
-                                        const unitPrice = parseFloat(line.unitPrice) || 0
-                                        const lineTotal = parseFloat(line.total) || 0
-
-                                        let quantityDisplay = ''
-                                        if (uom === 'CASE' && unitSize > 0) {
-                                          quantityDisplay = `${quantity.toLocaleString()} cases × ${unitSize} lbs = ${totalWeight.toLocaleString()} lbs`
-                                        } else if (uom === 'BAG' && unitSize > 0) {
-                                          quantityDisplay = `${quantity.toLocaleString()} bags × ${unitSize} lbs = ${totalWeight.toLocaleString()} lbs`
-                                        } else {
-                                          quantityDisplay = `${quantity.toLocaleString()} ${uom.toLowerCase()}`
-                                        }
-
-                                        return (
-                                          <tr key={line.id || index} className={index !== order.lines.length - 1 ? 'border-b border-gray-100 dark:border-gray-800' : ''}>
-                                            <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top">
-                                              <div className="break-words whitespace-normal">
-                                                {line.sizeGrade || line.productDescription || line.productCode || 'N/A'}
-                                              </div>
-                                            </td>
-                                            <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top">
-                                              <div className="break-words whitespace-normal">{quantityDisplay}</div>
-                                            </td>
-                                            <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top whitespace-nowrap">
-                                              ${unitPrice.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
-                                            </td>
-                                            <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top whitespace-nowrap">
-                                              ${lineTotal.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
-                                            </td>
-                                            <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top whitespace-nowrap">
-                                              {line.commissionPct > 0 ? `${line.commissionPct}%` : '—'}
-                                            </td>
-                                            <td className="px-2 py-2 text-gray-900 dark:text-gray-100 text-sm align-top whitespace-nowrap">
-                                              ${(parseFloat(line.commissionAmt) || 0).toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
-                                            </td>
-                                          </tr>
-                                        )
-                                      })}
-                                      {/* Table Total Row */}
-                                      <tr className="border-t-2 border-gray-300 dark:border-gray-600 bg-gray-50 dark:bg-gray-800">
-                                        <td colSpan={3} className="px-2 py-2 text-right text-sm font-semibold text-gray-900 dark:text-gray-100">
-                                          Total:
-                                        </td>
-                                        <td className="px-2 py-2 pr-6 text-gray-900 dark:text-gray-100 whitespace-nowrap font-semibold text-sm">
-                                          ${order.lines.reduce((sum: number, line: any) => {
-                                            return sum + (parseFloat(line.total) || 0)
-                                          }, 0).toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
-                                        </td>
-                                        <td className="px-2 py-2 pl-6 text-right text-sm font-semibold text-gray-900 dark:text-gray-100">
-                                          Total Comm:
-                                        </td>
-                                        <td className="px-2 py-2 text-gray-900 dark:text-gray-100 whitespace-nowrap font-semibold text-sm">
-                                          ${order.lines.reduce((sum: number, line: any) => {
-                                            return sum + (parseFloat(line.commissionAmt) || 0)
-                                          }, 0).toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 })}
-                                        </td>
-                                      </tr>
-                                    </tbody>
-                                  </table>
-                                </div>
-                              </div>
-                            )}
-
-                          </div>
-                        ))}
-                      </div>
-                    ) : (
-                      <div className="text-center py-4 text-sm text-gray-500 dark:text-gray-400">
-                        No orders found
-                      </div>
-                    )}
-                  </div>
-                )}
-              </div>
-            </td>
-          )}
-          {columnVisibility.contact && (
-            <td className="hidden md:table-cell px-3 py-2 whitespace-nowrap border-r border-gray-200 dark:border-gray-700">
-              {primaryContact ? (
-                <div className="text-sm font-medium text-gray-900 dark:text-gray-100">
-                  {primaryContact.name}
-                </div>
-              ) : (
-                <span className="text-sm text-gray-400 dark:text-gray-500">No contact</span>
-              )}
-            </td>
-          )}
-          {columnVisibility.phone && (
-            <td className="hidden xl:table-cell px-3 py-2 whitespace-nowrap border-r border-gray-200 dark:border-gray-700">
-              {primaryContact?.phone ? (
-                <a
-                  href={`tel:${primaryContact.phone}`}
-                  className="text-sm text-gray-900 dark:text-gray-100 hover:text-blue-600 dark:hover:text-blue-400 hover:underline"
-                >
-                  {primaryContact.phone}
-                </a>
-              ) : (
-                <span className="text-sm text-gray-400 dark:text-gray-500">—</span>
-              )}
-            </td>
-          )}
-          {columnVisibility.email && (
-            <td className="hidden xl:table-cell px-3 py-2 border-r border-gray-200 dark:border-gray-700 max-w-[220px]" onClick={(e) => e.stopPropagation()}>
-              {primaryContact?.email ? (
-                <div className="flex items-center gap-2 min-w-0">
-                  <button
-                    onClick={(e) => {
-                      e.stopPropagation()
-                      window.location.href = `mailto:${primaryContact.email}`
-                    }}
-                    className="p-1.5 text-gray-400 hover:text-blue-600 hover:bg-blue-50 rounded transition-colors flex-shrink-0"
-                    title="Send email"
-                  >
-                    <Mail className="h-4 w-4" />
-                  </button>
-                  <a
-                    href={`mailto:${primaryContact.email}`}
-                    className="text-sm text-gray-900 dark:text-gray-100 hover:text-blue-600 dark:hover:text-blue-400 hover:underline truncate block"
-                    title={primaryContact.email}
-                  >
-                    {primaryContact.email}
-                  </a>
-                </div>
-              ) : (
-                <span className="text-sm text-gray-400 dark:text-gray-500">—</span>
-              )}
-            </td>
-          )}
-          {columnVisibility.address && (
-            <td className="hidden 2xl:table-cell px-3 py-2 whitespace-nowrap text-sm text-gray-500 dark:text-gray-400 border-r border-gray-200 dark:border-gray-700">
-              {(() => {
-                const primaryAddress = account.addresses?.find((a) => a.isPrimary) || account.addresses?.[0]
-                return primaryAddress ? (
-                  <div className="flex items-center gap-1">
-                    <MapPin className="h-3 w-3" />
-                    {primaryAddress.city}, {primaryAddress.state}
-                  </div>
-                ) : (
-                  <span className="text-gray-400">No address</span>
-                )
-              })()}
-            </td>
-          )}
-          {columnVisibility.agent && (
-            <td className="hidden lg:table-cell px-3 py-2 whitespace-nowrap border-r border-gray-200 dark:border-gray-700">
-              <span className="text-sm text-gray-900 dark:text-gray-100">
-                {account.salesAgentId || '—'}
-              </span>
-            </td>
-          )}
-          <td className="hidden xl:table-cell px-3 py-2 whitespace-nowrap text-xs text-gray-600 dark:text-gray-400 border-r border-gray-200 dark:border-gray-700">
-            {new Date(account.createdAt).toLocaleDateString('en-US', { year: '2-digit', month: '2-digit', day: '2-digit' })}
-          </td>
-          {columnVisibility.status && (
-            <td className="hidden sm:table-cell px-3 py-2 whitespace-nowrap text-center">
-              {account.active ? (
-                <CheckCircle className="h-5 w-5 text-green-600 mx-auto" />
-              ) : (
-                <XCircle className="h-5 w-5 text-red-600 mx-auto" />
-              )}
-            </td>
-          )}
-        </tr>
-        {expandedAccountId === account.id && (
-          <tr className="bg-gray-50 dark:bg-gray-800">
-            <td colSpan={10} className="px-6 py-4">
-              <div className="grid grid-cols-2 gap-6">
-                {/* Contacts */}
-                <div>
-                  <h4 className="text-sm font-semibold text-gray-900 dark:text-gray-100 mb-3 flex items-center gap-2">
-                    <User className="h-4 w-4" />
-                    Contacts ({account.contacts?.length || 0})
-                  </h4>
-                  {account.contacts && account.contacts.length > 0 ? (
-                    <div className="space-y-2">
-                      {account.contacts.map((contact) => (
-                        <div
-                          key={contact.id}
-                          className="bg-white dark:bg-gray-950 rounded-lg p-3 border border-gray-200 dark:border-gray-700"
-                        >
-                          <div className="flex items-start justify-between mb-1">
-                            <span className="text-sm font-medium text-gray-900 dark:text-gray-100">
-                              {contact.name}
-                            </span>
-                            {contact.isPrimary && (
-                              <span className="inline-flex items-center rounded-full bg-blue-100 px-2 py-0.5 text-xs font-medium text-blue-800">
-                                Primary
-                              </span>
-                            )}
-                          </div>
-                          <div className="space-y-1">
-                            <div className="flex items-center gap-2 text-xs text-gray-600 dark:text-gray-400">
-                              <Mail className="h-3 w-3" />
-                              <a
-                                href={`mailto:${contact.email}`}
-                                className="hover:text-blue-600 dark:hover:text-blue-400"
-                              >
-                                {contact.email}
-                              </a>
-                            </div>
-                            {contact.phone && (
-                              <div className="flex items-center gap-2 text-xs text-gray-600 dark:text-gray-400">
-                                <Phone className="h-3 w-3" />
-                                <a
-                                  href={`tel:${contact.phone}`}
-                                  className="hover:text-blue-600 dark:hover:text-blue-400"
-                                >
-                                  {contact.phone}
-                                </a>
-                              </div>
-                            )}
-                          </div>
-                        </div>
-                      ))}
-                    </div>
-                  ) : (
-                    <p className="text-sm text-gray-500 dark:text-gray-400">No contacts</p>
-                  )}
-                </div>
-
-                {/* Addresses */}
-                <div>
-                  <h4 className="text-sm font-semibold text-gray-900 dark:text-gray-100 mb-3 flex items-center gap-2">
-                    <MapPin className="h-4 w-4" />
-                    Addresses ({account.addresses?.length || 0})
-                  </h4>
-                  {account.addresses && account.addresses.length > 0 ? (
-                    <div className="space-y-2">
-                      {account.addresses.map((address) => (
-                        <div
-                          key={address.id}
-                          className="bg-white dark:bg-gray-950 rounded-lg p-3 border border-gray-200 dark:border-gray-700"
-                        >
-                          <div className="flex items-start justify-between mb-1">
-                            <span className="text-sm font-medium text-gray-900 dark:text-gray-100 capitalize">
-                              {address.type}
-                            </span>
-                            {address.isPrimary && (
-                              <span className="inline-flex items-center rounded-full bg-blue-100 px-2 py-0.5 text-xs font-medium text-blue-800">
-                                Primary
-                              </span>
-                            )}
-                          </div>
-                          <div className="text-xs text-gray-600 dark:text-gray-400 space-y-0.5">
-                            <p>{address.line1}</p>
-                            {address.line2 && <p>{address.line2}</p>}
-                            <p>
-                              {address.city}, {address.state} {address.postalCode}
-                            </p>
-                          </div>
-                        </div>
-                      ))}
-                    </div>
-                  ) : (
-                    <p className="text-sm text-gray-500 dark:text-gray-400">No addresses</p>
-                  )}
-                </div>
-              </div>
-            </td>
-          </tr>
-        )}
-      </React.Fragment>
-    )
-  }
+  const renderAccountRow = (account: Account) => (
+    <AccountRow
+      key={account.id}
+      account={account}
+      columnVisibility={columnVisibility}
+      expanded={expandedAccountId === account.id}
+      details={accountDetails[account.id]}
+      ordersOpen={openOrdersAccountId === account.id}
+      ordersLoading={loadingOrders === account.id}
+      recentOrders={openOrdersAccountId === account.id ? peekRecentOrders(account.id) : undefined}
+      onOpen={handleOpenAccount}
+      onExpandedChange={handleExpandedChange}
+      onToggleOrders={handleToggleOrders}
+      onEmail={handleEmail}
+      onDetailsResize={handleDetailsResize}
+    />
+  )
 
   return (
     <div>
@@ -1664,13 +1882,23 @@ export default function AccountsPage() {
                     )}
                   </tr>
                 </thead>
-                <tbody className="bg-white dark:bg-gray-900">
+                <tbody ref={visibleRows.containerRef} className="bg-white dark:bg-gray-900">
                   {groupByColumn.length > 0 && groupedAccounts ? (
                     // Render grouped accounts with nested groups support
                     renderNestedGroups(groupedAccounts)
                   ) : (
-                    // Render ungrouped accounts
-                    processedAccounts.map(account => renderAccountRow(account))
+                    // Render the window of ungrouped accounts between two spacer rows
+                    <>
+                      {visibleRows.paddingTop > 0 && (
+                        <tr aria-hidden style={{ height: visibleRows.paddingTop }}><td colSpan={10} /></tr>
+                      )}
+                      {processedAccounts
+                        .slice(visibleRows.start, visibleRows.end)
+                        .map(account => renderAccountRow(account))}
+                      {visibleRows.paddingBottom > 0 && (
+                        <tr aria-hidden style={{ height: visibleRows.paddingBottom }}><td colSpan={10} /></tr>
+                      )}
+                    </>
                   )}
                 </tbody>
                 {/* Aggregation Footer */}
@@ -1702,6 +1930,21 @@ export default function AccountsPage() {
                 )}
               </table>
             </div>
+
+            {/* Infinite scroll trigger */}
+            {!isLoading && nextCursor && (
+              <div ref={observerTarget} className="py-4 text-center">
+                {isLoadingMore ? (
+                  <div className="flex items-center justify-center gap-2 text-gray-500">
+                    <div className="animate-spin h-4 w-4 border-2 border-gray-300 border-t-blue-600 rounded-full"></div>
+                    <span className="text-sm">Loading more accounts...</span>
+                  </div>
+                ) : (
+                  <div className="text-sm text-gray-400">Scroll for more</div>
+                )}
+              </div>
+            )}
+
             {processedAccounts.length === 0 && !isLoading && (
               <div className="text-center py-12">
                 <Building2 className="mx-auto h-12 w-12 text-gray-400" />
@@ -1733,55 +1976,6 @@ export default function AccountsPage() {
           onSuccess={handleAccountCreated}
         />
       )}
-
-      {/* Email Compose Modal */}
-      {showEmailModal && emailRecipient && (
-        <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
-          <div className="bg-white dark:bg-gray-900 rounded-lg shadow-xl w-full max-w-2xl mx-4">
-            <div className="flex items-center justify-between p-4 border-b">
-              <h3 className="text-lg font-semibold text-gray-900 dark:text-gray-100">Compose Email</h3>
-              <button
-                onClick={() => setShowEmailModal(false)}
-                className="text-gray-400 hover:text-gray-600 dark:hover:text-gray-300"
-              >
-                ×
-              </button>
-            </div>
-            <div className="p-4 space-y-4">
-              <div>
-                <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">To:</label>
-                <div className="flex items-center gap-2 px-3 py-2 border border-gray-300 dark:border-gray-600 rounded bg-gray-50 dark:bg-gray-800">
-                  <Mail className="h-4 w-4 text-gray-400" />
-                  <span className="text-sm font-medium">{emailRecipient.name}</span>
-                  <span className="text-sm text-gray-500 dark:text-gray-400">&lt;{emailRecipient.email}&gt;</span>
-                </div>
-              </div>
-              <div>
-                <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">Subject:</label>
-                <Input placeholder="Enter subject" />
-              </div>
-              <div>
-                <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">Message:</label>
-                <textarea
-                  className="w-full h-48 px-3 py-2 border rounded resize-none focus:outline-none focus:ring-2 focus:ring-blue-500"
-                  placeholder="Type your message here..."
-                />
-              </div>
-            </div>
-            <div className="flex items-center justify-end gap-2 p-4 border-t">
-              <Button
-                variant="outline"
-                onClick={() => setShowEmailModal(false)}
-              >
-                Cancel
-              </Button>
-              <Button className="bg-blue-600 hover:bg-blue-700">
-                Send Email
-              </Button>
-            </div>
-          </div>
-        </div>
-      )}
     </div>
   )
 }
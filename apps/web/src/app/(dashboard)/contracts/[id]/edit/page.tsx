@@ -7,6 +7,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { ArrowLeft } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface Address {
   id: string
@@ -127,7 +128,7 @@ export default function EditContractPage() {
   const fetchContract = async () => {
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/contracts/${params.id}`, {
+      const res = await fetch(`${getApiUrl()}/api/contracts/${params.id}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -175,7 +176,7 @@ export default function EditContractPage() {
   const fetchAccounts = async () => {
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts?limit=10000`, {
+      const res = await fetch(`${getApiUrl()}/api/accounts?limit=10000&include=`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -193,7 +194,7 @@ export default function EditContractPage() {
   const fetchProducts = async () => {
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products?limit=10000`, {
+      const res = await fetch(`${getApiUrl()}/api/products?limit=10000`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -242,7 +243,7 @@ export default function EditContractPage() {
   const handleSelectSeller = async (account: Account) => {
     // Fetch full account details with addresses
     try {
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${account.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${account.id}`, {
         credentials: 'include',
       })
 
@@ -267,7 +268,7 @@ export default function EditContractPage() {
   const handleSelectBuyer = async (account: Account) => {
     // Fetch full account details with addresses
     try {
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${account.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${account.id}`, {
         credentials: 'include',
       })
 
@@ -366,7 +367,7 @@ export default function EditContractPage() {
         ...formData,
       }
 
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/contracts/${params.id}`, {
+      const res = await fetch(`${getApiUrl()}/api/contracts/${params.id}`, {
         method: 'PUT',
         headers: { 'Content-Type': 'application/json' },
         credentials: 'include',
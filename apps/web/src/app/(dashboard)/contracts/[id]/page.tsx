@@ -7,6 +7,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { ArrowLeft, Mail, Edit, FileText, Calendar, Package, DollarSign, Download, Upload, Trash2, CheckCircle } from 'lucide-react'
 import { EmailContractModal } from '@/components/contracts/email-contract-modal'
+import { getApiUrl } from '@/lib/api'
 
 export default function ContractDetailPage() {
   const params = useParams()
@@ -26,7 +27,7 @@ export default function ContractDetailPage() {
   const fetchContract = async () => {
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/contracts/${params.id}`, {
+      const res = await fetch(`${getApiUrl()}/api/contracts/${params.id}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -48,7 +49,7 @@ export default function ContractDetailPage() {
     setDownloadingPDF(true)
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/pdf/contract/${params.id}`, {
+      const res = await fetch(`${getApiUrl()}/api/pdf/contract/${params.id}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -78,7 +79,7 @@ export default function ContractDetailPage() {
       formData.append('file', file)
 
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/contracts/${params.id}/upload`, {
+      const res = await fetch(`${getApiUrl()}/api/contracts/${params.id}/upload`, {
         method: 'POST',
         credentials: 'include',
         headers: {
@@ -136,7 +137,7 @@ export default function ContractDetailPage() {
 
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/contracts/${params.id}`, {
+      const res = await fetch(`${getApiUrl()}/api/contracts/${params.id}`, {
         method: 'DELETE',
         credentials: 'include',
         headers: {
@@ -157,7 +158,7 @@ export default function ContractDetailPage() {
   const handleMarkComplete = async () => {
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/contracts/${params.id}`, {
+      const res = await fetch(`${getApiUrl()}/api/contracts/${params.id}`, {
         method: 'PUT',
         headers: {
           'Content-Type': 'application/json',
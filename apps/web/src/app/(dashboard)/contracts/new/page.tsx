@@ -7,6 +7,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { ArrowLeft } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface Address {
   id: string
@@ -124,7 +125,7 @@ export default function NewContractPage() {
   const fetchAccounts = async () => {
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts?limit=10000`, {
+      const res = await fetch(`${getApiUrl()}/api/accounts?limit=10000&include=`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -142,7 +143,7 @@ export default function NewContractPage() {
   const fetchProducts = async () => {
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products?limit=10000`, {
+      const res = await fetch(`${getApiUrl()}/api/products?limit=10000`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -191,7 +192,7 @@ export default function NewContractPage() {
   const handleSelectSeller = async (account: Account) => {
     // Fetch full account details with addresses
     try {
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${account.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${account.id}`, {
         credentials: 'include',
       })
 
@@ -216,7 +217,7 @@ export default function NewContractPage() {
   const handleSelectBuyer = async (account: Account) => {
     // Fetch full account details with addresses
     try {
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${account.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${account.id}`, {
         credentials: 'include',
       })
 
@@ -316,7 +317,7 @@ export default function NewContractPage() {
         ...formData,
       }
 
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/contracts`, {
+      const res = await fetch(`${getApiUrl()}/api/contracts`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -8,6 +8,7 @@ import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { DateRangePicker } from '@/components/ui/date-picker'
 import { Plus, Search, Eye, Calendar, Package, DollarSign, ChevronRight, ChevronDown, User, FileText, Filter, FilterX, ArrowUpDown, ArrowUp, ArrowDown } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface Contract {
   id: string
@@ -61,7 +62,7 @@ export default function ContractsPage() {
   const fetchContracts = async () => {
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/contracts`, {
+      const res = await fetch(`${getApiUrl()}/api/contracts`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -8,6 +8,7 @@ import { Input } from '@/components/ui/input'
 import { DateRangePicker } from '@/components/ui/date-picker'
 import { useToast } from '@/components/ui/toast'
 import { Search, ChevronRight, ChevronDown, Receipt, Calendar, DollarSign, User, Package, Menu, Eye, Layers, ArrowUpDown, ArrowUp, ArrowDown, X, Filter, FilterX } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface InvoiceLine {
   id: string
@@ -122,7 +123,7 @@ export default function InvoicesPage() {
       }
       params.append('limit', '1000') // Increase limit to fetch more invoices
 
-      const url = `${process.env.NEXT_PUBLIC_API_URL || ''}/api/invoices${params.toString() ? '?' + params.toString() : ''}`
+      const url = `${getApiUrl()}/api/invoices${params.toString() ? '?' + params.toString() : ''}`
 
       const response = await fetch(url, {
         credentials: 'include',
@@ -25,6 +25,7 @@ import {
   StickyNote,
 } from 'lucide-react'
 import { OrderModals } from './OrderModals'
+import { getApiUrl } from '@/lib/api'
 
 interface ProductVariant {
   id: string
@@ -289,7 +290,7 @@ export default function OrderDetailPage() {
   const fetchAccounts = async () => {
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts?limit=200`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts?limit=200`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -312,7 +313,7 @@ export default function OrderDetailPage() {
   const fetchProducts = async () => {
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products?includeInactive=false&limit=500`, {
+      const response = await fetch(`${getApiUrl()}/api/products?includeInactive=false&limit=500`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -345,7 +346,7 @@ export default function OrderDetailPage() {
       }
 
       // Fetch agents
-      const agentsResponse = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:2000'}/api/agents`, {
+      const agentsResponse = await fetch(`${getApiUrl()}/api/agents`, {
         headers: {
           'Authorization': `Bearer ${token}`,
         },
@@ -361,7 +362,7 @@ export default function OrderDetailPage() {
       }
 
       // Fetch brokers
-      const brokersResponse = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:2000'}/api/brokers`, {
+      const brokersResponse = await fetch(`${getApiUrl()}/api/brokers`, {
         headers: {
           'Authorization': `Bearer ${token}`,
         },
@@ -386,7 +387,7 @@ export default function OrderDetailPage() {
   const fetchTermsOptions = async () => {
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:2000'}/api/terms-options`, {
+      const response = await fetch(`${getApiUrl()}/api/terms-options`, {
         headers: {
           'Authorization': `Bearer ${token}`,
         },
@@ -406,7 +407,7 @@ export default function OrderDetailPage() {
     try {
       setIsLoading(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/orders/${orderId}`, {
+      const response = await fetch(`${getApiUrl()}/api/orders/${orderId}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -564,7 +565,7 @@ export default function OrderDetailPage() {
     try {
       setIsLoadingActivities(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/orders/${orderId}/activities?limit=50`, {
+      const response = await fetch(`${getApiUrl()}/api/orders/${orderId}/activities?limit=50`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -585,7 +586,7 @@ export default function OrderDetailPage() {
   const fetchAttachments = async () => {
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/orders/${orderId}/attachments`, {
+      const response = await fetch(`${getApiUrl()}/api/orders/${orderId}/attachments`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -626,7 +627,7 @@ export default function OrderDetailPage() {
     // Fetch full account details with addresses and contacts
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${account.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${account.id}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -662,7 +663,7 @@ export default function OrderDetailPage() {
     // Fetch full account details with addresses and contacts
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${account.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${account.id}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -907,7 +908,7 @@ export default function OrderDetailPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products`, {
+      const response = await fetch(`${getApiUrl()}/api/products`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -961,7 +962,7 @@ export default function OrderDetailPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/${line.productId}/variants`, {
+      const response = await fetch(`${getApiUrl()}/api/products/${line.productId}/variants`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -1012,7 +1013,7 @@ export default function OrderDetailPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${targetAccount.id}/addresses`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${targetAccount.id}/addresses`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -1085,7 +1086,7 @@ export default function OrderDetailPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${targetAccount.id}/contacts`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${targetAccount.id}/contacts`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -1147,7 +1148,7 @@ export default function OrderDetailPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/agents`, {
+      const response = await fetch(`${getApiUrl()}/api/agents`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -1197,7 +1198,7 @@ export default function OrderDetailPage() {
     try {
       const token = await getToken()
       // Create broker in database
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/brokers`, {
+      const response = await fetch(`${getApiUrl()}/api/brokers`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -1283,7 +1284,7 @@ export default function OrderDetailPage() {
       }
 
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/orders/${orderId}`, {
+      const response = await fetch(`${getApiUrl()}/api/orders/${orderId}`, {
         method: 'PATCH',
         headers: {
           'Content-Type': 'application/json',
@@ -1322,7 +1323,7 @@ export default function OrderDetailPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/quickbooks/sync/order/${orderId}`, {
+      const response = await fetch(`${getApiUrl()}/api/quickbooks/sync/order/${orderId}`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -1367,7 +1368,7 @@ export default function OrderDetailPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/quickbooks/sync/order/${orderId}`, {
+      const response = await fetch(`${getApiUrl()}/api/quickbooks/sync/order/${orderId}`, {
         method: 'PUT',
         headers: {
           'Content-Type': 'application/json',
@@ -1398,7 +1399,7 @@ export default function OrderDetailPage() {
     try {
       setIsGeneratingSellerPDF(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:2000'}/api/pdf/invoice/${orderId}/seller`, {
+      const response = await fetch(`${getApiUrl()}/api/pdf/invoice/${orderId}/seller`, {
         method: 'GET',
         headers: {
           'Authorization': `Bearer ${token}`,
@@ -1432,7 +1433,7 @@ export default function OrderDetailPage() {
     try {
       setIsGeneratingBuyerPDF(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:2000'}/api/pdf/invoice/${orderId}/buyer`, {
+      const response = await fetch(`${getApiUrl()}/api/pdf/invoice/${orderId}/buyer`, {
         method: 'GET',
         headers: {
           'Authorization': `Bearer ${token}`,
@@ -1475,7 +1476,7 @@ export default function OrderDetailPage() {
       formData.append('file', file)
 
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/orders/${orderId}/attachments`, {
+      const response = await fetch(`${getApiUrl()}/api/orders/${orderId}/attachments`, {
         method: 'POST',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -1510,7 +1511,7 @@ export default function OrderDetailPage() {
     try {
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL || ''}/api/orders/${orderId}/attachments/${attachmentId}`,
+        `${getApiUrl()}/api/orders/${orderId}/attachments/${attachmentId}`,
         {
           method: 'DELETE',
           headers: {
@@ -15,6 +15,7 @@ import {
   Save,
   Trash2,
 } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface ProductVariant {
   id: string
@@ -206,7 +207,7 @@ export default function NewOrderPage() {
   const fetchAccounts = async () => {
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts?limit=10000`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts?limit=10000&include=`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -227,7 +228,7 @@ export default function NewOrderPage() {
   const fetchProducts = async () => {
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products?includeInactive=false`, {
+      const response = await fetch(`${getApiUrl()}/api/products?includeInactive=false`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -258,7 +259,7 @@ export default function NewOrderPage() {
       }
 
       // Fetch agents
-      const agentsResponse = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:2000'}/api/agents`, {
+      const agentsResponse = await fetch(`${getApiUrl()}/api/agents`, {
         headers: {
           'Authorization': `Bearer ${token}`,
         },
@@ -274,7 +275,7 @@ export default function NewOrderPage() {
       }
 
       // Fetch brokers
-      const brokersResponse = await fetch(`${process.env.NEXT_PUBLIC_API_URL || 'http://localhost:2000'}/api/brokers`, {
+      const brokersResponse = await fetch(`${getApiUrl()}/api/brokers`, {
         headers: {
           'Authorization': `Bearer ${token}`,
         },
@@ -318,7 +319,7 @@ export default function NewOrderPage() {
     // Fetch full account details with addresses and contacts
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${account.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${account.id}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -354,7 +355,7 @@ export default function NewOrderPage() {
     // Fetch full account details with addresses and contacts
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${account.id}`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${account.id}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -560,7 +561,7 @@ export default function NewOrderPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products`, {
+      const response = await fetch(`${getApiUrl()}/api/products`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -614,7 +615,7 @@ export default function NewOrderPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/${line.productId}/variants`, {
+      const response = await fetch(`${getApiUrl()}/api/products/${line.productId}/variants`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -665,7 +666,7 @@ export default function NewOrderPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${targetAccount.id}/addresses`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${targetAccount.id}/addresses`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -738,7 +739,7 @@ export default function NewOrderPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts/${targetAccount.id}/contacts`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts/${targetAccount.id}/contacts`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -800,7 +801,7 @@ export default function NewOrderPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/agents`, {
+      const response = await fetch(`${getApiUrl()}/api/agents`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -850,7 +851,7 @@ export default function NewOrderPage() {
     try {
       const token = await getToken()
       // Create broker in database
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/brokers`, {
+      const response = await fetch(`${getApiUrl()}/api/brokers`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -935,7 +936,7 @@ export default function NewOrderPage() {
       }
 
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/orders`, {
+      const response = await fetch(`${getApiUrl()}/api/orders`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
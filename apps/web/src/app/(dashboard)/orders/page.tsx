@@ -33,6 +33,7 @@ import {
 } from 'lucide-react'
 import { useRouter } from 'next/navigation'
 import { useToast } from '@/components/ui/toast'
+import { getApiUrl } from '@/lib/api'
 
 interface InvoiceLine {
   id: string
@@ -501,7 +502,7 @@ export default function OrdersPage() {
       }
 
       const token = await getToken()
-      const apiUrl = `${process.env.NEXT_PUBLIC_API_URL}/api/pdf/invoice/${order.id}/${type}`
+      const apiUrl = `${getApiUrl()}/api/pdf/invoice/${order.id}/${type}`
 
       const response = await fetch(apiUrl, {
         method: 'GET',
@@ -535,7 +536,7 @@ export default function OrdersPage() {
 
   const generateSinglePDF = async (orderData: any, type: 'seller' | 'buyer') => {
     const token = await getToken()
-    const apiUrl = `${process.env.NEXT_PUBLIC_API_URL}/api/pdf/order/${type}`
+    const apiUrl = `${getApiUrl()}/api/pdf/order/${type}`
 
     const response = await fetch(apiUrl, {
       method: 'POST',
@@ -596,7 +597,7 @@ export default function OrdersPage() {
       }
 
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/orders`, {
+      const response = await fetch(`${getApiUrl()}/api/orders`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -636,7 +637,7 @@ export default function OrdersPage() {
   const fetchAccounts = async () => {
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts?limit=10000`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts?limit=10000&include=`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -659,7 +660,7 @@ export default function OrdersPage() {
     setError('')
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/orders`, {
+      const response = await fetch(`${getApiUrl()}/api/orders`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
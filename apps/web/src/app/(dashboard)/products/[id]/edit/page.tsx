@@ -9,6 +9,7 @@ import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { useToast } from '@/components/ui/toast'
 import { ArrowLeft, Save, X, Plus, Edit2, Trash2, Star } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface Product {
   id: string
@@ -94,7 +95,7 @@ export default function EditProductPage() {
     setError('')
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/${productId}`, {
+      const response = await fetch(`${getApiUrl()}/api/products/${productId}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -151,7 +152,7 @@ export default function EditProductPage() {
       }
 
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/${productId}`, {
+      const response = await fetch(`${getApiUrl()}/api/products/${productId}`, {
         method: 'PATCH',
         headers: {
           'Content-Type': 'application/json',
@@ -226,7 +227,7 @@ export default function EditProductPage() {
 
       if (editingVariant) {
         // Update existing variant
-        const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/variants/${editingVariant.id}`, {
+        const response = await fetch(`${getApiUrl()}/api/products/variants/${editingVariant.id}`, {
           method: 'PUT',
           headers: {
             'Content-Type': 'application/json',
@@ -243,7 +244,7 @@ export default function EditProductPage() {
         showToast('Variant updated successfully', 'success')
       } else {
         // Create new variant
-        const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/${productId}/variants`, {
+        const response = await fetch(`${getApiUrl()}/api/products/${productId}/variants`, {
           method: 'POST',
           headers: {
             'Content-Type': 'application/json',
@@ -273,7 +274,7 @@ export default function EditProductPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/variants/${variantId}`, {
+      const response = await fetch(`${getApiUrl()}/api/products/variants/${variantId}`, {
         method: 'DELETE',
         credentials: 'include',
         headers: {
@@ -295,7 +296,7 @@ export default function EditProductPage() {
     try {
       const token = await getToken()
       const response = await fetch(
-        `${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/${productId}/variants/${variantId}/set-default`,
+        `${getApiUrl()}/api/products/${productId}/variants/${variantId}/set-default`,
         {
           method: 'POST',
           credentials: 'include',
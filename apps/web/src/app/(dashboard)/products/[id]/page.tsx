@@ -20,6 +20,7 @@ import {
   Star,
   Box,
 } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface Product {
   id: string
@@ -92,7 +93,7 @@ export default function ProductDetailPage() {
     try {
       const token = await getToken()
       // Fetch product details
-      const productResponse = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/${productId}`, {
+      const productResponse = await fetch(`${getApiUrl()}/api/products/${productId}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -110,7 +111,7 @@ export default function ProductDetailPage() {
       }
 
       // Fetch transactions (orders) containing this product
-      const transactionsResponse = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/invoices?productId=${productId}`, {
+      const transactionsResponse = await fetch(`${getApiUrl()}/api/invoices?productId=${productId}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -131,7 +132,7 @@ export default function ProductDetailPage() {
   const fetchUserName = async (userId: string) => {
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/users/${userId}/name`, {
+      const response = await fetch(`${getApiUrl()}/api/users/${userId}/name`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
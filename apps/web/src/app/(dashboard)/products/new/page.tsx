@@ -9,6 +9,7 @@ import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { useToast } from '@/components/ui/toast'
 import { ArrowLeft, Save, X } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 export default function NewProductPage() {
   const router = useRouter()
@@ -57,7 +58,7 @@ export default function NewProductPage() {
       }
 
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products`, {
+      const response = await fetch(`${getApiUrl()}/api/products`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
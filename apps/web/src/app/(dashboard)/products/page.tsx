@@ -9,6 +9,7 @@ import { Input } from '@/components/ui/input'
 import { useToast } from '@/components/ui/toast'
 import { DateRangePicker } from '@/components/ui/date-picker'
 import { Plus, Search, Package, ChevronRight, ChevronDown, ExternalLink, ArrowUpDown, ArrowUp, ArrowDown, Edit2, Trash2, Copy, Menu, Eye, EyeOff, Layers, X, Filter, FilterX, CheckCircle, XCircle } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface ProductVariant {
   id: string
@@ -112,7 +113,7 @@ export default function ProductsPage() {
     try {
       const token = await getToken()
       const includeInactive = !showActiveOnly
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products?includeInactive=${includeInactive}`, {
+      const response = await fetch(`${getApiUrl()}/api/products?includeInactive=${includeInactive}`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -160,7 +161,7 @@ export default function ProductsPage() {
 
     try {
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/products/${productId}`, {
+      const response = await fetch(`${getApiUrl()}/api/products/${productId}`, {
         method: 'DELETE',
         credentials: 'include',
         headers: {
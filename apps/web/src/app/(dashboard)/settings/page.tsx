@@ -22,6 +22,7 @@ import {
 } from 'lucide-react'
 import { OutlookConnectionCard } from '@/components/outlook-connection-card'
 import { UsersManagement } from '@/components/settings/users-management'
+import { getApiUrl } from '@/lib/api'
 
 interface QuickBooksStatus {
   connected: boolean
@@ -55,7 +56,7 @@ export default function SettingsPage() {
     try {
       setQbLoading(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/quickbooks/status`, {
+      const response = await fetch(`${getApiUrl()}/api/quickbooks/status`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -77,7 +78,7 @@ export default function SettingsPage() {
 
   const handleQuickBooksConnect = async () => {
     const token = await getToken()
-    const connectUrl = `${process.env.NEXT_PUBLIC_API_URL || ''}/api/quickbooks/connect?token=${token}`
+    const connectUrl = `${getApiUrl()}/api/quickbooks/connect?token=${token}`
 
     // Open in popup window
     const width = 600
@@ -105,7 +106,7 @@ export default function SettingsPage() {
     try {
       setQbLoading(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/quickbooks/disconnect`, {
+      const response = await fetch(`${getApiUrl()}/api/quickbooks/disconnect`, {
         method: 'POST',
         credentials: 'include',
         headers: {
@@ -7,8 +7,9 @@ import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { Label } from '@/components/ui/label'
 import { Plus, Edit2, Trash2, Check, X, Loader2 } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
-const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || ''
+const API_BASE_URL = getApiUrl()
 
 interface PaymentTerm {
   id: string
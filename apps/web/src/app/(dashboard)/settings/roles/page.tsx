@@ -4,6 +4,7 @@ import { useState, useEffect } from 'react'
 import { useAuth } from '@clerk/nextjs'
 import { Shield, Save } from 'lucide-react'
 import { useToast } from '@/components/ui/toast'
+import { getApiUrl } from '@/lib/api'
 
 export default function RolesManagementPage() {
   const { getToken } = useAuth()
@@ -17,7 +18,7 @@ export default function RolesManagementPage() {
 
   const fetchRoles = async () => {
     const token = await getToken()
-    const apiUrl = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_URL || ''
+    const apiUrl = getApiUrl()
     const res = await fetch(apiUrl + '/api/roles', {
       credentials: 'include',
       headers: {
@@ -30,7 +31,7 @@ export default function RolesManagementPage() {
 
   const fetchPermissions = async () => {
     const token = await getToken()
-    const apiUrl = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_URL || ''
+    const apiUrl = getApiUrl()
     const res = await fetch(apiUrl + '/api/permissions', {
       credentials: 'include',
       headers: {
@@ -42,7 +43,7 @@ export default function RolesManagementPage() {
 
   const fetchRoleDetails = async (roleId: string) => {
     const token = await getToken()
-    const apiUrl = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_URL || ''
+    const apiUrl = getApiUrl()
     const res = await fetch(apiUrl + '/api/roles/' + roleId, {
       credentials: 'include',
       headers: {
@@ -62,7 +63,7 @@ export default function RolesManagementPage() {
   const save = async () => {
     if (!selectedRole) return
     const token = await getToken()
-    const apiUrl = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_URL || ''
+    const apiUrl = getApiUrl()
     try {
       await fetch(apiUrl + '/api/roles/' + selectedRole.id + '/permissions', {
         method: 'POST',
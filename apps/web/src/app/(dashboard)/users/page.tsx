@@ -3,6 +3,7 @@
 import { useState, useEffect } from 'react'
 import { useUser, useAuth } from '@clerk/nextjs'
 import { Users, Search, UserPlus, Mail, Shield, Calendar, X, Loader2 } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface User {
   id: string
@@ -64,7 +65,7 @@ export default function UsersPage() {
     try {
       setLoading(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/users`, {
+      const response = await fetch(`${getApiUrl()}/api/users`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
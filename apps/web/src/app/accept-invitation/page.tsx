@@ -10,8 +10,9 @@ import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { Label } from '@/components/ui/label'
 import { UserPlus, Eye, EyeOff, Loader2, CheckCircle2, Shield, AlertCircle } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
-const API_URL = process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_URL || ''
+const API_URL = getApiUrl()
 
 function AcceptInvitationContent() {
   const router = useRouter()
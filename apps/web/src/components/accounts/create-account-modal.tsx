@@ -5,6 +5,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { X, Plus, Trash2, User, MapPin, Save } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface Contact {
   id: string
@@ -171,7 +172,7 @@ export function CreateAccountModal({ onClose, onSuccess }: CreateAccountModalPro
           })),
       }
 
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_URL || ''}/api/accounts`, {
+      const response = await fetch(`${getApiUrl()}/api/accounts`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
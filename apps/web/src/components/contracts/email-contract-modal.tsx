@@ -7,6 +7,7 @@ import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
 import { Label } from '@/components/ui/label'
 import { X, Mail, Loader2, CheckCircle2, XCircle } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface Contract {
   id: string
@@ -62,7 +63,7 @@ export function EmailContractModal({ contract, onClose, onSuccess }: EmailContra
 
     try {
       const token = await getToken()
-      const res = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/contracts/${contract.id}/email`, {
+      const res = await fetch(`${getApiUrl()}/api/contracts/${contract.id}/email`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
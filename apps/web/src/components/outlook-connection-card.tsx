@@ -4,6 +4,7 @@ import { useState, useEffect } from 'react'
 import { useAuth } from '@clerk/nextjs'
 import { Button } from './ui/button'
 import { Loader2, Mail, CheckCircle2, XCircle, AlertCircle } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface OutlookStatus {
   connected: boolean
@@ -35,7 +36,7 @@ export function OutlookConnectionCard() {
     try {
       setLoading(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/outlook/status`, {
+      const response = await fetch(`${getApiUrl()}/api/outlook/status`, {
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
         },
@@ -57,7 +58,7 @@ export function OutlookConnectionCard() {
 
   const handleConnect = async () => {
     const token = await getToken()
-    const connectUrl = `${process.env.NEXT_PUBLIC_API_URL || ''}/api/outlook/connect`
+    const connectUrl = `${getApiUrl()}/api/outlook/connect`
 
     // Open in popup window
     const width = 600
@@ -80,7 +81,7 @@ export function OutlookConnectionCard() {
     try {
       setLoading(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/outlook/disconnect`, {
+      const response = await fetch(`${getApiUrl()}/api/outlook/disconnect`, {
         method: 'DELETE',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
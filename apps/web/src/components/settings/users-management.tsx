@@ -4,6 +4,7 @@ import { useState, useEffect } from 'react'
 import { useAuth } from '@clerk/nextjs'
 import { Button } from '@/components/ui/button'
 import { Loader2, User } from 'lucide-react'
+import { getApiUrl } from '@/lib/api'
 
 interface UserData {
   id: string
@@ -41,7 +42,7 @@ export function UsersManagement() {
     try {
       setLoading(true)
       const token = await getToken()
-      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL || ''}/api/users`, {
+      const response = await fetch(`${getApiUrl()}/api/users`, {
         credentials: 'include',
         headers: {
           ...(token && { Authorization: `Bearer ${token}` }),
@@ -1,7 +1,8 @@
 import { useAuth } from '@clerk/nextjs'
 import { useCallback } from 'react'
+import { getApiUrl } from '@/lib/api'
 
-const API_URL = process.env.NEXT_PUBLIC_API_URL || ''
+const API_URL = getApiUrl()
 
 export function useApi() {
   const { getToken } = useAuth()
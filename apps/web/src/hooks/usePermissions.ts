@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react'
 import { useAuth } from '@clerk/nextjs'
+import { getApiUrl } from '@/lib/api'
 
 export function useUserRole() {
   const { getToken } = useAuth()
@@ -11,7 +12,7 @@ export function useUserRole() {
     const fetchRole = async () => {
       try {
         const token = await getToken()
-        const res = await fetch((process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_URL || '') + '/api/me/role', {
+        const res = await fetch(getApiUrl() + '/api/me/role', {
           credentials: 'include',
           headers: {
             ...(token && { Authorization: `Bearer ${token}` }),
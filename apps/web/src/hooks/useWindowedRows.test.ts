@@ -0,0 +1,27 @@
+import { rowAt, rowTop } from './useWindowedRows'
+
+describe('windowed row geometry', () => {
+  // Row 3 is expanded by 200px
+  const extras: [number, number][] = [[3, 200]]
+
+  it('places rows after a taller row further down', () => {
+    expect(rowTop(3, 50, extras)).toBe(150)
+    expect(rowTop(4, 50, extras)).toBe(400)
+    expect(rowTop(10, 50, [])).toBe(500)
+  })
+
+  it('finds the row under a point', () => {
+    expect(rowAt(149, 50, extras)).toBe(2)
+    expect(rowAt(150, 50, extras)).toBe(3)
+    expect(rowAt(399, 50, extras)).toBe(3) // inside the detail row
+    expect(rowAt(400, 50, extras)).toBe(4)
+    expect(rowAt(1000, 50, extras)).toBe(16)
+  })
+
+  it('agrees with rowTop', () => {
+    const many: [number, number][] = [[2, 30], [5, 120], [9, 10]]
+    for (let index = 0; index < 15; index++) {
+      expect(rowAt(rowTop(index, 40, many), 40, many)).toBe(index)
+    }
+  })
+})
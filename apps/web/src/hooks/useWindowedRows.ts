@@ -0,0 +1,104 @@
+import { useState, useEffect, useRef, useCallback, useMemo } from 'react'
+
+interface WindowedRowsOptions {
+  rowHeight?: number // estimated height of one row in px
+  overscan?: number // rows mounted above and below the viewport
+  enabled?: boolean
+  // px that row i takes beyond rowHeight (an expanded detail row, say)
+  extraHeights?: ReadonlyMap<number, number>
+}
+
+// [row index, extra px] pairs in row order; only a few rows are ever taller
+type RowExtras = [number, number][]
+
+// Top of row `index`, in px below the top of the first row
+export function rowTop(index: number, rowHeight: number, extras: RowExtras): number {
+  let top = index * rowHeight
+  for (const [row, extra] of extras) {
+    if (row >= index) break
+    top += extra
+  }
+  return top
+}
+
+// Index of the row covering the point `y` px below the top of the first row
+export function rowAt(y: number, rowHeight: number, extras: RowExtras): number {
+  let skipped = 0 // extra px of the taller rows above
+  for (const [row, extra] of extras) {
+    const top = row * rowHeight + skipped
+    if (y < top) break
+    if (y < top + rowHeight + extra) return row
+    skipped += extra
+  }
+  return Math.floor((y - skipped) / rowHeight)
+}
+
+// Windowed rendering for long tables that scroll with the page.
+// Attach `containerRef` to the <tbody>, render rows[start..end) and pad the
+// rest with spacer rows of `paddingTop` / `paddingBottom` px, so the table
+// (and anything below it, like an infinite-scroll sentinel) keeps its full height.
+// Rows are `rowHeight` tall unless `extraHeights` says otherwise.
+export function useWindowedRows(
+  count: number,
+  { rowHeight = 53, overscan = 10, enabled = true, extraHeights }: WindowedRowsOptions = {}
+) {
+  const containerRef = useRef<HTMLTableSectionElement>(null)
+  const [range, setRange] = useState({ start: 0, end: 40 })
+  const extras = useMemo<RowExtras>(
+    () => (extraHeights ? [...extraHeights].sort((a, b) => a[0] - b[0]) : []),
+    [extraHeights]
+  )
+
+  const update = useCallback(() => {
+    const container = containerRef.current
+    if (!container) return
+
+    // Distance the viewport has scrolled past the top of the rows
+    const offset = -container.getBoundingClientRect().top
+    const start = Math.max(0, rowAt(offset, rowHeight, extras) - overscan)
+    const end = rowAt(offset + window.innerHeight, rowHeight, extras) + 1 + overscan
+
+    setRange(prev => (prev.start === start && prev.end === end ? prev : { start, end }))
+  }, [rowHeight, overscan, extras])
+
+  useEffect(() => {
+    if (!enabled) return
+
+    let frame = 0
+    const onScroll = () => {
+      if (frame) return
+      frame = requestAnimationFrame(() => {
+        frame = 0
+        update()
+      })
+    }
+
+    update()
+    window.addEventListener('scroll', onScroll, { passive: true })
+    window.addEventListener('resize', onScroll)
+    return () => {
+      cancelAnimationFrame(frame)
+      window.removeEventListener('scroll', onScroll)
+      window.removeEventListener('resize', onScroll)
+    }
+  }, [enabled, update])
+
+  // Rows appended or filtered away, or a row changing height, can move the window
+  useEffect(() => {
+    if (enabled) update()
+  }, [count, enabled, update])
+
+  if (!enabled) {
+    return { containerRef, start: 0, end: count, paddingTop: 0, paddingBottom: 0 }
+  }
+
+  const start = Math.min(range.start, count)
+  const end = Math.min(range.end, count)
+  return {
+    containerRef,
+    start,
+    end,
+    paddingTop: rowTop(start, rowHeight, extras),
+    paddingBottom: rowTop(count, rowHeight, extras) - rowTop(end, rowHeight, extras),
+  }
+}
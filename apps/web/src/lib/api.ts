@@ -1,5 +1,5 @@
 export const getApiUrl = () => {
-  return process.env.NEXT_PUBLIC_API_URL || process.env.NEXT_PUBLIC_API_URL || ''
+  return process.env.NEXT_PUBLIC_API_URL || ''
 }
 
 export const apiFetch = async (endpoint: string, options?: RequestInit) => {
@@ -0,0 +1,46 @@
+interface Entry<V> {
+  value: V
+  storedAt: number
+}
+
+// Bounded cache with least-recently-used eviction and a per-entry time to live.
+// A Map iterates in insertion order, so re-inserting on every hit keeps the
+// least recently used key first and eviction is O(1).
+// Expired entries are still returned, flagged `stale`, so callers can show
+// them while they revalidate.
+export class LruCache<V> {
+  private entries = new Map<string, Entry<V>>()
+
+  constructor(private maxEntries: number, private ttlMs: number) {}
+
+  get size() {
+    return this.entries.size
+  }
+
+  get(key: string): { value: V; stale: boolean } | undefined {
+    const entry = this.entries.get(key)
+    if (!entry) return undefined
+
+    this.entries.delete(key)
+    this.entries.set(key, entry)
+    return { value: entry.value, stale: Date.now() - entry.storedAt > this.ttlMs }
+  }
+
+  set(key: string, value: V) {
+    this.entries.delete(key)
+    this.entries.set(key, { value, storedAt: Date.now() })
+
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string
+      this.entries.delete(oldest)
+    }
+  }
+
+  delete(key: string) {
+    this.entries.delete(key)
+  }
+
+  clear() {
+    this.entries.clear()
+  }
+}
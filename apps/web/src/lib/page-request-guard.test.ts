@@ -0,0 +1,58 @@
+import { PageRequestGuard } from './page-request-guard'
+
+describe('PageRequestGuard', () => {
+  it('drops the response of a reset superseded by another', () => {
+    const guard = new PageRequestGuard()
+    const first = guard.beginReset('a')
+    const second = guard.beginReset('b')
+    expect(guard.isCurrent(first)).toBe(false)
+    expect(guard.isCurrent(second)).toBe(true)
+  })
+
+  it('lets an append continue the current page without replacing it', () => {
+    const guard = new PageRequestGuard()
+    guard.end(guard.beginReset('a'))
+    const append = guard.beginAppend('a')
+    expect(append).not.toBeNull()
+    expect(guard.isCurrent(append!)).toBe(true)
+  })
+
+  it('refuses appends while a reset is loading', () => {
+    const guard = new PageRequestGuard()
+    guard.end(guard.beginReset('a'))
+    const reset = guard.beginReset('b')
+    // An observer still holding the old filters, then one with the new ones
+    expect(guard.beginAppend('a')).toBeNull()
+    expect(guard.beginAppend('b')).toBeNull()
+    expect(guard.isCurrent(reset)).toBe(true)
+  })
+
+  it('refuses appends built from a query that is no longer current', () => {
+    const guard = new PageRequestGuard()
+    guard.end(guard.beginReset('a'))
+    guard.end(guard.beginReset('b'))
+    expect(guard.beginAppend('a')).toBeNull()
+    expect(guard.beginAppend('b')).not.toBeNull()
+  })
+
+  it('loads one page at a time', () => {
+    const guard = new PageRequestGuard()
+    guard.end(guard.beginReset('a'))
+    const append = guard.beginAppend('a')!
+    expect(guard.beginAppend('a')).toBeNull()
+    guard.end(append)
+    expect(guard.beginAppend('a')).not.toBeNull()
+  })
+
+  it('drops an append overtaken by a reset, and its end leaves the reset loading', () => {
+    const guard = new PageRequestGuard()
+    guard.end(guard.beginReset('a'))
+    const append = guard.beginAppend('a')!
+    const reset = guard.beginReset('b')
+    expect(guard.isCurrent(append)).toBe(false)
+    guard.end(append)
+    expect(guard.beginAppend('b')).toBeNull()
+    guard.end(reset)
+    expect(guard.beginAppend('b')).not.toBeNull()
+  })
+})
@@ -0,0 +1,41 @@
+// Orders the requests of an infinitely scrolled list whose query (filters,
+// sort) can change while pages are in flight.
+//
+// A reset loads the first page of a query and starts a new generation, so a
+// response from an older one is dropped. An append continues the current
+// generation without replacing it: it can't make a reset's response look
+// stale, and it isn't started at all while a reset is loading, while another
+// page is loading, or when the query it was built from is no longer current
+// (an observer callback holding old filters and an old cursor, say).
+export class PageRequestGuard {
+  private generation = 0
+  private query: string | null = null
+  private resetting = false
+  private appending = false
+
+  beginReset(query: string): number {
+    this.query = query
+    this.resetting = true
+    this.appending = false
+    return ++this.generation
+  }
+
+  // null when the next page of `query` must not be requested now
+  beginAppend(query: string): number | null {
+    if (this.resetting || this.appending || query !== this.query) return null
+    this.appending = true
+    return this.generation
+  }
+
+  // Whether the outcome of a request from `generation` may still be applied
+  isCurrent(generation: number): boolean {
+    return generation === this.generation
+  }
+
+  // Call once a request settles, whatever its outcome
+  end(generation: number) {
+    if (generation !== this.generation) return
+    this.resetting = false
+    this.appending = false
+  }
+}
@@ -0,0 +1,73 @@
+import { getApiUrl } from '@/lib/api'
+import { LruCache } from '@/lib/lru-cache'
+
+// Recent invoices per account for the orders popups, shared by every
+// dashboard page for the lifetime of the tab (module state survives
+// client-side navigation).
+
+export interface RecentOrders {
+  orders: any[]
+}
+
+const MAX_ACCOUNTS = 2000
+const TTL_MS = 2 * 60 * 1000
+
+const cache = new LruCache<RecentOrders>(MAX_ACCOUNTS, TTL_MS)
+const inflight = new Map<string, Promise<void>>()
+const listeners = new Set<() => void>()
+
+// Cached entry for an account, fresh or stale; never fetches
+export function peekRecentOrders(accountId: string): RecentOrders | undefined {
+  return cache.get(accountId)?.value
+}
+
+// Called whenever fetched data lands in the cache; returns an unsubscribe
+export function subscribeRecentOrders(listener: () => void): () => void {
+  listeners.add(listener)
+  return () => {
+    listeners.delete(listener)
+  }
+}
+
+// Fetch, in one batch request, every account that is missing or stale and not
+// already being fetched. Resolves once all of `accountIds` are settled.
+export function loadRecentOrders(accountIds: string[], getToken: () => Promise<string | null>): Promise<void> {
+  const ids = [...new Set(accountIds)].filter(id => {
+    if (inflight.has(id)) return false
+    const cached = cache.get(id)
+    return !cached || cached.stale
+  })
+
+  if (ids.length > 0) {
+    const request = fetchBatch(ids, getToken).finally(() => {
+      ids.forEach(id => inflight.delete(id))
+    })
+    ids.forEach(id => inflight.set(id, request))
+  }
+
+  return Promise.all(accountIds.map(id => inflight.get(id))).then(() => undefined)
+}
+
+async function fetchBatch(ids: string[], getToken: () => Promise<string | null>) {
+  try {
+    const token = await getToken()
+    const response = await fetch(`${getApiUrl()}/api/invoices/recent?accountIds=${ids.join(',')}&limit=5`, {
+      credentials: 'include',
+      headers: {
+        ...(token && { Authorization: `Bearer ${token}` }),
+      },
+    })
+
+    if (!response.ok) {
+      throw new Error('Failed to fetch recent orders')
+    }
+
+    const data: { [accountId: string]: any[] } = await response.json()
+    Object.entries(data).forEach(([accountId, orders]) => {
+      cache.set(accountId, { orders })
+    })
+    listeners.forEach(listener => listener())
+  } catch (err) {
+    console.error('Fetch orders error:', err)
+  }
+}
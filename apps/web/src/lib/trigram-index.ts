@@ -0,0 +1,72 @@
+// Inverted index from 3-character grams to the documents containing them.
+// Documents are numbered in the order they are added, so every posting list
+// is sorted and a substring query is a merge-intersection of a few lists.
+export class TrigramIndex {
+  private postings = new Map<string, number[]>()
+  private texts: string[] = []
+
+  get size() {
+    return this.texts.length
+  }
+
+  // Index `text` (already normalized by the caller) and return its document id
+  add(text: string): number {
+    const id = this.texts.length
+    this.texts.push(text)
+
+    const seen = new Set<string>()
+    for (let i = 0; i + 3 <= text.length; i++) {
+      const gram = text.slice(i, i + 3)
+      if (seen.has(gram)) continue
+      seen.add(gram)
+
+      const list = this.postings.get(gram)
+      if (list) {
+        list.push(id)
+      } else {
+        this.postings.set(gram, [id])
+      }
+    }
+    return id
+  }
+
+  // Ids of documents containing `term`, in ascending order.
+  // Returns null for terms shorter than a trigram; callers fall back to a scan.
+  search(term: string): number[] | null {
+    if (term.length < 3) return null
+
+    const lists: number[][] = []
+    for (let i = 0; i + 3 <= term.length; i++) {
+      const list = this.postings.get(term.slice(i, i + 3))
+      if (!list) return []
+      lists.push(list)
+    }
+    lists.sort((a, b) => a.length - b.length)
+
+    let candidates = lists[0]
+    for (let k = 1; k < lists.length && candidates.length > 0; k++) {
+      candidates = intersect(candidates, lists[k])
+    }
+
+    // Every gram matched, but not necessarily contiguously
+    return candidates.filter(id => this.texts[id].includes(term))
+  }
+}
+
+function intersect(a: number[], b: number[]): number[] {
+  const result: number[] = []
+  let i = 0
+  let j = 0
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      result.push(a[i])
+      i++
+      j++
+    } else if (a[i] < b[j]) {
+      i++
+    } else {
+      j++
+    }
+  }
+  return result
+}
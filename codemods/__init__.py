@@ -0,0 +1,94 @@
+"""Batch runner for the top-level ``*.py`` patch scripts.
+
+Usage (from the repo root)::
+
+    python -m codemods                 # replay every script in the manifest
+    python -m codemods --dry-run       # report only, write nothing
+    python -m codemods --no-cache      # rescan even scripts known to be applied
+    python -m codemods --no-ledger     # also replay scripts recorded in applied.json
+    python -m codemods -j 1            # run target files serially
+    python -m codemods --plan          # list patch ranges and conflicts only
+    python -m codemods --trace t.json  # per-patch Chrome trace (or t.jsonl)
+    python -m codemods add-sort-filter fix-nested-links
+    python -m codemods.bench           # scaling benchmark with regression gate
+    python -m codemods.api_urls        # route API base URLs through getApiUrl()
+"""
+from .cache import CACHE_FILE, ResultCache, content_hash
+from .intervals import IntervalTree
+from .ledger import LEDGER_FILE, AppliedLedger
+from .locks import file_lock, file_locks
+from .manifest import REPO_ROOT, SCRIPTS, load_manifest
+from .matcher import AnchorIndex, AnchorNotFound, splice
+from .planner import Conflict, Dependency, PatchConflict, PatchRange, Plan, pending_offsets, plan_target
+from .runner import (
+    ALREADY_APPLIED,
+    APPLIED,
+    RECORDED,
+    ConcurrentModification,
+    FileResult,
+    PatchResult,
+    apply_script,
+    default_jobs,
+    group_by_target,
+    run_batch,
+    run_file,
+    write_file,
+)
+from .script import Patch, Script, ScriptError, load_script
+from .structural import find_structural, replace_structural, tokenize
+from .trace import chrome_trace, patch_events, write_jsonl, write_trace
+from .tsx import Document, Node, NodeNotFound, ParseError, SyntaxTree, parse_outline, replace_node
+
+__all__ = [
+    'ALREADY_APPLIED',
+    'APPLIED',
+    'CACHE_FILE',
+    'LEDGER_FILE',
+    'RECORDED',
+    'REPO_ROOT',
+    'SCRIPTS',
+    'AnchorIndex',
+    'AnchorNotFound',
+    'AppliedLedger',
+    'ConcurrentModification',
+    'Conflict',
+    'Dependency',
+    'Document',
+    'FileResult',
+    'IntervalTree',
+    'Node',
+    'NodeNotFound',
+    'ParseError',
+    'Patch',
+    'PatchConflict',
+    'PatchRange',
+    'PatchResult',
+    'Plan',
+    'ResultCache',
+    'Script',
+    'ScriptError',
+    'SyntaxTree',
+    'apply_script',
+    'chrome_trace',
+    'content_hash',
+    'default_jobs',
+    'file_lock',
+    'file_locks',
+    'find_structural',
+    'group_by_target',
+    'load_manifest',
+    'load_script',
+    'parse_outline',
+    'patch_events',
+    'pending_offsets',
+    'plan_target',
+    'replace_node',
+    'replace_structural',
+    'run_batch',
+    'run_file',
+    'splice',
+    'tokenize',
+    'write_file',
+    'write_jsonl',
+    'write_trace',
+]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from .cache import ResultCache
+from .ledger import AppliedLedger
+from .manifest import REPO_ROOT, load_manifest
+from .matcher import AnchorNotFound
+from .planner import PatchConflict, plan_target
+from .runner import APPLIED, RECORDED, ConcurrentModification, FileResult, group_by_target, run_batch
+from .trace import write_trace
+
+
+def _ms(ns: int) -> str:
+    return f'{ns / 1e6:8.3f} ms'
+
+
+def print_report(results: list[FileResult], dry_run: bool) -> None:
+    for file_result in results:
+        print(f'\n{file_result.target}')
+        print(f'  read  {_ms(file_result.read_ns)}')
+        if file_result.plan is not None:
+            print(f'  plan  {_ms(file_result.plan.elapsed_ns)}  ({len(file_result.plan.ranges)} ranges)')
+        print(f'  scan  {_ms(file_result.scan_ns)}')
+        if file_result.parses:
+            print(f'  parsed {file_result.parses}x (syntax tree shared by later scripts)')
+        for patch in file_result.patches:
+            where = f'@{patch.offset}' if patch.offset is not None else ''
+            if patch.cached:
+                status = f'{patch.status}, cached'
+            elif patch.status == RECORDED:
+                status = patch.status
+            else:
+                status = f'{patch.status}, {patch.matches} match'
+            if patch.scanned:
+                status += f', {patch.scanned} B scanned'
+            print(f'  {_ms(patch.elapsed_ns)}  {patch.script}:{patch.patch}{where}  ({status})')
+        if file_result.changed:
+            action = 'would write' if dry_run else 'write'
+            print(f'  {action} {_ms(file_result.write_ns)}')
+        else:
+            print('  unchanged')
+
+    patches = [p for r in results for p in r.patches]
+    applied = sum(p.status == APPLIED for p in patches)
+    total_ns = sum(r.read_ns + r.scan_ns + r.write_ns + sum(p.elapsed_ns for p in r.patches) for r in results)
+    print(f'\n{len(results)} files, {applied}/{len(patches)} patches applied in {_ms(total_ns).strip()}')
+
+
+def print_plans(scripts, root: Path, ledger: AppliedLedger | None = None) -> int:
+    conflicts = 0
+    for target, group in group_by_target(scripts).items():
+        recorded = [script.name for script in group if ledger is not None and ledger.is_applied(script)]
+        group = [script for script in group if script.name not in recorded]
+        if not group:
+            print(f'\n{target}  (every script {RECORDED})')
+            continue
+        plan = plan_target((root / target).read_text(encoding='utf-8'), target, group)
+        print(f'\n{target}  ({len(plan.ranges)} ranges, {_ms(plan.elapsed_ns).strip()})')
+        for patch_range in plan.ranges:
+            print(f'  {patch_range}')
+        for dependency in plan.dependencies:
+            print(f'  {dependency.script}:{dependency.patch} runs on text added by {dependency.after}')
+        for name in plan.missing:
+            print(f'  {name}: anchor not found')
+        for conflict in plan.conflicts:
+            print(f'  CONFLICT {conflict}')
+        if plan.applied:
+            print('  already applied')
+        conflicts += len(plan.conflicts)
+    return 1 if conflicts else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m codemods', description=__doc__)
+    parser.add_argument('scripts', nargs='*', help='script names to run (default: whole manifest)')
+    parser.add_argument('--root', type=Path, default=REPO_ROOT, help='repository root')
+    parser.add_argument('--dry-run', action='store_true', help='apply in memory only')
+    parser.add_argument('--no-cache', action='store_true', help='ignore the result cache')
+    parser.add_argument('--plan', action='store_true', help='only report patch ranges, dependencies and conflicts')
+    parser.add_argument('--no-check', action='store_true', help='skip the conflict check before applying')
+    parser.add_argument('--no-ledger', action='store_true',
+                        help='also replay scripts that codemods/applied.json records as applied')
+    parser.add_argument('--trace', type=Path, metavar='FILE',
+                        help='write per-patch events: *.jsonl for JSON lines, otherwise a Chrome trace')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='worker processes (default: one per target file, up to the CPU count)')
+    args = parser.parse_args(argv)
+
+    scripts = load_manifest(args.root, args.scripts)
+    ledger = None if args.no_ledger else AppliedLedger.for_root(args.root)
+    if args.plan:
+        return print_plans(scripts, args.root, ledger)
+    cache = None if args.no_cache else ResultCache.for_root(args.root)
+    try:
+        results = run_batch(scripts, args.root, dry_run=args.dry_run, cache=cache, jobs=args.jobs,
+                            check=not args.no_check, ledger=ledger)
+    except (AnchorNotFound, ConcurrentModification, PatchConflict) as exc:
+        print(f'error: {exc} (nothing was written)', file=sys.stderr)
+        return 1
+    print_report(results, args.dry_run)
+    if args.trace:
+        write_trace(args.trace, results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
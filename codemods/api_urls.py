@@ -0,0 +1,170 @@
+"""Route every hard-coded API base URL in the frontends through ``getApiUrl()``.
+
+Usage (from the repo root)::
+
+    python -m codemods.api_urls              # rewrite apps/web and apps/sales
+    python -m codemods.api_urls --dry-run    # list what would change
+
+Over time the patch scripts injected three spellings of the API base:
+``fetch('http://localhost:2000/...')``, ``process.env.NEXT_PUBLIC_API_URL ||
+'http://localhost:2000'`` and ``process.env.NEXT_PUBLIC_API_URL || ''``.  This
+tool replaces each with a call to ``getApiUrl()`` from the app's shared client
+module (``src/lib/api.ts``, created when missing) and adds the import.
+
+Files are checked in a worker pool.  A worker first looks for the two needle
+byte strings in the raw bytes and only decodes and rewrites files that contain
+one, so a full-tree pass is dominated by reading the files.  Guards such as
+``if (!process.env.NEXT_PUBLIC_API_URL)`` are left alone.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .manifest import REPO_ROOT
+
+APPS = ('apps/web', 'apps/sales')
+API_MODULE = 'src/lib/api.ts'
+API_IMPORT = "import { getApiUrl } from '@/lib/api'"
+API_MODULE_SOURCE = """\
+export const getApiUrl = () => {
+  return process.env.NEXT_PUBLIC_API_URL || ''
+}
+
+export const apiFetch = async (endpoint: string, options?: RequestInit) => {
+  const url = getApiUrl() + endpoint
+  return fetch(url, {
+    credentials: 'include',
+    ...options,
+  })
+}
+"""
+
+_NEEDLES = (b'localhost:2000', b'NEXT_PUBLIC_API_URL')
+_SUFFIXES = {'.ts', '.tsx', '.js', '.jsx'}
+_SKIP_DIRS = {'node_modules', '.next', '.turbo', 'dist'}
+
+_FALLBACK = r"""(?:process\.env\.NEXT_PUBLIC_API_URL|''|""|'http://localhost:2000'|"http://localhost:2000")"""
+# The env var with any chain of ``||`` fallbacks to itself, '' or the dev server
+_ENV = re.compile(r'(?<![!\w.])process\.env\.NEXT_PUBLIC_API_URL(?:\s*\|\|\s*' + _FALLBACK + r')*')
+# A string or template literal that starts with the dev server origin
+_LITERAL = re.compile(r"""(['"`])http://localhost:2000(?=[/?'"`])((?:\\.|(?!\1)[^\\\n])*)\1""")
+# ``(process.env... || '') + '/x'`` leaves grouping parentheses (not a call: no callee before them)
+_GROUPED = re.compile(r'(?<![\w\])])\(getApiUrl\(\)\)(?=\s*\+)')
+_IMPORT = re.compile(r"""^import\s+(?:[\w*{}\s,]+?\s+from\s+)?['"]([^'"]+)['"];?[ \t]*$""", re.M)
+_API_IMPORT = re.compile(r"""^import\s*\{([^}]*)\}\s*from\s*['"]@/lib/api['"]""", re.M)
+
+
+def _literal(match: re.Match) -> str:
+    quote, rest = match.groups()
+    if quote != '`':
+        rest = rest.replace('`', '\\`').replace('${', '\\${')
+    return f'`${{getApiUrl()}}{rest}`'
+
+
+def _add_import(text: str) -> str:
+    existing = _API_IMPORT.search(text)
+    if existing:
+        names = [name.strip() for name in existing.group(1).split(',') if name.strip()]
+        if 'getApiUrl' in names:
+            return text
+        merged = 'import { ' + ', '.join(['getApiUrl'] + names) + " } from '@/lib/api'"
+        return text[:existing.start()] + merged + text[existing.end():]
+
+    imports = list(_IMPORT.finditer(text))
+    if imports:
+        at = imports[-1].end()
+        return text[:at] + '\n' + API_IMPORT + text[at:]
+    directive = re.match(r"""\s*(['"])use (client|server)\1;?[ \t]*\n""", text)
+    if directive:
+        at = directive.end()
+        return text[:at] + '\n' + API_IMPORT + '\n' + text[at:]
+    return API_IMPORT + '\n\n' + text
+
+
+def rewrite(text: str) -> tuple[str, int]:
+    """Return the rewritten source and the number of URL sites changed."""
+    text, env_count = _ENV.subn('getApiUrl()', text)
+    text, literal_count = _LITERAL.subn(_literal, text)
+    text = _GROUPED.sub('getApiUrl()', text)
+    count = env_count + literal_count
+    if count:
+        text = _add_import(text)
+    return text, count
+
+
+def _check(path: str, dry_run: bool) -> tuple[str, int] | None:
+    # Worker: byte-level prefilter, then rewrite the few files that can match
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not any(needle in data for needle in _NEEDLES):
+        return None
+    text = data.decode('utf-8')
+    updated, count = rewrite(text)
+    if not count or updated == text:
+        return None
+    if not dry_run:
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(updated)
+    return path, count
+
+
+def source_files(app: Path) -> list[str]:
+    files = []
+    for dirpath, dirnames, filenames in os.walk(app / 'src'):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        for name in filenames:
+            if os.path.splitext(name)[1] in _SUFFIXES:
+                files.append(os.path.join(dirpath, name))
+    module = str(app / API_MODULE)
+    return [f for f in files if f != module]
+
+
+def rewrite_tree(root: Path, dry_run: bool = False, jobs: int | None = None) -> list[tuple[str, int]]:
+    """Rewrite every app under ``root``; returns (path, sites) for changed files."""
+    files: list[str] = []
+    for app in APPS:
+        files.extend(source_files(root / app))
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1:
+        results = [_check(path, dry_run) for path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(files) // (jobs * 4))
+            results = list(pool.map(_check, files, [dry_run] * len(files), chunksize=chunksize))
+    changed = [result for result in results if result is not None]
+
+    for app in APPS:
+        module = root / app / API_MODULE
+        touched = any(path.startswith(str(root / app) + os.sep) for path, _ in changed)
+        if touched and not module.exists() and not dry_run:
+            module.parent.mkdir(parents=True, exist_ok=True)
+            module.write_text(API_MODULE_SOURCE, encoding='utf-8')
+    return changed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m codemods.api_urls', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--root', type=Path, default=REPO_ROOT, help='repository root')
+    parser.add_argument('--dry-run', action='store_true', help='report only, write nothing')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    changed = rewrite_tree(args.root, args.dry_run, args.jobs)
+    elapsed = time.perf_counter() - start
+    for path, count in sorted(changed):
+        print(f'  {os.path.relpath(path, args.root)}  ({count} sites)')
+    action = 'would rewrite' if args.dry_run else 'rewrote'
+    print(f'{action} {sum(c for _, c in changed)} sites in {len(changed)} files in {elapsed * 1e3:.0f} ms')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
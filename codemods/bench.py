@@ -0,0 +1,224 @@
+"""Scaling benchmark: replay each script against synthetic pages of growing size.
+
+Usage (from the repo root)::
+
+    python -m codemods.bench                         # 2k, 20k and 200k lines
+    python -m codemods.bench --sizes 2000 20000 -s add-sort-filter
+    python -m codemods.bench --update-baseline       # accept the current numbers
+
+Every script gets its own synthetic target: generated dashboard components
+(state, effects, JSX rows) padded to the requested line count, with the
+script's real anchor blocks spread evenly through it.  Each case runs in a
+fresh worker process so peak RSS belongs to that case alone, three times by
+default (``--repeat``), keeping the fastest run.
+
+Absolute numbers only mean something on the machine (and moment) that
+produced them, so each worker first times a fixed calibration workload, a
+plain Python pass over a synthetic page that does not touch the runner, and
+the case is stored as ratios to it: wall time over the calibration's, and
+peak RSS over the worker's RSS once calibrated.  Results go to
+``.codemods-bench.json``; only the ratios go to the baseline, and a case
+whose ratios grew beyond the tolerance fails the run.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .manifest import REPO_ROOT, load_manifest
+from .runner import run_file
+from .script import Script
+
+DEFAULT_SIZES = (2_000, 20_000, 200_000)
+DEFAULT_REPEAT = 3
+RESULTS_FILE = '.codemods-bench.json'
+BASELINE_FILE = Path(__file__).with_name('bench-baseline.json')
+
+# Wall-time differences below this are timer noise, whatever the ratio
+_NOISE_NS = 5_000_000
+CALIBRATION_LINES = 20_000
+_CALIBRATION_RUNS = 3
+
+_BLOCK = '''\
+function Panel{n}({{ rows }}: {{ rows: PanelRow[] }}) {{
+  const [open{n}, setOpen{n}] = useState(false)
+  const total{n} = rows.reduce((sum, row) => sum + row.amount, 0)
+
+  useEffect(() => {{
+    if (!open{n}) return
+    console.log('panel {n}', total{n})
+  }}, [open{n}, total{n}])
+
+  return (
+    <div className="rounded-lg border bg-white p-4 shadow-sm">
+      <button onClick={{() => setOpen{n}(!open{n})}} className="text-sm text-blue-600">
+        Toggle panel {n}
+      </button>
+      {{open{n} && rows.map((row) => (
+        <div key={{row.id}} className="flex justify-between py-1 text-sm">
+          <span>{{row.name}}</span>
+          <span>${{row.amount.toFixed(2)}}</span>
+        </div>
+      ))}}
+    </div>
+  )
+}}
+
+'''
+_BLOCK_LINES = _BLOCK.count('\n')
+
+
+def synthetic_page(script: Script, lines: int) -> str:
+    """A page of about ``lines`` lines holding every literal anchor of ``script`` once."""
+    anchors = [p.old for p in script.patches if p.kind in ('replace', 'structural')]
+    anchor_lines = sum(anchor.count('\n') + 1 for anchor in anchors)
+    blocks = max(len(anchors) + 1, (lines - anchor_lines) // _BLOCK_LINES)
+
+    # Anchor i goes after block (i + 1) * blocks // (len + 1), so scans cross the whole file
+    slots = {(i + 1) * blocks // (len(anchors) + 1): anchor for i, anchor in enumerate(anchors)}
+    parts = ["'use client'\n\nimport { useState, useEffect } from 'react'\n\n"]
+    for n in range(blocks):
+        parts.append(_BLOCK.format(n=n))
+        if n in slots:
+            parts.append(slots[n] + '\n\n')
+    return ''.join(parts)
+
+
+def _peak_rss_kb() -> int | None:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+
+
+def calibrate() -> int:
+    """Fastest of a few timings of a fixed workload; the unit cases are measured in."""
+    text = synthetic_page(Script('calibration', Path('calibration.py'), 'calibration.tsx'), CALIBRATION_LINES)
+    timings = []
+    for _ in range(_CALIBRATION_RUNS):
+        start = time.perf_counter_ns()
+        counts: dict[str, int] = {}
+        for ch in text:
+            counts[ch] = counts.get(ch, 0) + 1
+        timings.append(time.perf_counter_ns() - start)
+    return min(timings)
+
+
+def _run_case(script: Script, lines: int) -> dict:
+    # Runs in a fresh worker process (one task per child)
+    calibration_ns = calibrate()
+    base_rss_kb = _peak_rss_kb()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        path = root / script.target
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = synthetic_page(script, lines)
+        path.write_text(text, encoding='utf-8')
+
+        start = time.perf_counter_ns()
+        result = run_file(root, script.target, [script])
+        wall_ns = time.perf_counter_ns() - start
+
+    peak_rss_kb = _peak_rss_kb()
+    return {
+        'script': script.name,
+        'lines': text.count('\n'),
+        'bytes': len(text.encode('utf-8')),
+        'wall_ns': wall_ns,
+        'peak_rss_kb': peak_rss_kb,
+        'calibration_ns': calibration_ns,
+        'wall_ratio': wall_ns / calibration_ns,
+        'rss_ratio': peak_rss_kb / base_rss_kb if peak_rss_kb and base_rss_kb else None,
+        'scanned': result.scanned,
+        'patches': [
+            {'patch': p.patch, 'status': p.status, 'matches': p.matches,
+             'scanned': p.scanned, 'elapsed_ns': p.elapsed_ns}
+            for p in result.patches
+        ],
+    }
+
+
+def run_benchmarks(scripts: list[Script], sizes: list[int], repeat: int = DEFAULT_REPEAT) -> list[dict]:
+    """Run every case ``repeat`` times, each in a fresh worker, keeping the fastest."""
+    cases = []
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        for lines in sizes:
+            for script in scripts:
+                if any(p.kind in ('regex', 'node') for p in script.patches):
+                    # Neither a pattern nor a selector gives us text to embed
+                    print(f'  skip {script.name}: anchors cannot be synthesised', file=sys.stderr)
+                    continue
+                runs = [pool.submit(_run_case, script, lines).result() for _ in range(repeat)]
+                case = min(runs, key=lambda run: run['wall_ratio'])
+                case['size'] = lines
+                print(f"  {lines:>7} lines  {case['wall_ns'] / 1e6:9.1f} ms  {case['wall_ratio']:7.2f}x  {script.name}",
+                      file=sys.stderr)
+                cases.append(case)
+    return cases
+
+
+def baseline_entries(cases: list[dict]) -> list[dict]:
+    """The machine-independent part of each case, as stored in the baseline."""
+    return [
+        {key: case[key] for key in ('script', 'size', 'wall_ratio', 'rss_ratio')}
+        for case in cases
+    ]
+
+
+def regressions(cases: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """Cases whose time or peak RSS, in calibration units, grew beyond ``tolerance``."""
+    previous = {(case['script'], case['size']): case for case in baseline}
+    failures = []
+    for case in cases:
+        before = previous.get((case['script'], case['size']))
+        if before is None:
+            continue
+        label = f"{case['script']} @ {case['size']} lines"
+        # The baseline's time for this case, translated to this machine
+        expected_ns = before['wall_ratio'] * case['calibration_ns']
+        if case['wall_ratio'] > before['wall_ratio'] * tolerance and case['wall_ns'] - expected_ns > _NOISE_NS:
+            failures.append(f"{label}: {case['wall_ratio']:.2f}x vs {before['wall_ratio']:.2f}x calibration time")
+        if case['rss_ratio'] and before['rss_ratio'] and case['rss_ratio'] > before['rss_ratio'] * tolerance:
+            failures.append(f"{label}: {case['rss_ratio']:.2f}x vs {before['rss_ratio']:.2f}x calibration RSS")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m codemods.bench', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-s', '--script', action='append', dest='scripts', help='limit to these scripts')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='page sizes in lines')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='runs per case, fastest kept')
+    parser.add_argument('--out', type=Path, default=REPO_ROOT / RESULTS_FILE, help='results file')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_FILE, help='baseline to compare against')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='allowed slowdown ratio (default 1.5)')
+    parser.add_argument('--update-baseline', action='store_true', help='write the results as the new baseline')
+    args = parser.parse_args(argv)
+
+    cases = run_benchmarks(load_manifest(only=args.scripts), args.sizes, args.repeat)
+    args.out.write_text(json.dumps(cases, indent=1), encoding='utf-8')
+    print(f'{len(cases)} cases written to {args.out}')
+
+    if args.update_baseline:
+        entries = baseline_entries(cases)
+        args.baseline.write_text('[\n' + ',\n'.join(json.dumps(e) for e in entries) + '\n]\n', encoding='utf-8')
+        print(f'baseline updated: {args.baseline}')
+        return 0
+    if not args.baseline.exists():
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    failures = regressions(cases, baseline, args.tolerance)
+    for failure in failures:
+        print(f'regression: {failure}', file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Persistent (script hash, input hash) -> output hash cache.
+
+Every entry is a fact about content, not about the working tree: "running this
+exact script source on this exact file content produced that content".  When
+the recorded output equals the current content, the script has nothing left to
+do and the runner skips it without scanning the file.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+CACHE_FILE = '.codemods-cache.json'
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, path: Path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        try:
+            self._entries: dict[str, str] = json.loads(path.read_text(encoding='utf-8'))
+        except (FileNotFoundError, ValueError):
+            self._entries = {}
+
+    @classmethod
+    def for_root(cls, root: Path) -> 'ResultCache':
+        return cls(root / CACHE_FILE)
+
+    @staticmethod
+    def _key(script_hash: str, input_hash: str) -> str:
+        return f'{script_hash}:{input_hash}'
+
+    def is_applied(self, script_hash: str, input_hash: str) -> bool:
+        """True when this script is known to leave this content unchanged."""
+        if self._entries.get(self._key(script_hash, input_hash)) == input_hash:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def record(self, script_hash: str, input_hash: str, output_hash: str) -> None:
+        # Patches are idempotent (a replayed patch reports "already applied"),
+        # so the output is also a fixed point of the script.
+        for key, value in ((input_hash, output_hash), (output_hash, output_hash)):
+            key = self._key(script_hash, key)
+            if self._entries.get(key) != value:
+                self._entries[key] = value
+                self._dirty = True
+
+    def merge(self, other: 'ResultCache') -> None:
+        """Fold in entries and counters from a copy used by a worker process."""
+        for key, value in other._entries.items():
+            if self._entries.get(key) != value:
+                self._entries[key] = value
+                self._dirty = True
+        self.hits += other.hits
+        self.misses += other.misses
+
+    def save(self) -> None:
+        if self._dirty:
+            self.path.write_text(json.dumps(self._entries, indent=0, sort_keys=True), encoding='utf-8')
+            self._dirty = False
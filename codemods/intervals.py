@@ -0,0 +1,48 @@
+"""Static interval tree for the byte ranges patches rewrite."""
+from __future__ import annotations
+
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar('T')
+
+
+class IntervalTree(Generic[T]):
+    """Half-open ``[start, end)`` intervals, built once and queried many times.
+
+    The intervals are sorted by start and stored as an implicit balanced tree
+    (the middle element of each slice is its root) in which every node also
+    records the largest end in its subtree.  Building costs O(n log n) and a
+    query O(log n + k) for k results.
+    """
+
+    def __init__(self, intervals: list[tuple[int, int, T]]):
+        self._items = sorted(intervals, key=lambda item: (item[0], item[1]))
+        self._max_end = [0] * len(self._items)
+        self._build(0, len(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _build(self, lo: int, hi: int) -> int:
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        self._max_end[mid] = max(self._items[mid][1], self._build(lo, mid), self._build(mid + 1, hi))
+        return self._max_end[mid]
+
+    def overlapping(self, start: int, end: int) -> Iterator[tuple[int, int, T]]:
+        """Yield every interval that shares at least one position with ``[start, end)``."""
+        stack = [(0, len(self._items))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                continue  # everything below ends before the query starts
+            stack.append((lo, mid))
+            item = self._items[mid]
+            if item[0] < end:
+                if item[1] > start:
+                    yield item
+                stack.append((mid + 1, hi))
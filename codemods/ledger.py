@@ -0,0 +1,53 @@
+"""Checked-in record of the patch scripts whose edits are already in the tree.
+
+The result cache only knows about content it has seen.  The pages have since
+been edited by hand, so most scripts no longer find their anchors and replaying
+them can only fail.  Like a migrations table, the ledger names every script that
+has run, with the digest of the source that ran; the runner skips those and
+replays only scripts that are new or were changed after they ran.
+
+A recorded script may still be changed in how it finds its text (a structural
+anchor instead of an escaped regex) as long as it matches exactly the text it
+matched before and writes the same edits; record its new digest with it.  A
+node selector matches whatever the declaration holds, so it only goes in new
+scripts, with the old declaration passed to ``replace_node`` as a check.  What
+a script writes is not changed after it ran: change the page, or add a new
+script, instead.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from .script import Script
+
+LEDGER_FILE = 'codemods/applied.json'
+
+
+class AppliedLedger:
+    def __init__(self, path: Path):
+        self.path = path
+        self._dirty = False
+        try:
+            self._entries: dict[str, str] = json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            self._entries = {}
+
+    @classmethod
+    def for_root(cls, root: Path) -> 'AppliedLedger':
+        return cls(root / LEDGER_FILE)
+
+    def is_applied(self, script: Script) -> bool:
+        """True when this exact script source has already run on the tree."""
+        return self._entries.get(script.name) == script.digest
+
+    def record(self, script: Script) -> None:
+        if self._entries.get(script.name) != script.digest:
+            self._entries[script.name] = script.digest
+            self._dirty = True
+
+    def save(self) -> None:
+        if self._dirty:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._entries, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+            self._dirty = False
@@ -0,0 +1,52 @@
+"""Advisory per-file locks so concurrent runs never interleave read and write."""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_DIR = Path(tempfile.gettempdir()) / 'codemods-locks'
+
+
+def _lock_path(path: Path) -> Path:
+    # Lock files live outside the tree so a run never leaves files in apps/
+    digest = hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()
+    return LOCK_DIR / f'{digest}.lock'
+
+
+@contextlib.contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock for ``path`` across processes."""
+    LOCK_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(_lock_path(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def file_locks(paths: list[Path]) -> Iterator[None]:
+    """Lock several files, always in the same order to avoid deadlocks."""
+    with contextlib.ExitStack() as stack:
+        for path in sorted(set(p.resolve() for p in paths)):
+            stack.enter_context(file_lock(path))
+        yield
@@ -0,0 +1,60 @@
+"""Declared replay order of the top-level patch scripts.
+
+Order matters within a target file: later scripts anchor on text that earlier
+ones inserted (e.g. add-supabase-filters.py rewrites the state block that
+add-sort-filter.py introduced).  Scripts for different targets are independent.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from .script import Script, load_script
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPTS = [
+    # apps/web/src/app/(dashboard)/accounts/page.tsx
+    'update-accounts-display.py',
+    'update-accounts-grid.py',
+    'add-sort-filter.py',
+    'add-email-phone-columns.py',
+    'fix-contact-columns-order.py',
+    'add-supabase-filters.py',
+    'add-orders-hover.py',
+    'add-orders-hover-button.py',
+    'fix-orders-popup-sticky.py',
+    'show-order-items-in-hover.py',
+    'add-contact-to-order-popup.py',
+    'fix-nested-links.py',
+    'improve-order-popup-readability.py',
+    'add-invoice-payment-status.py',
+    'make-invoice-clickable.py',
+    'add-outstanding-invoices.py',
+    'add-infinite-scroll.py',
+    # apps/web/src/app/(dashboard)/accounts/[id]/page.tsx
+    'fix-account-detail-page.py',
+    'add-loading-states-account-detail.py',
+    'implement-add-contact.py',
+    'implement-add-address-contact.py',
+    # apps/web/src/app/(dashboard)/products/[id]/page.tsx
+    'update-product-detail.py',
+    'update-transactions-tab.py',
+    'fix-product-null.py',
+    # apps/api/src/modules/accounts/accounts.service.ts
+    'fix-accounts-query.py',
+]
+
+
+def load_manifest(root: Path = REPO_ROOT, only: list[str] | None = None) -> list[Script]:
+    """Load the declared scripts, optionally restricted to the given names."""
+    wanted = None
+    if only:
+        wanted = {name.removesuffix('.py') for name in only}
+        unknown = wanted - {name.removesuffix('.py') for name in SCRIPTS}
+        if unknown:
+            raise KeyError(f'not in manifest: {", ".join(sorted(unknown))}')
+    return [
+        load_script(root / name)
+        for name in SCRIPTS
+        if wanted is None or name.removesuffix('.py') in wanted
+    ]
@@ -0,0 +1,113 @@
+"""Find every anchor of a patch set in one linear pass (Aho-Corasick).
+
+``str.replace`` rescans the whole file once per anchor and says nothing when an
+anchor is missing.  ``AnchorIndex`` compiles all anchors into one automaton,
+walks the text once and returns exact offsets, so edits become splices and a
+miss can be reported instead of silently ignored.
+"""
+from __future__ import annotations
+
+from collections import deque
+
+
+class AnchorNotFound(Exception):
+    """Raised when a patch anchor matches nowhere in its target file."""
+
+    def __init__(self, script: str, patch: str, target: str):
+        super().__init__(f'{script}:{patch}: anchor not found in {target}')
+        self.script = script
+        self.patch = patch
+        self.target = target
+
+    def __reduce__(self):
+        # Keep the exception picklable across the runner's process pool
+        return type(self), (self.script, self.patch, self.target)
+
+
+class AnchorIndex:
+    """Aho-Corasick automaton over a fixed set of literal anchors."""
+
+    def __init__(self, anchors: list[str]):
+        self.anchors = list(dict.fromkeys(a for a in anchors if a))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]  # anchor ids ending in each state
+
+        for anchor_id, anchor in enumerate(self.anchors):
+            state = 0
+            for ch in anchor:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (anchor_id,)
+
+        # Breadth-first fill of failure links and merged outputs
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[nxt] = goto[fallback].get(ch, 0)
+                if out[fail[nxt]]:
+                    out[nxt] += out[fail[nxt]]
+
+    def iter_matches(self, text: str):
+        """Yield (start offset, anchor) for every occurrence, in order of their end."""
+        goto, fail, out, anchors = self._goto, self._fail, self._out, self.anchors
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for anchor_id in out[state]:
+                anchor = anchors[anchor_id]
+                yield pos + 1 - len(anchor), anchor
+
+    def find_all(self, text: str) -> dict[str, list[int]]:
+        """Return start offsets of every (possibly overlapping) occurrence of each anchor."""
+        hits: dict[str, list[int]] = {anchor: [] for anchor in self.anchors}
+        for offset, anchor in self.iter_matches(text):
+            hits[anchor].append(offset)
+        return hits
+
+
+def non_overlapping(offsets: list[int], length: int) -> list[int]:
+    """Leftmost non-overlapping occurrences, matching ``str.replace`` semantics."""
+    selected: list[int] = []
+    end = -1
+    for offset in offsets:
+        if offset >= end:
+            selected.append(offset)
+            end = offset + length
+    return selected
+
+
+def find_offsets(text: str, needle: str) -> list[int]:
+    """Start offsets of every (possibly overlapping) occurrence of one needle."""
+    offsets = []
+    offset = text.find(needle)
+    while offset >= 0:
+        offsets.append(offset)
+        offset = text.find(needle, offset + 1)
+    return offsets
+
+
+def splice(text: str, edits: list[tuple[int, int, str]]) -> str:
+    """Apply non-overlapping (start, end, replacement) edits in a single copy."""
+    parts: list[str] = []
+    last = 0
+    for start, end, replacement in sorted(edits):
+        parts.append(text[last:start])
+        parts.append(replacement)
+        last = end
+    parts.append(text[last:])
+    return ''.join(parts)
@@ -0,0 +1,278 @@
+"""Work out which bytes every patch of a target would rewrite, before editing.
+
+Each patch's anchor is located in the *original* content of its target and the
+resulting ranges are loaded into an interval tree.  An overlap between patches
+of different scripts is only a candidate: a script often appends to a block
+that a later script anchors on, and the later anchor survives.  The chain is
+then replayed in order on a copy of the content, and a candidate becomes a
+conflict only when the earlier patch's edit actually destroys the later
+patch's anchor.  Patches whose anchor only exists once an earlier patch has run
+are recorded as dependencies on it; they have no range in the original file.
+
+The replay also tells whether anything is left to do: a chain that makes no
+edit and finds every anchor or replacement is already applied.  Until the
+first edit, the replay reuses the automaton hits from the original content, so
+planning an applied chain costs one pass over the file plus one over each
+replacement text, and O(n log n) for n ranges.  Large patch sets fail before
+any file is touched instead of half-applying.
+"""
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+
+from .intervals import IntervalTree
+from .matcher import AnchorIndex, find_offsets, non_overlapping
+from .script import Patch, Script
+from .structural import find_structural
+from .tsx import Document, NodeNotFound, ParseError, SyntaxTree
+
+
+@dataclass
+class PatchRange:
+    script: str
+    patch: str
+    order: int  # position of the patch in the target's whole chain
+    start: int
+    end: int
+
+    def __str__(self) -> str:
+        return f'{self.script}:{self.patch} [{self.start}, {self.end})'
+
+
+@dataclass
+class Conflict:
+    first: PatchRange
+    second: PatchRange
+
+    def __str__(self) -> str:
+        return f'{self.first} destroys the anchor of {self.second}'
+
+
+@dataclass
+class Dependency:
+    script: str
+    patch: str
+    after: str  # 'script:patch' whose replacement introduces the anchor
+
+
+@dataclass
+class Plan:
+    target: str
+    ranges: list[PatchRange] = field(default_factory=list)
+    conflicts: list[Conflict] = field(default_factory=list)
+    dependencies: list[Dependency] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)  # 'script:patch' the replay found no anchor for
+    edits: int = 0  # edits made by the ordered replay
+    scanned: int = 0  # bytes scanned while planning
+    elapsed_ns: int = 0
+
+    @property
+    def applied(self) -> bool:
+        """The whole chain's output is already in place."""
+        return self.edits == 0 and not self.missing
+
+
+class PatchConflict(Exception):
+    """Raised when a patch destroys the anchor of a later script's patch."""
+
+    def __init__(self, target: str, conflicts: list[Conflict]):
+        lines = ''.join(f'\n  {conflict}' for conflict in conflicts)
+        super().__init__(f'{len(conflicts)} conflicting patch(es) in {target}:{lines}')
+        self.target = target
+        self.conflicts = conflicts
+
+    def __reduce__(self):
+        # Keep the exception picklable across the runner's process pool
+        return type(self), (self.target, self.conflicts)
+
+
+def pending_offsets(patch: Patch, old_hits: list[int], new_hits: list[int]) -> list[int]:
+    """Occurrences of the anchor that are not already inside its replacement.
+
+    Patches that append to their anchor (``new`` contains ``old``) would
+    otherwise be applied again on every replay.
+    """
+    offsets = non_overlapping(old_hits, len(patch.old))
+    if not new_hits:
+        return offsets
+    lead = patch.new.find(patch.old)
+    if lead < 0:
+        return offsets
+    covered = {hit + lead for hit in new_hits}
+    return [offset for offset in offsets if offset not in covered]
+
+
+def _spans(content: str, patch: Patch, hits: dict[str, list[int]], tree: SyntaxTree | None) -> list[tuple[int, int]]:
+    if patch.kind == 'replace':
+        offsets = pending_offsets(patch, hits.get(patch.old, []), hits.get(patch.new, []))
+        return [(offset, offset + len(patch.old)) for offset in offsets]
+    if patch.kind == 'structural':
+        return find_structural(content, patch.old)
+    if patch.kind == 'regex':
+        return [match.span() for match in re.finditer(patch.old, content, flags=patch.flags)]
+    if tree is None:
+        return []
+    try:
+        node = tree.select(patch.old)
+    except NodeNotFound:
+        return []
+    if content.startswith(patch.new, node.start):
+        return []  # already in place
+    return [(node.start, node.end)]
+
+
+def _replay_edits(document: Document, patch: Patch, hits: dict[str, list[int]] | None) -> list[tuple[int, int, str]] | None:
+    """The edits ``patch`` makes to the document, as the runner would apply them.
+
+    Returns ``[]`` when the patch is already in place and None when its anchor
+    is missing.  ``hits`` are automaton hits that are still valid for the
+    current text, if any.
+    """
+    text = document.text
+    if patch.kind == 'replace':
+        if hits is not None:
+            old_hits, new_hits = hits.get(patch.old, []), hits.get(patch.new, [])
+            if patch.new and patch.new not in hits:
+                new_hits = find_offsets(text, patch.new)
+        else:
+            old_hits = find_offsets(text, patch.old)
+            new_hits = find_offsets(text, patch.new) if patch.new else []
+        offsets = pending_offsets(patch, old_hits, new_hits)
+        if offsets:
+            return [(offset, offset + len(patch.old), patch.new) for offset in offsets]
+        return [] if new_hits else None
+    if patch.kind == 'structural':
+        spans = find_structural(text, patch.old)
+        if spans:
+            return [(start, end, patch.new.strip()) for start, end in spans]
+        return [] if find_structural(text, patch.new) else None
+    if patch.kind == 'regex':
+        matches = list(re.finditer(patch.old, text, flags=patch.flags))
+        return [(m.start(), m.end(), m.expand(patch.new)) for m in matches] or None
+    try:
+        tree = document.tree
+        node = tree.select(patch.old)
+    except (NodeNotFound, ParseError):
+        return None
+    if text.startswith(patch.new, node.start) or tree.source(node) == patch.new.rstrip():
+        return []
+    return [(node.start, node.end, patch.new)]
+
+
+def _replay_cost(text: str, patch: Patch, hits: dict[str, list[int]] | None) -> int:
+    if patch.kind == 'replace':
+        if hits is None:
+            return len(text) * (2 if patch.new else 1)
+        return len(text) if patch.new and patch.new not in hits else 0
+    if patch.kind == 'structural':
+        return 2 * len(text)
+    return len(text) if patch.kind == 'regex' else 0
+
+
+@dataclass
+class _Watch:
+    """A candidate's anchor, followed through the replay until its patch runs."""
+    range: PatchRange
+    anchor: str
+    start: int  # offset in the replayed text
+    rivals: dict[int, PatchRange]  # order -> earlier range of another script overlapping it
+
+    def follow(self, text: str, edits: list[tuple[int, int, str]], order: int) -> PatchRange | None:
+        """Track the anchor through ``edits``, which turned the previous text into ``text``.
+
+        Returns the rival range whose edit destroyed the anchor, if any.
+        """
+        end = self.start + len(self.anchor)
+        before = total = 0  # length change from edits wholly before the anchor / from all edits so far
+        lo = hi = -1  # where the edits overlapping the anchor landed in ``text``
+        for start, stop, replacement in sorted(edits):
+            if start >= end:
+                break
+            delta = len(replacement) - (stop - start)
+            if stop > self.start if stop > start else start > self.start:
+                lo = start + total if lo < 0 else lo
+                hi = start + total + len(replacement)
+            else:
+                before += delta
+            total += delta
+        moved = self.start + before
+        # An edit that appends to a block keeps the anchor where it was
+        if lo < 0 or text.startswith(self.anchor, moved):
+            self.start = moved
+            return None
+        found = text.find(self.anchor, max(0, lo - len(self.anchor)), hi + len(self.anchor))
+        if found >= 0:
+            self.start = found
+            return None
+        return self.rivals.get(order)
+
+
+def plan_target(content: str, target: str, scripts: list[Script]) -> Plan:
+    """Locate every patch of ``scripts`` (one target's chain) in ``content`` and replay it."""
+    start = time.perf_counter_ns()
+    plan = Plan(target)
+    chain = [(script, patch) for script in scripts for patch in script.patches]
+
+    # One automaton for every literal anchor and replacement; the replacements
+    # tell an applied patch from a pending or missing one
+    literal = [p for _, p in chain if p.kind == 'replace']
+    olds = {p.old for p in literal}
+    index = AnchorIndex([p.old for p in literal] + [p.new for p in literal if p.new])
+    hits = index.find_all(content)
+    plan.scanned = len(content)
+    document = Document(content)
+    tree = None
+    if any(p.kind == 'node' for _, p in chain):
+        try:
+            tree = document.tree
+        except ParseError:
+            pass  # node patches then report their own failure when applied
+
+    # Which earlier replacement first introduces each literal anchor
+    introduced_by: dict[str, str] = {}
+
+    for order, (script, patch) in enumerate(chain):
+        spans = _spans(content, patch, hits, tree)
+        plan.ranges.extend(PatchRange(script.name, patch.name, order, s, e) for s, e in spans)
+        if not spans and patch.old in introduced_by:
+            plan.dependencies.append(Dependency(script.name, patch.name, introduced_by[patch.old]))
+        if patch.kind == 'replace' or patch.kind == 'structural':
+            for _, anchor in index.iter_matches(patch.new):
+                if anchor in olds:
+                    introduced_by.setdefault(anchor, f'{script.name}:{patch.name}')
+
+    # Overlaps between scripts in the original content are candidates; the
+    # replay below keeps the ones whose later anchor an earlier edit destroys
+    watches: dict[int, _Watch] = {}
+    ranges = IntervalTree([(r.start, r.end, r) for r in plan.ranges])
+    for first in plan.ranges:
+        for _, _, second in ranges.overlapping(first.start, first.end):
+            if second.order > first.order and second.script != first.script:
+                watch = watches.setdefault(
+                    id(second), _Watch(second, content[second.start:second.end], second.start, {}))
+                watch.rivals.setdefault(first.order, first)
+
+    valid = hits  # automaton hits stay valid until the first edit
+    for order, (script, patch) in enumerate(chain):
+        plan.scanned += _replay_cost(document.text, patch, valid)
+        edits = _replay_edits(document, patch, valid)
+        if edits is None:
+            plan.missing.append(f'{script.name}:{patch.name}')
+            continue
+        if not edits:
+            continue
+        document.apply(edits)
+        valid = None
+        plan.edits += len(edits)
+        for key, watch in list(watches.items()):
+            if watch.range.order <= order:
+                del watches[key]
+                continue
+            rival = watch.follow(document.text, edits, order)
+            if rival is not None:
+                plan.conflicts.append(Conflict(rival, watch.range))
+                del watches[key]
+    plan.elapsed_ns = time.perf_counter_ns() - start
+    return plan
@@ -0,0 +1,358 @@
+"""Replay patch scripts with one read and one write per target file."""
+from __future__ import annotations
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .cache import ResultCache, content_hash
+from .ledger import AppliedLedger
+from .locks import file_locks
+from .matcher import AnchorIndex, AnchorNotFound, find_offsets
+from .planner import PatchConflict, Plan, pending_offsets, plan_target
+from .script import Patch, Script
+from .structural import find_structural
+from .tsx import Document, NodeNotFound
+
+APPLIED = 'applied'
+ALREADY_APPLIED = 'already applied'
+RECORDED = 'recorded as applied'
+
+
+class ConcurrentModification(Exception):
+    """Raised when a target changed on disk between planning and writing."""
+
+
+@dataclass
+class PatchResult:
+    script: str
+    patch: str
+    status: str
+    matches: int
+    offset: int | None
+    elapsed_ns: int
+    cached: bool = False
+    scanned: int = 0  # bytes scanned to locate this patch; a shared pass counts for each patch it served
+    started_ns: int = 0  # perf_counter_ns() when the patch started, for traces
+
+
+@dataclass
+class FileResult:
+    target: str
+    patches: list[PatchResult] = field(default_factory=list)
+    pid: int = 0  # process that planned the file
+    started_ns: int = 0
+    changed: bool = False
+    read_ns: int = 0
+    scan_ns: int = 0
+    write_ns: int = 0
+    write_started_ns: int = 0
+    scanned: int = 0  # bytes covered by shared automaton passes, each counted once
+    parses: int = 0  # full TSX parses (at most one per run)
+    plan: Plan | None = None
+    content: str = field(default='', repr=False)
+    original: str = field(default='', repr=False)
+
+
+def group_by_target(scripts: list[Script]) -> dict[str, list[Script]]:
+    """Group scripts by target file, keeping declared order inside each group."""
+    groups: dict[str, list[Script]] = {}
+    for script in scripts:
+        groups.setdefault(script.target, []).append(script)
+    return groups
+
+
+def _apply_structural(document: Document, script: Script, patch: Patch) -> PatchResult:
+    start = time.perf_counter_ns()
+    size = len(document.text)
+    spans = find_structural(document.text, patch.old)
+    if not spans:
+        applied = find_structural(document.text, patch.new)
+        if not applied:
+            raise AnchorNotFound(script.name, patch.name, script.target)
+        return PatchResult(script.name, patch.name, ALREADY_APPLIED, 0, applied[0][0],
+                           time.perf_counter_ns() - start, started_ns=start, scanned=2 * size)
+    replacement = patch.new.strip()
+    document.apply([(begin, end, replacement) for begin, end in spans])
+    return PatchResult(script.name, patch.name, APPLIED, len(spans), spans[0][0],
+                       time.perf_counter_ns() - start, started_ns=start, scanned=size)
+
+
+def _apply_regex(document: Document, script: Script, patch: Patch) -> PatchResult:
+    start = time.perf_counter_ns()
+    match = re.search(patch.old, document.text, flags=patch.flags)
+    if match is None:
+        raise AnchorNotFound(script.name, patch.name, script.target)
+    size = len(document.text)
+    updated, count = re.subn(patch.old, patch.new, document.text, flags=patch.flags)
+    document.replace(updated)
+    return PatchResult(script.name, patch.name, APPLIED, count, match.start(),
+                       time.perf_counter_ns() - start, started_ns=start, scanned=match.end() + size)
+
+
+def _apply_node(document: Document, script: Script, patch: Patch) -> PatchResult:
+    start = time.perf_counter_ns()
+    parses = document.parses
+    tree = document.tree
+    # A first parse reads the whole file; later lookups only re-parse edited bodies
+    scanned = len(document.text) if document.parses > parses else 0
+    reparsed = tree.reparsed
+    try:
+        node = tree.select(patch.old)
+    except NodeNotFound:
+        raise AnchorNotFound(script.name, patch.name, script.target) from None
+    # The replacement may carry the trailing newline that follows the node
+    if document.text.startswith(patch.new, node.start) or tree.source(node) == patch.new.rstrip():
+        return PatchResult(script.name, patch.name, ALREADY_APPLIED, 0, node.start,
+                           time.perf_counter_ns() - start, started_ns=start, scanned=scanned)
+    # Only overwrite the declaration the patch was written against
+    if patch.expected is not None and tree.source(node) != patch.expected.rstrip('\n'):
+        raise AnchorNotFound(script.name, patch.name, script.target)
+    document.apply([(node.start, node.end, patch.new)])
+    scanned += tree.reparsed - reparsed
+    return PatchResult(script.name, patch.name, APPLIED, 1, node.start,
+                       time.perf_counter_ns() - start, started_ns=start, scanned=scanned)
+
+
+_APPLY = {'structural': _apply_structural, 'regex': _apply_regex, 'node': _apply_node}
+
+
+def _apply_sequential(document: Document, script: Script) -> list[PatchResult]:
+    """Patch-by-patch fallback for scripts whose anchors depend on each other."""
+    results = []
+    for patch in script.patches:
+        if patch.kind != 'replace':
+            results.append(_APPLY[patch.kind](document, script, patch))
+            continue
+        start = time.perf_counter_ns()
+        content = document.text
+        new_hits = find_offsets(content, patch.new) if patch.new else []
+        offsets = pending_offsets(patch, find_offsets(content, patch.old), new_hits)
+        if offsets:
+            document.apply([(o, o + len(patch.old), patch.new) for o in offsets])
+            status, first = APPLIED, offsets[0]
+        elif new_hits:
+            status, first = ALREADY_APPLIED, new_hits[0]
+        else:
+            raise AnchorNotFound(script.name, patch.name, script.target)
+        scanned = len(content) * (2 if patch.new else 1)
+        results.append(PatchResult(script.name, patch.name, status, len(offsets), first,
+                                   time.perf_counter_ns() - start, started_ns=start, scanned=scanned))
+    return results
+
+
+def apply_script(document: Document, script: Script) -> tuple[list[PatchResult], int]:
+    """Apply one script's patches to ``document``; returns (results, scan_ns).
+
+    All literal anchors (and replacement texts, to detect patches that are
+    already in place) are located in a single automaton pass and applied as one
+    splice.  A script whose anchors overlap or only appear after one of its own
+    earlier patches falls back to patch-by-patch application.  Node patches go
+    through the document's shared syntax tree.
+    """
+    if any(p.kind != 'replace' for p in script.patches):
+        return _apply_sequential(document, script), 0
+
+    start = time.perf_counter_ns()
+    size = len(document.text)
+    index = AnchorIndex([text for p in script.patches for text in (p.old, p.new)])
+    hits = index.find_all(document.text)
+    scan_ns = time.perf_counter_ns() - start
+
+    edits: list[tuple[int, int, str]] = []
+    results: list[PatchResult] = []
+    for position, patch in enumerate(script.patches):
+        start = time.perf_counter_ns()
+        new_hits = hits.get(patch.new, [])
+        offsets = pending_offsets(patch, hits.get(patch.old, []), new_hits)
+        if not offsets:
+            if new_hits:
+                results.append(PatchResult(script.name, patch.name, ALREADY_APPLIED, 0, new_hits[0],
+                                           time.perf_counter_ns() - start, started_ns=start, scanned=size))
+                continue
+            if any(patch.old in earlier.new for earlier in script.patches[:position]):
+                return _apply_sequential(document, script), scan_ns
+            raise AnchorNotFound(script.name, patch.name, script.target)
+        edits.extend((offset, offset + len(patch.old), patch.new) for offset in offsets)
+        results.append(PatchResult(script.name, patch.name, APPLIED, len(offsets), offsets[0],
+                                   time.perf_counter_ns() - start, started_ns=start, scanned=size))
+
+    edits.sort()
+    if any(prev[1] > cur[0] for prev, cur in zip(edits, edits[1:])):
+        return _apply_sequential(document, script), scan_ns
+    document.apply(edits)
+    return results, scan_ns
+
+
+def _chain_digest(scripts: list[Script]) -> str:
+    # One cache key for a target's whole chain: re-running an applied chain is
+    # a single lookup, even when later scripts rewrote what earlier ones added
+    return content_hash('\n'.join(script.digest for script in scripts))
+
+
+def _cached(script: Script, patch: Patch) -> PatchResult:
+    return PatchResult(script.name, patch.name, ALREADY_APPLIED, 0, None, 0, cached=True,
+                       started_ns=time.perf_counter_ns())
+
+
+def _planned(script: Script, patch: Patch, status: str = ALREADY_APPLIED) -> PatchResult:
+    return PatchResult(script.name, patch.name, status, 0, None, 0, started_ns=time.perf_counter_ns())
+
+
+def run_file(
+    root: Path,
+    target: str,
+    scripts: list[Script],
+    cache: ResultCache | None = None,
+    check: bool = True,
+    ledger: AppliedLedger | None = None,
+) -> FileResult:
+    """Apply every script for one target in memory; nothing is written here.
+
+    With ``check``, the chain is first replayed against the file as read:
+    PatchConflict is raised if a patch destroys a later script's anchor, and a
+    chain whose replay changes nothing is reported as already applied.  With a
+    cache, a script already known to leave the current content unchanged is
+    skipped without scanning and its patches are reported as already applied.
+    When the current content is what the whole chain produced last time, the
+    file is returned after one hash, without planning or scanning.  Scripts the
+    ledger records as applied are skipped, and reported first; a target with
+    nothing else to run is not read at all.
+    """
+    start = time.perf_counter_ns()
+    result = FileResult(target, pid=os.getpid(), started_ns=start)
+    if ledger is not None:
+        recorded = [script for script in scripts if ledger.is_applied(script)]
+        result.patches = [_planned(script, patch, RECORDED) for script in recorded for patch in script.patches]
+        scripts = [script for script in scripts if script not in recorded]
+        if not scripts:
+            return result
+
+    original = (root / target).read_text(encoding='utf-8')
+    result.read_ns = time.perf_counter_ns() - start
+    result.original = result.content = original
+
+    current_hash = content_hash(original) if cache is not None else ''
+    chain = _chain_digest(scripts) if cache is not None else ''
+    if cache is not None and cache.is_applied(chain, current_hash):
+        result.patches.extend(_cached(script, patch) for script in scripts for patch in script.patches)
+        return result
+    chain_input = current_hash
+
+    if check:
+        result.plan = plan_target(original, target, scripts)
+        result.scanned += result.plan.scanned
+        if result.plan.conflicts:
+            raise PatchConflict(target, result.plan.conflicts)
+        if result.plan.applied:
+            # The ordered replay made no edit, so there is nothing to apply
+            result.patches.extend(_planned(script, patch) for script in scripts for patch in script.patches)
+            if cache is not None:
+                cache.record(chain, chain_input, current_hash)
+            return result
+
+    document = Document(original)
+    for script in scripts:
+        if cache is not None and cache.is_applied(script.digest, current_hash):
+            result.patches.extend(_cached(script, patch) for patch in script.patches)
+            continue
+        size = len(document.text)
+        patch_results, scan_ns = apply_script(document, script)
+        result.patches.extend(patch_results)
+        result.scan_ns += scan_ns
+        if scan_ns:
+            result.scanned += size
+        if cache is not None:
+            input_hash, current_hash = current_hash, content_hash(document.text)
+            cache.record(script.digest, input_hash, current_hash)
+
+    if cache is not None:
+        cache.record(chain, chain_input, current_hash)
+
+    result.changed = document.text != original
+    result.content = document.text
+    result.parses = document.parses
+    return result
+
+
+def write_file(root: Path, result: FileResult) -> None:
+    """Write a planned result, refusing if the file changed since it was read."""
+    start = result.write_started_ns = time.perf_counter_ns()
+    path = root / result.target
+    if path.read_text(encoding='utf-8') != result.original:
+        raise ConcurrentModification(f'{result.target} changed on disk while patches were planned')
+    path.write_text(result.content, encoding='utf-8')
+    result.write_ns = time.perf_counter_ns() - start
+
+
+def _run_group(
+    root: Path,
+    target: str,
+    scripts: list[Script],
+    cache: ResultCache | None,
+    check: bool,
+    ledger: AppliedLedger | None,
+) -> tuple[FileResult, ResultCache | None]:
+    # Worker entry point: the cache is a per-process copy merged back by the
+    # parent; the ledger is only read here
+    return run_file(root, target, scripts, cache, check, ledger), cache
+
+
+def default_jobs(group_count: int) -> int:
+    return max(1, min(group_count, os.cpu_count() or 1))
+
+
+def run_batch(
+    scripts: list[Script],
+    root: Path,
+    dry_run: bool = False,
+    cache: ResultCache | None = None,
+    jobs: int | None = None,
+    check: bool = True,
+    ledger: AppliedLedger | None = None,
+) -> list[FileResult]:
+    """Plan every target first; files are only written once all of them succeed.
+
+    Scripts are grouped by target file and each group runs, in declared order,
+    in its own worker process, so wall time is bounded by the longest per-file
+    chain.  Every target stays locked from the first read to the last write,
+    and a conflict found while planning any target aborts the whole batch.
+    The cache and the ledger are only saved once the files are written, so a
+    dry run leaves nothing behind.
+    """
+    groups = group_by_target(scripts)
+    jobs = default_jobs(len(groups)) if jobs is None else jobs
+
+    with file_locks([root / target for target in groups]):
+        if jobs <= 1 or len(groups) <= 1:
+            results = [run_file(root, target, group, cache, check, ledger) for target, group in groups.items()]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = [
+                    pool.submit(_run_group, root, target, group, cache, check, ledger)
+                    for target, group in groups.items()
+                ]
+                results = []
+                for future in futures:
+                    result, worker_cache = future.result()
+                    results.append(result)
+                    if cache is not None:
+                        cache.merge(worker_cache)
+
+        if not dry_run:
+            for result in results:
+                if result.changed:
+                    write_file(root, result)
+
+    if dry_run:
+        return results
+    if cache is not None:
+        cache.save()
+    if ledger is not None:
+        for script in scripts:
+            ledger.record(script)
+        ledger.save()
+    return results
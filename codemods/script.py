@@ -0,0 +1,140 @@
+"""Load the top-level patch scripts as declarative patch lists.
+
+Every ``*.py`` patch script in the repo root follows the same shape: read one
+target file into ``content``, run a chain of ``content = content.replace(...)``
+(or ``re.sub(...)`` / ``replace_structural(...)`` / ``replace_node(...)``)
+calls, write ``content`` back and print a summary.  Rather
+than executing them, we read that shape statically so the runner can replay the
+patches of many scripts against a single in-memory copy of each target.
+"""
+from __future__ import annotations
+
+import ast
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Names of `re` module attributes a script may pass as `flags=`
+_RE_FLAGS = {name: getattr(re, name) for name in ('DOTALL', 'S', 'MULTILINE', 'M', 'IGNORECASE', 'I')}
+
+
+class ScriptError(Exception):
+    """Raised when a patch script does not follow the read/replace/write shape."""
+
+
+@dataclass
+class Patch:
+    name: str
+    old: str
+    new: str
+    lineno: int
+    kind: str = 'replace'  # 'replace', 'structural', 'regex' or 'node' (old is a selector)
+    flags: int = 0
+    expected: str | None = None  # node patches: the declaration's exact text before the patch
+
+
+@dataclass
+class Script:
+    name: str
+    path: Path
+    target: str
+    patches: list[Patch] = field(default_factory=list)
+    messages: list[str] = field(default_factory=list)
+    digest: str = ''  # sha256 of the script source
+
+
+def _open_path(node: ast.With) -> tuple[str, str] | None:
+    """Return (path, mode) for a `with open(path, mode) as f:` statement."""
+    call = node.items[0].context_expr
+    if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == 'open'):
+        return None
+    path = ast.literal_eval(call.args[0])
+    mode = ast.literal_eval(call.args[1]) if len(call.args) > 1 else 'r'
+    return path, mode
+
+
+def load_script(path: str | Path) -> Script:
+    path = Path(path)
+    source = path.read_text(encoding='utf-8')
+    tree = ast.parse(source, filename=str(path))
+    namespace: dict[str, str] = {}
+    target = None
+    patches: list[Patch] = []
+    messages: list[str] = []
+
+    def value(node: ast.expr) -> str:
+        if isinstance(node, ast.Name):
+            if node.id not in namespace:
+                raise ScriptError(f'{path.name}:{node.lineno}: unknown name {node.id!r}')
+            return namespace[node.id]
+        return ast.literal_eval(node)
+
+    def label(node: ast.expr, lineno: int) -> str:
+        return node.id if isinstance(node, ast.Name) else f'line {lineno}'
+
+    for stmt in tree.body:
+        if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            continue
+
+        if isinstance(stmt, ast.With):
+            opened = _open_path(stmt)
+            if opened is None:
+                raise ScriptError(f'{path.name}:{stmt.lineno}: unsupported with-statement')
+            file_path, mode = opened
+            if 'r' in mode:
+                target = file_path
+            elif file_path != target:
+                raise ScriptError(f'{path.name}:{stmt.lineno}: writes {file_path!r} but read {target!r}')
+            continue
+
+        if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call):
+            call = stmt.value
+            if isinstance(call.func, ast.Name) and call.func.id == 'print':
+                messages.append(' '.join(str(value(arg)) for arg in call.args))
+                continue
+
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 and isinstance(stmt.targets[0], ast.Name):
+            name = stmt.targets[0].id
+            rhs = stmt.value
+            if isinstance(rhs, ast.Constant) and isinstance(rhs.value, str):
+                namespace[name] = rhs.value
+                continue
+            # content = replace_structural(content, old, new)
+            if isinstance(rhs, ast.Call) and isinstance(rhs.func, ast.Name) and rhs.func.id == 'replace_structural':
+                _, old, new = rhs.args[:3]
+                patches.append(Patch(label(old, stmt.lineno), value(old), value(new), stmt.lineno,
+                                     kind='structural'))
+                continue
+            # content = replace_node(content, 'Component > fetchX', new[, old])
+            if isinstance(rhs, ast.Call) and isinstance(rhs.func, ast.Name) and rhs.func.id == 'replace_node':
+                _, selector, new = rhs.args[:3]
+                old = rhs.args[3] if len(rhs.args) > 3 else next(
+                    (kw.value for kw in rhs.keywords if kw.arg == 'old'), None)
+                patches.append(Patch(value(selector), value(selector), value(new), stmt.lineno, kind='node',
+                                     expected=None if old is None else value(old)))
+                continue
+            if isinstance(rhs, ast.Call) and isinstance(rhs.func, ast.Attribute):
+                func = rhs.func
+                # content = content.replace(old, new)
+                if func.attr == 'replace' and isinstance(func.value, ast.Name) and func.value.id == name:
+                    old, new = rhs.args[:2]
+                    patches.append(Patch(label(old, stmt.lineno), value(old), value(new), stmt.lineno))
+                    continue
+                # content = re.sub(pattern, repl, content, flags=...)
+                if func.attr == 'sub' and isinstance(func.value, ast.Name) and func.value.id == 're':
+                    pattern, repl = rhs.args[:2]
+                    flags = 0
+                    for kw in rhs.keywords:
+                        if kw.arg == 'flags':
+                            flags = _RE_FLAGS[ast.unparse(kw.value).removeprefix('re.')]
+                    patches.append(Patch(label(pattern, stmt.lineno), value(pattern), value(repl),
+                                         stmt.lineno, kind='regex', flags=flags))
+                    continue
+
+        raise ScriptError(f'{path.name}:{stmt.lineno}: unsupported statement: {ast.unparse(stmt)[:60]}')
+
+    if target is None:
+        raise ScriptError(f'{path.name}: never opens a target file')
+    digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+    return Script(path.stem, path, target, patches, messages, digest)
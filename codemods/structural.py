@@ -0,0 +1,79 @@
+"""Formatting-insensitive anchors for JSX/TS snippets.
+
+Scripts used to hand-escape whole JSX blocks into ``re.DOTALL`` patterns, which
+is error-prone to write and can backtrack badly on large files.  Here both the
+file and the anchor are split into identifier/number/punctuation tokens once,
+whitespace is dropped, and the anchor's token sequence is found with KMP, so a
+match costs O(file + anchor) no matter how the snippet is indented or wrapped.
+The file's tokens are streamed, never held as a list, so memory stays
+O(anchor) however large the file is.
+"""
+from __future__ import annotations
+
+import re
+from collections import deque
+
+_TOKEN = re.compile(r'\w+|[^\w\s]')
+
+
+def tokenize(text: str) -> tuple[list[str], list[tuple[int, int]]]:
+    """Return the token strings of ``text`` and their (start, end) offsets."""
+    tokens: list[str] = []
+    spans: list[tuple[int, int]] = []
+    for match in _TOKEN.finditer(text):
+        tokens.append(match.group())
+        spans.append(match.span())
+    return tokens, spans
+
+
+def _failure(pattern: list[str]) -> list[int]:
+    table = [0] * len(pattern)
+    k = 0
+    for i in range(1, len(pattern)):
+        while k and pattern[i] != pattern[k]:
+            k = table[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        table[i] = k
+    return table
+
+
+def find_structural(text: str, anchor: str) -> list[tuple[int, int]]:
+    """Character spans of every non-overlapping token-level match of ``anchor``.
+
+    A span starts at the anchor's first token and ends after its last one, so
+    indentation before the match and the newline after it are left alone.
+    """
+    pattern, _ = tokenize(anchor)
+    if not pattern:
+        return []
+    table = _failure(pattern)
+    # Start offsets of the last len(pattern) tokens: a match's first token is among them
+    starts: deque[int] = deque(maxlen=len(pattern))
+
+    matches: list[tuple[int, int]] = []
+    k = 0
+    for match in _TOKEN.finditer(text):
+        token = match.group()
+        starts.append(match.start())
+        while k and token != pattern[k]:
+            k = table[k - 1]
+        if token == pattern[k]:
+            k += 1
+        if k == len(pattern):
+            matches.append((starts[0], match.end()))
+            k = 0  # non-overlapping, like str.replace
+    return matches
+
+
+def replace_structural(content: str, anchor: str, replacement: str) -> str:
+    """``content.replace(anchor, replacement)`` with whitespace-insensitive matching."""
+    replacement = replacement.strip()
+    parts: list[str] = []
+    last = 0
+    for start, end in find_structural(content, anchor):
+        parts.append(content[last:start])
+        parts.append(replacement)
+        last = end
+    parts.append(content[last:])
+    return ''.join(parts)
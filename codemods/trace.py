@@ -0,0 +1,69 @@
+"""Structured per-patch events for profiling a replay.
+
+Every replacement step the runner takes (literal, structural, regex or node)
+becomes one event with its target, script, anchor name, status, match count,
+offset, bytes scanned and elapsed nanoseconds.  ``write_trace`` emits them as
+JSON lines (``*.jsonl``) or, for any other suffix, as a Chrome trace that
+chrome://tracing and Perfetto open directly, with one track per target file.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Iterator
+
+from .runner import FileResult
+
+
+def patch_events(results: list[FileResult]) -> Iterator[dict]:
+    """One flat record per patch, in replay order."""
+    for file_result in results:
+        for patch in file_result.patches:
+            yield {
+                'target': file_result.target,
+                'script': patch.script,
+                'anchor': patch.patch,
+                'status': patch.status,
+                'cached': patch.cached,
+                'matches': patch.matches,
+                'offset': patch.offset,
+                'scanned': patch.scanned,
+                'elapsed_ns': patch.elapsed_ns,
+            }
+
+
+def write_jsonl(path: Path, results: list[FileResult]) -> None:
+    with path.open('w', encoding='utf-8') as f:
+        for event in patch_events(results):
+            f.write(json.dumps(event) + '\n')
+
+
+def chrome_trace(results: list[FileResult]) -> dict:
+    """Complete ("X") events in microseconds relative to the first file read."""
+    origin = min((r.started_ns for r in results), default=0)
+    events: list[dict] = []
+
+    def span(name: str, cat: str, tid: int, pid: int, start_ns: int, dur_ns: int, args: dict) -> None:
+        events.append({'name': name, 'cat': cat, 'ph': 'X', 'pid': pid, 'tid': tid,
+                       'ts': (start_ns - origin) / 1e3, 'dur': dur_ns / 1e3, 'args': args})
+
+    for tid, file_result in enumerate(results):
+        pid = file_result.pid
+        events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                       'args': {'name': file_result.target}})
+        span('read', 'io', tid, pid, file_result.started_ns, file_result.read_ns, {})
+        if file_result.plan is not None:
+            span('plan', 'plan', tid, pid, file_result.started_ns + file_result.read_ns,
+                 file_result.plan.elapsed_ns, {'ranges': len(file_result.plan.ranges)})
+        for event, patch in zip(patch_events([file_result]), file_result.patches):
+            span(f'{patch.script}:{patch.patch}', 'patch', tid, pid, patch.started_ns, patch.elapsed_ns, event)
+        if file_result.write_started_ns:
+            span('write', 'io', tid, pid, file_result.write_started_ns, file_result.write_ns, {})
+    return {'traceEvents': events, 'displayTimeUnit': 'ns'}
+
+
+def write_trace(path: Path, results: list[FileResult]) -> None:
+    if path.suffix == '.jsonl':
+        write_jsonl(path, results)
+    else:
+        path.write_text(json.dumps(chrome_trace(results)), encoding='utf-8')
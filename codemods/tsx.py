@@ -0,0 +1,361 @@
+"""Outline parser for the .ts/.tsx targets, shared by every patch of a run.
+
+This is not a full TypeScript grammar.  It lexes just enough (comments,
+strings, template literals and brackets) to match braces reliably and
+recognises the declarations patch scripts care about:
+
+* functions: ``function Name(...) {``, ``const name = (...) => {`` and
+  wrapped ones such as ``const Row = React.memo(function Row(...) {``
+* ``interface`` / ``class`` / ``enum`` bodies and ``const name = {`` objects
+* hook calls: ``useEffect(() => {`` (and ``useLayoutEffect``)
+* the run of consecutive ``const [x, setX] = useState(...)`` lines at the top
+  of a component, exposed as a ``useState`` node
+
+A node spans from the start of its header line to its closing brace; a
+wrapper's trailing ``, [deps])`` or ``)`` stays outside it.
+
+Nodes are addressed with selectors such as ``AccountsPage > useState`` or
+``AccountsPage > fetchAccountOrders``; ``name[1]`` picks the second match.
+After an edit only the smallest node containing it is re-parsed and
+everything after it is shifted, so later patches never parse from scratch.
+A header whose parameter list spans several lines is read as if the list
+were on one line.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from .matcher import splice
+
+_CODE = re.compile(
+    r"""//[^\n]*
+      | /\*.*?\*/
+      | (?<!\w)'(?:\\.|[^'\\\n])*'  # not after a word char: You've in JSX text
+      | "(?:\\.|[^"\\\n])*"
+      | [`{}()\[\]]""",
+    re.X | re.S,
+)
+_TEMPLATE = re.compile(r'(?:\\.|[^`\\$]|\$(?!\{))*(`|\$\{)', re.S)
+_CLOSERS = {'}': '{', ')': '(', ']': '['}
+
+_DECLARATIONS = [
+    ('function', re.compile(
+        r'[ \t]*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s+(\w+)\s*(?:<[^>]*>)?\s*\(.*\)\s*(?::[^{]+)?$')),
+    ('function', re.compile(r'[ \t]*(?:export\s+)?(?:const|let)\s+(\w+)\b.*=>\s*$')),
+    ('function', re.compile(
+        r'[ \t]*(?:export\s+)?(?:const|let)\s+(\w+)\s*=.*\bfunction\b[^(]*\(.*\)\s*(?::[^{]+)?$')),
+    ('hook', re.compile(r'[ \t]*(?:React\.)?(useEffect|useLayoutEffect)\s*\(.*=>\s*$')),
+    ('type', re.compile(r'[ \t]*(?:export\s+)?(?:default\s+)?(?:interface|class|enum)\s+(\w+)\b[^{]*$')),
+    ('const', re.compile(r'[ \t]*(?:export\s+)?(?:const|let)\s+(\w+)\s*(?::[^=]+)?=\s*$')),
+]
+_STATE = re.compile(r'^[ \t]*const\s+\[\s*\w+\s*,\s*set\w+\s*\]\s*=\s*(?:React\.)?useState\b[^(]*\(', re.M)
+
+
+class ParseError(Exception):
+    """Raised when braces, brackets or template literals do not balance."""
+
+
+class NodeNotFound(LookupError):
+    """Raised when a selector matches no node."""
+
+
+class NodeChanged(NodeNotFound):
+    """Raised when the selected node is not the text a patch was written against."""
+
+
+@dataclass
+class Node:
+    kind: str
+    name: str
+    start: int  # start of the declaration's first line (indentation included)
+    end: int  # just past the closing brace / last statement
+    body: int  # just past the opening brace; equals start for useState blocks
+    children: list['Node'] = field(default_factory=list)
+
+    def walk(self):
+        for child in self.children:
+            yield child
+            yield from child.walk()
+
+    def shift(self, delta: int) -> None:
+        self.start += delta
+        self.end += delta
+        self.body += delta
+        for child in self.children:
+            child.shift(delta)
+
+
+def _line_start(text: str, pos: int) -> int:
+    return text.rfind('\n', 0, pos) + 1
+
+
+def _line_end(text: str, pos: int) -> int:
+    end = text.find('\n', pos)
+    return len(text) if end < 0 else end
+
+
+def _brackets(text: str, lo: int, hi: int) -> tuple[list[tuple[int, int]], dict[int, int]]:
+    """Return matched ``{}`` pairs (in closing order) and a map of ``(`` -> ``)``."""
+    braces: list[tuple[int, int]] = []
+    parens: dict[int, int] = {}
+    stack: list[tuple[str, int]] = []  # ('{' | '(' | '[' | '`' | '${', offset)
+    pos = lo
+    while pos < hi:
+        if stack and stack[-1][0] == '`':
+            match = _TEMPLATE.match(text, pos, hi)
+            if match is None:
+                raise ParseError(f'unterminated template literal at offset {stack[-1][1]}')
+            pos = match.end()
+            if match.group(1) == '`':
+                stack.pop()
+            else:
+                stack.append(('${', pos - 2))
+            continue
+
+        match = _CODE.search(text, pos, hi)
+        if match is None:
+            break
+        token, pos = match.group(), match.end()
+        if token in '{([':
+            stack.append((token, match.start()))
+        elif token == '`':
+            stack.append(('`', match.start()))
+        elif token in _CLOSERS:
+            if not stack:
+                raise ParseError(f'unbalanced {token!r} at offset {match.start()}')
+            opener, offset = stack.pop()
+            if opener == '${' and token == '}':
+                continue
+            if opener != _CLOSERS[token]:
+                raise ParseError(f'{opener!r} at offset {offset} closed by {token!r} at {match.start()}')
+            if token == '}':
+                braces.append((offset, match.start()))
+            elif token == ')':
+                parens[offset] = match.start()
+    if stack:
+        raise ParseError(f'unclosed {stack[-1][0]!r} at offset {stack[-1][1]}')
+    return braces, parens
+
+
+def _header(text: str, brace: int, openers: dict[int, int]) -> tuple[int, str]:
+    """Start offset and text of the header before ``brace``.
+
+    Normally that is the rest of the brace's line.  When the line closes a
+    parameter list opened on an earlier line, the header starts on that line
+    and the list is folded to ``()``.
+    """
+    line = _line_start(text, brace)
+    header = text[line:brace]
+    close = header.rfind(')')
+    opener = openers.get(line + close) if close >= 0 else None
+    if opener is None or opener >= line:
+        return line, header
+    start = _line_start(text, opener)
+    return start, text[start:opener + 1] + header[close:]
+
+
+def _declaration(text: str, brace: int, openers: dict[int, int]) -> tuple[str, str, int] | None:
+    start, header = _header(text, brace, openers)
+    if header.count('{') != header.count('}'):
+        return None  # the brace sits inside an earlier block opened on this line
+    for kind, pattern in _DECLARATIONS:
+        match = pattern.match(header)
+        if match:
+            return kind, match.group(1), start
+    return None
+
+
+def _state_blocks(text: str, node: Node, parens: dict[int, int]) -> list[Node]:
+    """Runs of consecutive useState declarations directly inside ``node``."""
+    body_end = node.end - 1
+    blocks: list[Node] = []
+    current: Node | None = None
+    for match in _STATE.finditer(text, node.body, body_end):
+        if any(child.start <= match.start() < child.end for child in node.children):
+            continue
+        close = parens.get(match.end() - 1)
+        if close is None:
+            continue
+        end = _line_end(text, close)
+        if current is not None and text[current.end:match.start()].strip() == '':
+            current.end = end
+            continue
+        current = Node('state', 'useState', match.start(), end, match.start())
+        blocks.append(current)
+    return blocks
+
+
+def parse_outline(text: str, lo: int = 0, hi: int | None = None) -> list[Node]:
+    """Parse ``text[lo:hi]`` (a whole file or one declaration body) into nodes."""
+    hi = len(text) if hi is None else hi
+    braces, parens = _brackets(text, lo, hi)
+    openers = {close: open_ for open_, close in parens.items()}
+
+    # Closing order visits children before their parents
+    pending: list[Node] = []
+    for open_, close in braces:
+        children = []
+        while pending and pending[-1].body > open_:
+            children.append(pending.pop())
+        children.reverse()
+        declared = _declaration(text, open_, openers)
+        if declared is None:
+            pending.extend(children)  # anonymous block: lift its declarations up
+            continue
+        kind, name, start = declared
+        node = Node(kind, name, start, close + 1, open_ + 1, children)
+        if kind == 'function':
+            node.children = sorted(node.children + _state_blocks(text, node, parens), key=lambda n: n.start)
+        pending.append(node)
+    return pending
+
+
+_STEP = re.compile(r'^(\w+)(?:\[(\d+)\])?$')
+
+
+class SyntaxTree:
+    def __init__(self, text: str):
+        self.text = text
+        self.root = Node('module', '', 0, len(text), 0, parse_outline(text))
+        self.reparsed = 0  # characters re-parsed by incremental edits
+
+    def select(self, selector: str) -> Node:
+        scope = self.root
+        for step in selector.split('>'):
+            match = _STEP.match(step.strip())
+            if match is None:
+                raise NodeNotFound(f'bad selector step {step.strip()!r} in {selector!r}')
+            name, index = match.group(1), int(match.group(2) or 0)
+            found = [node for node in scope.walk() if node.name == name]
+            if len(found) <= index:
+                raise NodeNotFound(f'{selector!r}: no {step.strip()!r}')
+            scope = found[index]
+        return scope
+
+    def source(self, node: Node) -> str:
+        return self.text[node.start:node.end]
+
+    def edit(self, start: int, end: int, replacement: str) -> None:
+        """Replace ``text[start:end]`` and update the outline incrementally.
+
+        Only the smallest node whose span contains the edit is re-parsed: its
+        body when the edit falls inside it, otherwise the node itself.  Nodes
+        after the edit are shifted, so untouched siblings keep their identity.
+        """
+        delta = len(replacement) - (end - start)
+        self.text = self.text[:start] + replacement + self.text[end:]
+
+        path = [self.root]
+        while True:
+            inner = next((child for child in path[-1].children
+                          if child.kind != 'state' and _contains(child, start, end)), None)
+            if inner is None:
+                break
+            path.append(inner)
+        inside = [node is self.root or node.body <= start and end < node.end for node in path]
+
+        for ancestor in path[1:]:
+            ancestor.end += delta
+        self.root.end = len(self.text)
+        for ancestor in path:
+            for child in ancestor.children:
+                if child.start >= end and child not in path:
+                    child.shift(delta)
+
+        # A replacement that does not balance on its own falls back to the
+        # enclosing body, which always does
+        for depth in range(len(path) - 1, -1, -1):
+            try:
+                if inside[depth]:
+                    self._reparse_body(path[depth])
+                else:
+                    self._reparse_node(path[depth - 1], path[depth])
+                return
+            except ParseError:
+                if depth == 0:
+                    raise
+
+    def _reparse_body(self, node: Node) -> None:
+        hi = node.end - 1 if node is not self.root else len(self.text)
+        children = parse_outline(self.text, node.body, hi)
+        self.reparsed += hi - node.body
+        if node.kind == 'function':
+            _, parens = _brackets(self.text, node.body, hi)
+            node.children = children
+            children = sorted(children + _state_blocks(self.text, node, parens), key=lambda n: n.start)
+        node.children = children
+
+    def _reparse_node(self, parent: Node, node: Node) -> None:
+        replaced = parse_outline(self.text, node.start, node.end)
+        self.reparsed += node.end - node.start
+        index = next(i for i, child in enumerate(parent.children) if child is node)
+        parent.children[index:index + 1] = replaced
+
+
+def _contains(node: Node, start: int, end: int) -> bool:
+    """Whether an edit of ``[start, end)`` lies within ``node``'s span.
+
+    A pure insertion on the node's boundary belongs to the enclosing scope.
+    """
+    if start == end:
+        return node.start < start < node.end
+    return node.start <= start and end <= node.end
+
+
+def replace_node(content: str, selector: str, replacement: str, old: str | None = None) -> str:
+    """Replace the whole declaration matched by ``selector`` with ``replacement``.
+
+    ``replacement`` should carry its own indentation, like the ``new_*`` blocks
+    in the patch scripts; the node's span starts at the beginning of its line.
+    With ``old``, the node must read exactly ``old`` (a trailing newline aside),
+    so a declaration edited since the patch was written is not overwritten.
+    """
+    tree = SyntaxTree(content)
+    node = tree.select(selector)
+    if old is not None and tree.source(node) != old.rstrip('\n'):
+        raise NodeChanged(selector)
+    tree.edit(node.start, node.end, replacement)
+    return tree.text
+
+
+class Document:
+    """One target's in-memory text plus its outline, parsed at most once.
+
+    The runner threads a single ``Document`` through every script of a target.
+    The tree is only built when a node patch first asks for it; after that,
+    splice edits are folded into it incrementally instead of re-parsing.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.parses = 0
+        self._tree: SyntaxTree | None = None
+
+    @property
+    def tree(self) -> SyntaxTree:
+        if self._tree is None:
+            self._tree = SyntaxTree(self.text)
+            self.parses += 1
+        return self._tree
+
+    def apply(self, edits: list[tuple[int, int, str]]) -> None:
+        """Apply non-overlapping (start, end, replacement) edits to the current text."""
+        if not edits:
+            return
+        text = splice(self.text, edits)
+        if self._tree is not None:
+            try:
+                # Right to left, so earlier offsets stay valid
+                for start, end, replacement in sorted(edits, reverse=True):
+                    self._tree.edit(start, end, replacement)
+            except ParseError:
+                self._tree = None  # an intermediate edit unbalanced a block
+        self.text = text
+
+    def replace(self, text: str) -> None:
+        """Swap in text produced outside the tree (e.g. by ``re.sub``)."""
+        if text != self.text:
+            self.text = text
+            self._tree = None
+
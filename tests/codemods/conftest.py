@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from codemods.script import Patch, Script
+
+
+@pytest.fixture
+def target() -> str:
+    """The one file every synthetic script in these tests reads and writes."""
+    return 'page.tsx'
+
+
+@pytest.fixture
+def page(tmp_path: Path, target: str) -> Path:
+    return tmp_path / target
+
+
+@pytest.fixture
+def write_script(tmp_path: Path, target: str):
+    """Write a one-patch script in the shape of the repo's patch scripts."""
+
+    def write(name: str, old: str, new: str) -> Path:
+        path = tmp_path / f'{name}.py'
+        path.write_text(
+            f"with open({target!r}, 'r', encoding='utf-8') as f:\n"
+            f"    content = f.read()\n"
+            f"content = content.replace({old!r}, {new!r})\n"
+            f"with open({target!r}, 'w', encoding='utf-8') as f:\n"
+            f"    f.write(content)\n",
+            encoding='utf-8',
+        )
+        return path
+
+    return write
+
+
+@pytest.fixture
+def make_script(target: str):
+    """Build a Script from (old, new) pairs without writing it to disk."""
+
+    def make(name: str, *patches: tuple[str, str]) -> Script:
+        return Script(name, Path(f'{name}.py'), target,
+                      [Patch(f'p{i}', old, new, i) for i, (old, new) in enumerate(patches)], digest=name)
+
+    return make
@@ -0,0 +1,45 @@
+from codemods.api_urls import API_IMPORT, rewrite
+
+
+def test_each_spelling_becomes_get_api_url():
+    text = ("import React from 'react'\n"
+            "fetch('http://localhost:2000/api/accounts')\n"
+            "const a = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:2000'\n"
+            "const b = process.env.NEXT_PUBLIC_API_URL || ''\n")
+    updated, count = rewrite(text)
+    assert count == 3
+    assert updated == ("import React from 'react'\n"
+                       f"{API_IMPORT}\n"
+                       "fetch(`${getApiUrl()}/api/accounts`)\n"
+                       "const a = getApiUrl()\n"
+                       "const b = getApiUrl()\n")
+
+
+def test_quoted_literal_escapes_what_a_template_would_read():
+    updated, count = rewrite("fetch('http://localhost:2000/api/x?tag=${id}&q=`a`')\n")
+    assert count == 1
+    assert 'fetch(`${getApiUrl()}/api/x?tag=\\${id}&q=\\`a\\``)' in updated
+
+
+def test_guard_on_the_env_var_is_left_alone():
+    text = ("if (!process.env.NEXT_PUBLIC_API_URL) {\n"
+            "  throw new Error('NEXT_PUBLIC_API_URL is not set')\n"
+            "}\n")
+    assert rewrite(text) == (text, 0)
+
+
+def test_import_merges_into_an_existing_api_import():
+    text = ("import { apiFetch } from '@/lib/api'\n"
+            "const url = (process.env.NEXT_PUBLIC_API_URL || '') + '/api/x'\n")
+    updated, count = rewrite(text)
+    assert count == 1
+    assert updated == ("import { getApiUrl, apiFetch } from '@/lib/api'\n"
+                       "const url = getApiUrl() + '/api/x'\n")
+    assert rewrite(updated) == (updated, 0)
+
+
+def test_import_goes_below_a_use_client_directive():
+    text = "'use client'\n\nexport const base = process.env.NEXT_PUBLIC_API_URL || ''\n"
+    updated, count = rewrite(text)
+    assert count == 1
+    assert updated == f"'use client'\n\n{API_IMPORT}\n\nexport const base = getApiUrl()\n"
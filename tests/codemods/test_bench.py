@@ -0,0 +1,49 @@
+from codemods.bench import baseline_entries, regressions
+from codemods.runner import APPLIED, run_file
+from codemods.script import Patch, Script
+
+
+def case(script='fix', size=2_000, wall_ns=10_000_000, calibration_ns=10_000_000, rss_ratio=1.0):
+    return {'script': script, 'size': size, 'wall_ns': wall_ns, 'calibration_ns': calibration_ns,
+            'wall_ratio': wall_ns / calibration_ns, 'rss_ratio': rss_ratio, 'peak_rss_kb': 20_000}
+
+
+def test_baseline_keeps_only_ratios():
+    assert baseline_entries([case()]) == [{'script': 'fix', 'size': 2_000, 'wall_ratio': 1.0, 'rss_ratio': 1.0}]
+
+
+def test_slower_machine_is_not_a_regression():
+    baseline = baseline_entries([case(wall_ns=50_000_000)])
+    # Twice the time, but the calibration took twice as long too
+    slower = case(wall_ns=100_000_000, calibration_ns=20_000_000)
+    assert regressions([slower], baseline, tolerance=1.5) == []
+
+
+def test_ratio_growth_beyond_tolerance_fails():
+    baseline = baseline_entries([case(wall_ns=50_000_000)])
+    failures = regressions([case(wall_ns=100_000_000, rss_ratio=2.0)], baseline, tolerance=1.5)
+    assert len(failures) == 2
+    assert failures[0].startswith('fix @ 2000 lines: 10.00x vs 5.00x')
+
+
+def test_growth_within_timer_noise_is_ignored():
+    baseline = baseline_entries([case(wall_ns=1_000_000)])
+    assert regressions([case(wall_ns=3_000_000)], baseline, tolerance=1.5) == []
+
+
+def test_unknown_cases_are_skipped():
+    assert regressions([case(script='new', wall_ns=10**9)], baseline_entries([case()]), tolerance=1.5) == []
+
+
+def test_shared_pass_bytes_are_attributed_to_each_patch(tmp_path, target, page):
+    text = 'const a = 1\nconst b = 2\n'
+    page.write_text(text, encoding='utf-8')
+    script = Script('fix', tmp_path / 'fix.py', target, [
+        Patch('a', 'const a = 1', 'const a = 10', 1),
+        Patch('b', 'const b = 2', 'const b = 20', 2),
+    ])
+    result = run_file(tmp_path, target, [script])
+    assert [(p.status, p.scanned) for p in result.patches] == [(APPLIED, len(text))] * 2
+    # The planning replay and the shared apply pass, each counted once
+    assert result.plan.scanned > len(text)
+    assert result.scanned == result.plan.scanned + len(text)
@@ -0,0 +1,55 @@
+import codemods.runner as runner
+from codemods.cache import ResultCache, content_hash
+from codemods.runner import ALREADY_APPLIED, APPLIED, run_file
+from codemods.script import load_script
+
+def test_record_marks_input_and_output_as_applied(tmp_path):
+    cache = ResultCache(tmp_path / 'cache.json')
+    cache.record('script', 'in', 'out')
+    assert not cache.is_applied('script', 'in')
+    assert cache.is_applied('script', 'out')
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_save_and_reload_round_trips(tmp_path):
+    path = tmp_path / 'cache.json'
+    cache = ResultCache(path)
+    cache.record('script', 'in', 'out')
+    cache.save()
+    assert ResultCache(path).is_applied('script', 'out')
+
+
+def test_merge_folds_in_worker_entries_and_counters(tmp_path):
+    parent = ResultCache(tmp_path / 'cache.json')
+    worker = ResultCache(tmp_path / 'cache.json')
+    worker.record('script', 'in', 'out')
+    worker.is_applied('script', 'out')
+    parent.merge(worker)
+    assert parent.hits == 1
+    assert parent.is_applied('script', 'out')
+
+
+def test_cached_rerun_skips_planning_and_scanning(tmp_path, target, page, write_script, monkeypatch):
+    page.write_text('const a = 1\n', encoding='utf-8')
+    scripts = [
+        load_script(write_script('first', 'const a = 1', 'const a = 2')),
+        load_script(write_script('second', 'const a = 2', 'const a = 3')),
+    ]
+    cache = ResultCache(tmp_path / 'cache.json')
+
+    first = run_file(tmp_path, target, scripts, cache)
+    assert [p.status for p in first.patches] == [APPLIED, APPLIED]
+    page.write_text(first.content, encoding='utf-8')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('a fully cached file must not be planned or scanned')
+
+    monkeypatch.setattr(runner, 'plan_target', fail)
+    monkeypatch.setattr(runner, 'apply_script', fail)
+    hits = cache.hits
+    rerun = run_file(tmp_path, target, scripts, cache)
+    assert [(p.status, p.cached) for p in rerun.patches] == [(ALREADY_APPLIED, True)] * 2
+    assert not rerun.changed
+    assert rerun.scanned == 0
+    assert cache.hits == hits + 1
+    assert content_hash(rerun.content) == content_hash('const a = 3\n')
@@ -0,0 +1,57 @@
+from codemods.cache import ResultCache
+from codemods.ledger import AppliedLedger
+from codemods.manifest import REPO_ROOT, load_manifest
+from codemods.runner import APPLIED, RECORDED, run_batch
+from codemods.script import load_script
+
+
+def test_recorded_manifest_is_skipped_until_a_script_changes(tmp_path):
+    scripts = load_manifest()
+    ledger = AppliedLedger(tmp_path / 'applied.json')
+    for script in scripts:
+        ledger.record(script)
+    ledger.save()
+
+    ledger = AppliedLedger(tmp_path / 'applied.json')
+    results = run_batch(scripts, REPO_ROOT, dry_run=True, jobs=1, ledger=ledger)
+    assert {p.status for r in results for p in r.patches} == {RECORDED}
+    assert not any(r.changed for r in results)
+
+    edited = tmp_path / scripts[0].path.name
+    edited.write_text(scripts[0].path.read_text(encoding='utf-8') + '# edited\n', encoding='utf-8')
+    assert not ledger.is_applied(load_script(edited))
+    assert all(ledger.is_applied(script) for script in scripts)
+
+
+def test_dry_run_persists_nothing(tmp_path, page, write_script):
+    page.write_text('const a = 1\n', encoding='utf-8')
+    script = load_script(write_script('fix', 'const a = 1', 'const a = 2'))
+    cache = ResultCache(tmp_path / 'cache.json')
+    ledger = AppliedLedger(tmp_path / 'applied.json')
+
+    results = run_batch([script], tmp_path, dry_run=True, cache=cache, ledger=ledger)
+    assert results[0].changed
+    assert page.read_text(encoding='utf-8') == 'const a = 1\n'
+    assert not (tmp_path / 'cache.json').exists()
+    assert not (tmp_path / 'applied.json').exists()
+
+    run_batch([script], tmp_path, cache=cache, ledger=ledger)
+    assert page.read_text(encoding='utf-8') == 'const a = 2\n'
+    assert (tmp_path / 'cache.json').exists()
+    assert AppliedLedger(tmp_path / 'applied.json').is_applied(script)
+
+
+def test_ledger_skips_recorded_scripts_until_they_change(tmp_path, page, write_script):
+    page.write_text('const a = 1\n', encoding='utf-8')
+    ledger = AppliedLedger(tmp_path / 'applied.json')
+    ledger.record(load_script(write_script('fix', 'const b = 1', 'const b = 2')))
+
+    # The anchor is gone, but the script is recorded: nothing to replay
+    [result] = run_batch([load_script(tmp_path / 'fix.py')], tmp_path, ledger=ledger)
+    assert [p.status for p in result.patches] == [RECORDED]
+
+    # A changed script runs again
+    edited = load_script(write_script('fix', 'const a = 1', 'const a = 3'))
+    [result] = run_batch([edited], tmp_path, ledger=ledger)
+    assert [p.status for p in result.patches] == [APPLIED]
+    assert ledger.is_applied(edited)
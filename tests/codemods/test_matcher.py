@@ -0,0 +1,44 @@
+import pickle
+
+from codemods.matcher import AnchorIndex, AnchorNotFound, non_overlapping, splice
+
+
+def test_find_all_returns_every_offset_in_one_pass():
+    index = AnchorIndex(['const', 'useState', 'State'])
+    text = 'const [a, setA] = useState(0)\nconst b = useState(1)'
+    hits = index.find_all(text)
+    assert hits['const'] == [0, 30]
+    assert hits['useState'] == [18, 40]
+    assert hits['State'] == [21, 43]
+
+
+def test_find_all_reports_overlapping_occurrences():
+    hits = AnchorIndex(['aa']).find_all('aaaa')
+    assert hits['aa'] == [0, 1, 2]
+    assert non_overlapping(hits['aa'], 2) == [0, 2]
+
+
+def test_missing_anchor_has_no_hits():
+    hits = AnchorIndex(['present', 'absent']).find_all('only present here')
+    assert hits == {'present': [5], 'absent': []}
+
+
+def test_empty_and_duplicate_anchors_are_ignored():
+    index = AnchorIndex(['', 'x', 'x'])
+    assert index.anchors == ['x']
+
+
+def test_non_overlapping_matches_str_replace():
+    text = 'ababab'
+    offsets = non_overlapping(AnchorIndex(['aba']).find_all(text)['aba'], 3)
+    assert splice(text, [(o, o + 3, 'X') for o in offsets]) == text.replace('aba', 'X')
+
+
+def test_splice_applies_edits_in_offset_order():
+    assert splice('0123456789', [(7, 9, 'b'), (1, 3, 'a')]) == '0a3456b9'
+
+
+def test_anchor_not_found_survives_pickling():
+    error = pickle.loads(pickle.dumps(AnchorNotFound('script', 'patch', 'page.tsx')))
+    assert (error.script, error.patch, error.target) == ('script', 'patch', 'page.tsx')
+    assert str(error) == 'script:patch: anchor not found in page.tsx'
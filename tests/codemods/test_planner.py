@@ -0,0 +1,112 @@
+from dataclasses import replace
+
+import pytest
+
+from codemods.intervals import IntervalTree
+from codemods.manifest import REPO_ROOT, load_manifest
+from codemods.planner import PatchConflict, pending_offsets, plan_target
+from codemods.runner import ALREADY_APPLIED, group_by_target, run_file
+from codemods.script import Patch, load_script
+
+def test_interval_tree_yields_only_overlapping_ranges():
+    tree = IntervalTree([(0, 5, 'a'), (5, 10, 'b'), (3, 7, 'c'), (20, 30, 'd')])
+    assert sorted(item[2] for item in tree.overlapping(4, 6)) == ['a', 'b', 'c']
+    assert sorted(item[2] for item in tree.overlapping(5, 6)) == ['b', 'c']
+    assert list(tree.overlapping(10, 20)) == []
+    assert len(tree) == 4
+
+
+def test_interval_tree_matches_brute_force():
+    intervals = [(i * 7 % 50, i * 7 % 50 + i % 9 + 1, i) for i in range(40)]
+    tree = IntervalTree(intervals)
+    for start in range(0, 60, 3):
+        end = start + 4
+        expected = {i for s, e, i in intervals if s < end and e > start}
+        assert {item[2] for item in tree.overlapping(start, end)} == expected
+
+
+def test_pending_offsets_skip_anchors_already_inside_their_replacement():
+    patch = Patch('p', 'foo()', 'foo()\nbar()', 0)
+    # 'foo()\nbar()\nfoo()': the first foo() is the applied replacement
+    assert pending_offsets(patch, [0, 12], [0]) == [12]
+
+
+def test_overlapping_patches_from_different_scripts_conflict(target, make_script):
+    content = 'const a = 1\nconst b = 2\n'
+    first = make_script('first', ('const a = 1\nconst b', 'const a = 1\nlet b'))
+    second = make_script('second', ('const b = 2', 'const b = 3'))
+    plan = plan_target(content, target, [first, second])
+    assert [(c.first.script, c.second.script) for c in plan.conflicts] == [('first', 'second')]
+
+
+def test_patches_of_one_script_may_touch(target, make_script):
+    content = 'const a = 1\n'
+    only = make_script('only', ('const a', 'let a'), ('a = 1', 'a = 2'))
+    assert plan_target(content, target, [only]).conflicts == []
+
+
+def test_anchor_introduced_by_an_earlier_patch_is_a_dependency(target, make_script):
+    content = 'const a = 1\n'
+    first = make_script('first', ('const a = 1', 'const a = 1\nconst b = 2'))
+    second = make_script('second', ('const b = 2', 'const b = 3'))
+    plan = plan_target(content, target, [first, second])
+    assert plan.conflicts == []
+    assert [(d.script, d.after) for d in plan.dependencies] == [('second', 'first:p0')]
+
+
+def test_run_file_refuses_conflicting_chains(tmp_path, target, page, make_script):
+    page.write_text('const a = 1\nconst b = 2\n', encoding='utf-8')
+    first = make_script('first', ('1\nconst b', '1\nlet b'))
+    second = make_script('second', ('const b = 2', 'const b = 3'))
+    with pytest.raises(PatchConflict) as error:
+        run_file(tmp_path, target, [first, second])
+    assert error.value.target == target
+
+
+def test_appending_to_an_anchor_of_a_later_script_is_not_a_conflict(tmp_path, target, page, make_script):
+    content = 'const a = 1\nconst b = 2\n'
+    first = make_script('first', ('const a = 1\nconst b = 2', 'const a = 1\nconst b = 2\nconst c = 3'))
+    second = make_script('second', ('const b = 2\n', 'const b = 20\n'))
+    plan = plan_target(content, target, [first, second])
+    assert plan.conflicts == []
+    assert plan.edits == 2
+
+    page.write_text(content, encoding='utf-8')
+    result = run_file(tmp_path, target, [first, second])
+    assert result.content == 'const a = 1\nconst b = 20\nconst c = 3\n'
+
+
+def test_state_blocks_of_the_accounts_page_replay_in_order():
+    # add-sort-filter appends to the state block that the hover button and
+    # infinite scroll scripts anchor on: an overlap, but not a conflict
+    names = ['add-sort-filter', 'add-orders-hover-button', 'add-infinite-scroll']
+    scripts = []
+    for name in names:
+        loaded = load_script(REPO_ROOT / f'{name}.py')
+        scripts.append(replace(loaded, patches=[p for p in loaded.patches if p.name == 'old_state']))
+    content = f'export default function AccountsPage() {{\n{scripts[0].patches[0].old}\n}}\n'
+
+    plan = plan_target(content, scripts[0].target, scripts)
+    assert len({r.script for r in plan.ranges}) == 3
+    assert plan.conflicts == []
+    assert plan.missing == []
+
+
+def test_chain_with_nothing_left_to_do_is_already_applied(tmp_path, target, page, make_script):
+    content = 'const a = 10\nconst b = 20\n'
+    first = make_script('first', ('const a = 1\n', 'const a = 10\n'))
+    second = make_script('second', ('const b = 2\n', 'const b = 20\n'))
+    plan = plan_target(content, target, [first, second])
+    assert plan.applied
+    assert plan.scanned == len(content)
+
+    page.write_text(content, encoding='utf-8')
+    result = run_file(tmp_path, target, [first, second])
+    assert {p.status for p in result.patches} == {ALREADY_APPLIED}
+    assert not result.changed
+
+
+def test_manifest_plans_without_conflicts_on_the_checked_in_tree():
+    for target, group in group_by_target(load_manifest()).items():
+        plan = plan_target((REPO_ROOT / target).read_text(encoding='utf-8'), target, group)
+        assert plan.conflicts == [], target
@@ -0,0 +1,85 @@
+import contextlib
+import io
+import runpy
+from collections import Counter
+from pathlib import Path
+
+from codemods.manifest import load_manifest
+from codemods.runner import APPLIED, group_by_target, run_batch
+
+ACCOUNTS_PAGE = 'apps/web/src/app/(dashboard)/accounts/page.tsx'
+
+# The earlier accounts page scripts were written against different revisions
+# of the page (update-accounts-display and update-accounts-grid both rewrite
+# the original map block), so no single file is a pre-edit state of the whole
+# chain.  From here on the declared order replays as written.
+ACCOUNTS_PAGE_FROM = 'improve-order-popup-readability'
+
+
+def reconstruct(scripts):
+    """A text the chain applies to: undo every patch from last to first.
+
+    A replacement that is not in the text yet was made to text nothing later
+    changed, so its anchor is added as a block of its own.
+    """
+    text = ''
+    for patch in reversed([patch for script in scripts for patch in script.patches]):
+        if patch.new and patch.new in text:
+            text = text.replace(patch.new, patch.old)
+        else:
+            text = f'{patch.old}\n{text}'
+    return text
+
+
+def replay_chains():
+    chains = group_by_target(load_manifest())
+    names = [script.name for script in chains[ACCOUNTS_PAGE]]
+    chains[ACCOUNTS_PAGE] = chains[ACCOUNTS_PAGE][names.index(ACCOUNTS_PAGE_FROM):]
+    return [script for chain in chains.values() for script in chain]
+
+
+def write_targets(root, scripts):
+    for target, chain in group_by_target(scripts).items():
+        path = root / target
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(reconstruct(chain), encoding='utf-8')
+
+
+def test_batch_replays_the_manifest_with_one_write_per_target(tmp_path, monkeypatch):
+    scripts = replay_chains()
+    batched, one_by_one = tmp_path / 'batched', tmp_path / 'one_by_one'
+    write_targets(batched, scripts)
+    write_targets(one_by_one, scripts)
+
+    # The scripts themselves, each reading and writing the file
+    with monkeypatch.context() as patched:
+        patched.chdir(one_by_one)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for script in scripts:
+                runpy.run_path(str(script.path))
+
+    reads, writes = Counter(), Counter()
+    read_text, write_text = Path.read_text, Path.write_text
+
+    def counting_read(path, *args, **kwargs):
+        reads[path.relative_to(batched).as_posix()] += 1
+        return read_text(path, *args, **kwargs)
+
+    def counting_write(path, *args, **kwargs):
+        writes[path.relative_to(batched).as_posix()] += 1
+        return write_text(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, 'read_text', counting_read)
+    monkeypatch.setattr(Path, 'write_text', counting_write)
+    results = run_batch(scripts, batched, jobs=1)
+    monkeypatch.undo()
+
+    targets = {script.target for script in scripts}
+    assert len(targets) == 4
+    assert {p.status for r in results for p in r.patches} == {APPLIED}
+    assert sum(len(r.patches) for r in results) == sum(len(s.patches) for s in scripts)
+    for target in targets:
+        assert (batched / target).read_text(encoding='utf-8') == (one_by_one / target).read_text(encoding='utf-8')
+    # One read to plan and one to check nothing changed before the single write
+    assert writes == Counter(dict.fromkeys(targets, 1))
+    assert reads == Counter(dict.fromkeys(targets, 2))
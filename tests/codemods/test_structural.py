@@ -0,0 +1,45 @@
+from codemods.manifest import REPO_ROOT
+from codemods.runner import ALREADY_APPLIED, APPLIED, run_file
+from codemods.script import load_script
+from codemods.structural import find_structural, replace_structural, tokenize
+
+
+def test_tokens_drop_whitespace_and_keep_offsets():
+    tokens, spans = tokenize('<td key={txn.id}>\n  {txn.total}')
+    assert tokens[:6] == ['<', 'td', 'key', '=', '{', 'txn']
+    assert spans[1] == (1, 3)
+
+
+def test_anchor_matches_however_it_is_wrapped():
+    text = 'a\n  <Link\n    href={`/orders/${txn.id}`}\n  >\n    {txn.orderNo}\n  </Link>\nb'
+    anchor = '<Link href={`/orders/${txn.id}`}>{txn.orderNo}</Link>'
+    [(start, end)] = find_structural(text, anchor)
+    assert text[start:end].startswith('<Link') and text[start:end].endswith('</Link>')
+
+
+def test_tokens_must_match_exactly():
+    assert find_structural('{txn.seller}', '{txn.sellers}') == []
+    assert find_structural('anything', '   ') == []
+
+
+def test_replace_keeps_surrounding_whitespace_like_str_replace():
+    text = '  <b>x</b>\n  <b>x</b>\n'
+    assert replace_structural(text, '<b>\n  x\n</b>', '<i>y</i>\n') == '  <i>y</i>\n  <i>y</i>\n'
+
+
+def test_product_detail_anchor_replays_on_a_reformatted_page(tmp_path):
+    script = load_script(REPO_ROOT / 'update-product-detail.py')
+    [patch] = script.patches
+    assert patch.kind == 'structural'
+
+    # Same tokens, different indentation and line breaks
+    reformatted = '\n'.join(line.strip() for line in patch.old.splitlines())
+    page = tmp_path / script.target
+    page.parent.mkdir(parents=True)
+    page.write_text(f'<div>\n{reformatted}\n</div>\n', encoding='utf-8')
+    result = run_file(tmp_path, script.target, [script])
+    assert [p.status for p in result.patches] == [APPLIED]
+    assert result.content == f'<div>\n{patch.new.strip()}\n</div>\n'
+
+    page.write_text(result.content, encoding='utf-8')
+    assert [p.status for p in run_file(tmp_path, script.target, [script]).patches] == [ALREADY_APPLIED]
@@ -0,0 +1,59 @@
+import json
+
+from codemods.runner import ALREADY_APPLIED, APPLIED, FileResult, PatchResult, run_file
+from codemods.trace import chrome_trace, patch_events, write_trace
+
+
+def results():
+    """Two targets on a fixed clock: a.tsx starts at 1 ms, b.tsx at 3 ms."""
+    first = FileResult('a.tsx', [
+        PatchResult('one', 'old_a', APPLIED, 2, 10, 4_000, scanned=120, started_ns=1_500_000),
+        PatchResult('two', 'line 7', ALREADY_APPLIED, 0, None, 1_000, cached=True, started_ns=1_600_000),
+    ], pid=11, started_ns=1_000_000, read_ns=200_000, write_started_ns=1_700_000, write_ns=50_000)
+    second = FileResult('b.tsx', [
+        PatchResult('three', 'old_b', APPLIED, 1, 0, 2_000, started_ns=3_300_000),
+    ], pid=12, started_ns=3_000_000, read_ns=100_000)
+    return [first, second]
+
+
+def test_patch_events_carry_one_record_per_patch(page, make_script):
+    page.write_text('<b>x</b>\n<b>x</b>\n', encoding='utf-8')
+    result = run_file(page.parent, page.name, [make_script('bold', ('<b>x</b>', '<i>x</i>'))])
+    [event] = patch_events([result])
+    timings = {key: event.pop(key) for key in ('scanned', 'elapsed_ns')}
+    assert event == {'target': page.name, 'script': 'bold', 'anchor': 'p0', 'status': APPLIED,
+                     'cached': False, 'matches': 2, 'offset': 0}
+    assert timings['scanned'] > 0 and timings['elapsed_ns'] >= 0
+
+
+def test_jsonl_writes_one_event_per_line(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    write_trace(path, results())
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line) for line in lines] == list(patch_events(results()))
+    assert [json.loads(line)['anchor'] for line in lines] == ['old_a', 'line 7', 'old_b']
+
+
+def test_chrome_trace_has_relative_spans_and_a_track_per_target(tmp_path):
+    path = tmp_path / 'trace.json'
+    write_trace(path, results())
+    trace = json.loads(path.read_text(encoding='utf-8'))
+    assert trace == chrome_trace(results())
+    events = trace['traceEvents']
+
+    names = [(e['pid'], e['tid'], e['args']['name']) for e in events if e['ph'] == 'M']
+    assert names == [(11, 0, 'a.tsx'), (12, 1, 'b.tsx')]
+    assert all(e['name'] == 'thread_name' for e in events if e['ph'] == 'M')
+
+    spans = {(e['tid'], e['name']): (e['ts'], e['dur']) for e in events if e['ph'] == 'X'}
+    # Microseconds from the earliest file read
+    assert spans == {
+        (0, 'read'): (0.0, 200.0),
+        (0, 'one:old_a'): (500.0, 4.0),
+        (0, 'two:line 7'): (600.0, 1.0),
+        (0, 'write'): (700.0, 50.0),
+        (1, 'read'): (2000.0, 100.0),
+        (1, 'three:old_b'): (2300.0, 2.0),
+    }
+    [patch] = [e for e in events if e['name'] == 'two:line 7']
+    assert patch['cat'] == 'patch' and patch['args']['cached'] is True
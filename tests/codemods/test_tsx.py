@@ -0,0 +1,182 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from codemods.manifest import REPO_ROOT
+from codemods.runner import ALREADY_APPLIED, APPLIED, run_file
+from codemods.script import load_script
+from codemods.matcher import AnchorNotFound
+from codemods.tsx import Document, NodeChanged, NodeNotFound, ParseError, SyntaxTree, parse_outline, replace_node
+
+PAGE = '''\
+'use client'
+import React, { useState, useEffect } from 'react'
+
+interface RowProps {
+  name: string
+}
+
+const Row = React.memo(function Row({
+  name,
+}: RowProps) {
+  return <tr><td>{name}</td></tr>
+})
+
+export default function AccountsPage() {
+  const [accounts, setAccounts] = useState<string[]>([])
+  const [isLoading, setIsLoading] = useState(true)
+
+  useEffect(() => {
+    fetchAccounts()
+  }, [])
+
+  const fetchAccounts = async (
+    cursor: string | null = null,
+  ) => {
+    setIsLoading(true)
+  }
+
+  return <table>{accounts.map(name => <Row key={name} name={name} />)}</table>
+}
+'''
+
+
+def outline(text):
+    return [(node.kind, node.name) for node in SyntaxTree(text).root.walk()]
+
+
+def test_outline_recognises_declarations():
+    assert outline(PAGE) == [
+        ('type', 'RowProps'),
+        ('function', 'Row'),
+        ('function', 'AccountsPage'),
+        ('state', 'useState'),
+        ('hook', 'useEffect'),
+        ('function', 'fetchAccounts'),
+    ]
+
+
+def test_multi_line_header_starts_on_the_declaration_line():
+    tree = SyntaxTree(PAGE)
+    row = tree.select('Row')
+    assert tree.source(row).startswith('const Row = React.memo(function Row({')
+    assert tree.source(row).endswith('</tr>\n}')
+    fetch = tree.select('AccountsPage > fetchAccounts')
+    assert tree.source(fetch).startswith('  const fetchAccounts = async (\n')
+
+
+def test_selector_index_and_missing_node():
+    tree = SyntaxTree(PAGE)
+    assert tree.select('AccountsPage > useState').kind == 'state'
+    with pytest.raises(NodeNotFound):
+        tree.select('AccountsPage > fetchAccountOrders')
+    with pytest.raises(NodeNotFound):
+        tree.select('useEffect[1]')
+
+
+def test_unbalanced_text_is_a_parse_error():
+    with pytest.raises(ParseError):
+        parse_outline('function a() {\n  return (\n}\n')
+
+
+def test_incremental_edit_matches_a_fresh_parse():
+    tree = SyntaxTree(PAGE)
+    fetch = tree.select('AccountsPage > fetchAccounts')
+    tree.edit(fetch.start, fetch.end, '  const fetchAccounts = async () => {\n    setIsLoading(false)\n  }')
+
+    fresh = SyntaxTree(tree.text)
+    edited = [(n.kind, n.name, n.start, n.end, n.body) for n in tree.root.walk()]
+    assert edited == [(n.kind, n.name, n.start, n.end, n.body) for n in fresh.root.walk()]
+    assert 0 < tree.reparsed < len(tree.text)
+
+
+def test_edit_reparses_only_the_replaced_node():
+    tree = SyntaxTree(PAGE)
+    row = tree.select('Row')
+    page = tree.select('AccountsPage')
+    state = tree.select('AccountsPage > useState')
+    effect = tree.select('AccountsPage > useEffect')
+    fetch = tree.select('AccountsPage > fetchAccounts')
+    replacement = '  const fetchAccounts = async () => {\n    setIsLoading(false)\n  }'
+    tree.edit(fetch.start, fetch.end, replacement)
+
+    assert tree.reparsed == len(replacement)
+    assert tree.select('Row') is row
+    assert tree.select('AccountsPage') is page
+    assert tree.select('AccountsPage > useState') is state
+    assert tree.select('AccountsPage > useEffect') is effect
+    assert tree.source(tree.select('AccountsPage > fetchAccounts')) == replacement
+    assert tree.source(page).endswith('</table>\n}')
+
+
+def test_edit_inside_a_body_keeps_later_siblings():
+    tree = SyntaxTree(PAGE)
+    effect = tree.select('AccountsPage > useEffect')
+    fetch = tree.select('AccountsPage > fetchAccounts')
+    start = tree.text.index('fetchAccounts()')
+    tree.edit(start, start + len('fetchAccounts()'), 'void fetchAccounts()')
+
+    assert tree.select('AccountsPage > fetchAccounts') is fetch
+    assert tree.reparsed == len(tree.source(effect)) - len('  useEffect(() => {') - 1
+    assert tree.source(fetch).startswith('  const fetchAccounts = async (\n')
+
+
+def test_replace_node_swaps_the_whole_declaration():
+    replacement = '  const fetchAccounts = async () => {}'
+    updated = replace_node(PAGE, 'AccountsPage > fetchAccounts', replacement)
+    assert replacement + '\n\n  return <table>' in updated
+    assert 'cursor: string' not in updated
+
+
+def test_replace_node_checks_the_old_declaration():
+    old = SyntaxTree(PAGE).source(SyntaxTree(PAGE).select('AccountsPage > fetchAccounts'))
+    replacement = '  const fetchAccounts = async () => {}'
+    assert replace_node(PAGE, 'AccountsPage > fetchAccounts', replacement, old + '\n') == \
+        replace_node(PAGE, 'AccountsPage > fetchAccounts', replacement)
+    with pytest.raises(NodeChanged):
+        replace_node(PAGE.replace('setIsLoading(true)', 'setIsLoading(false)'),
+                     'AccountsPage > fetchAccounts', replacement, old)
+
+
+def test_document_parses_once_across_edits():
+    document = Document(PAGE)
+    document.tree.select('Row')
+    start = document.text.index('setIsLoading(true)')
+    document.apply([(start, start + len('setIsLoading(true)'), 'setIsLoading(false)')])
+    assert document.tree.select('AccountsPage > fetchAccounts')
+    assert document.parses == 1
+
+
+def test_node_patch_replaces_a_declaration_by_selector(tmp_path):
+    old_fetch = '  const fetchAccounts = async (\n    cursor: string | null = null,\n  ) => {\n    setIsLoading(true)\n  }'
+    new_fetch = '  const fetchAccounts = async () => {\n    setIsLoading(false)\n  }'
+    path = tmp_path / 'fetch.py'
+    path.write_text(
+        "from codemods.tsx import replace_node\n"
+        "with open('page.tsx', 'r', encoding='utf-8') as f:\n"
+        "    content = f.read()\n"
+        f"old_fetch = {old_fetch!r}\n"
+        f"new_fetch = {new_fetch!r}\n"
+        "content = replace_node(content, 'AccountsPage > fetchAccounts', new_fetch, old_fetch)\n"
+        "with open('page.tsx', 'w', encoding='utf-8') as f:\n"
+        "    f.write(content)\n",
+        encoding='utf-8',
+    )
+    script = load_script(path)
+    assert [(patch.kind, patch.expected) for patch in script.patches] == [('node', old_fetch)]
+
+    (tmp_path / 'page.tsx').write_text(PAGE, encoding='utf-8')
+    result = run_file(tmp_path, 'page.tsx', [script])
+    assert [p.status for p in result.patches] == [APPLIED]
+    assert new_fetch + '\n\n  return <table>' in result.content
+
+    (tmp_path / 'page.tsx').write_text(result.content, encoding='utf-8')
+    rerun = run_file(tmp_path, 'page.tsx', [script])
+    assert [p.status for p in rerun.patches] == [ALREADY_APPLIED]
+    assert not rerun.changed
+
+    # A declaration edited since the patch was written is left alone
+    (tmp_path / 'page.tsx').write_text(PAGE.replace('setIsLoading(true)', 'setIsLoading(null)'), encoding='utf-8')
+    with pytest.raises(AnchorNotFound):
+        run_file(tmp_path, 'page.tsx', [script])
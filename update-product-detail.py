@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
-import re
+from codemods.structural import replace_structural
 
 # Read the file
 with open('apps/web/src/app/(dashboard)/products/[id]/page.tsx', 'r', encoding='utf-8') as f:
     content = f.read()
 
 # Replace the Recent Transactions section with Usage Statistics + Updated Recent Transactions
-old_section = r'''          {/\* Recent Transactions \*/}
+old_section = '''          {/* Recent Transactions */}
           <Card className="lg:col-span-3">
             <CardHeader>
               <CardTitle>Recent Transactions</CardTitle>
@@ -40,36 +40,36 @@ old_section = r'''          {/\* Recent Transactions \*/}
                     </tr>
                   </thead>
                   <tbody className="bg-white divide-y divide-gray-200">
-                    \{transactions\.slice\(0, 5\)\.map\(\(txn\) => \(
-                      <tr key=\{txn\.id\} className="hover:bg-gray-50">
+                    {transactions.slice(0, 5).map((txn) => (
+                      <tr key={txn.id} className="hover:bg-gray-50">
                         <td className="px-6 py-4 whitespace-nowrap">
                           <Link
-                            href=\{`/orders/\$\{txn\.id\}`\}
+                            href={`/orders/${txn.id}`}
                             className="text-sm font-medium text-blue-600 hover:text-blue-800 hover:underline"
                           >
-                            \{txn\.orderNo\}
+                            {txn.orderNo}
                           </Link>
                         </td>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                          \{new Date\(txn\.date\)\.toLocaleDateString\(\)\}
+                          {new Date(txn.date).toLocaleDateString()}
                         </td>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                          \{txn\.seller\}
+                          {txn.seller}
                         </td>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                          \{txn\.buyer\}
+                          {txn.buyer}
                         </td>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                          \{txn\.quantity\.toLocaleString\(\)\} \{txn\.unit\}
+                          {txn.quantity.toLocaleString()} {txn.unit}
                         </td>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                          \$\{txn\.total\.toLocaleString\(\)\}
+                          ${txn.total.toLocaleString()}
                         </td>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900">
-                          \{txn\.agent\}
+                          {txn.agent}
                         </td>
                       </tr>
-                    \)\)\}
+                    ))}
                   </tbody>
                 </table>
               </div>
@@ -201,7 +201,7 @@ new_section = '''          {/* Usage Statistics */}
             </CardContent>
           </Card>'''
 
-content = re.sub(old_section, new_section, content, flags=re.DOTALL)
+content = replace_structural(content, old_section, new_section)
 
 # Write back
 with open('apps/web/src/app/(dashboard)/products/[id]/page.tsx', 'w', encoding='utf-8') as f: